@@ -0,0 +1,285 @@
+# algorithms/bursts.py
+"""
+Scheduling of CPU/I-O burst sequences.
+
+A process may carry a burst sequence as a fourth workload field:
+
+    {pid: [arrival, cpu_total, priority, [4.0, ("disk", 2.0), 1.5, ("net", 3.0), 2.0]]}
+
+Numbers are CPU bursts and (device, time) pairs are I/O requests. After a
+CPU burst the process blocks on the device; every device serves its
+requests one at a time in FCFS order, so the CPU keeps running other
+processes while I/O is in progress. Arrivals and I/O completions (wake-ups)
+are events in one heap ordered by time; whenever the CPU clock passes an
+event, the process it concerns becomes ready again (or, after its last
+burst, completes).
+
+The CPU policy is one of the six algorithms, applied to the current CPU
+burst: SJF and SRTN compare what is left of it, MLFQ keeps a process on
+its level across I/O (only using up a quantum demotes it).
+"""
+import heapq
+import math
+from collections import deque
+
+from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
+
+
+def burst_sequence(values):
+    """
+    Normalized burst sequence of a workload entry: a list of CPU times
+    (floats) and (device, time) I/O pairs. An entry without one is a single
+    CPU burst of its burst time.
+    """
+    if len(values) < 4 or not values[3]:
+        return [float(values[1])]
+    sequence = []
+    for item in values[3]:
+        if isinstance(item, (tuple, list)):
+            device, duration = item
+            sequence.append((str(device), float(duration)))
+        else:
+            sequence.append(float(item))
+    return sequence
+
+
+def has_io(data):
+    """True when any process of the workload has a burst sequence."""
+    return any(len(values) > 3 and isinstance(values[3], (list, tuple)) and values[3] for values in data.values())
+
+
+class _ReadyQueue:
+    """
+    Ready queue of one CPU policy: push(pid), pop() -> (pid, slice limit, level).
+
+    Ties follow the batch algorithms: HPF by (arrival, pid) like hpf, SJF and
+    SRTN by pid. MLFQ uses algorithms.mlfq.LevelQueues with the level
+    policies; a process keeps its level across I/O.
+    """
+
+    def __init__(self, algorithm, quantum, remaining, burst, arrival, priority, levels, quanta_list,
+                 aging_threshold, policies=None):
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.remaining = remaining
+        self.arrival = arrival
+        self.priority = priority
+        self.levels = levels
+        self.quanta = quanta_list
+        self.aging_threshold = aging_threshold
+        if algorithm == "MLFQ":
+            from algorithms.mlfq import LevelQueues, level_policies
+
+            self.level = {}
+            self.last_active = {}
+            self.queues = LevelQueues(level_policies(policies, levels), remaining, burst, self.last_active)
+        elif algorithm in ("FCFS", "RR"):
+            self.fifo = deque()
+        else:
+            self.heap = []
+
+    def __len__(self):
+        if self.algorithm == "MLFQ":
+            return len(self.queues)
+        if self.algorithm in ("FCFS", "RR"):
+            return len(self.fifo)
+        return len(self.heap)
+
+    def sizes(self):
+        """Ready processes per MLFQ level (None for the other policies)."""
+        return self.queues.counts if self.algorithm == "MLFQ" else None
+
+    def push(self, pid, t, demote=False):
+        """Make `pid` ready at time t; `demote` after it used up an MLFQ quantum."""
+        if self.algorithm == "MLFQ":
+            level = self.level.setdefault(pid, 0)
+            if demote:
+                level = self.level[pid] = min(self.levels - 1, level + 1)
+            self.last_active[pid] = t
+            self.queues.push(pid, level)
+        elif self.algorithm in ("FCFS", "RR"):
+            self.fifo.append(pid)
+        else:
+            if self.algorithm == "HPF":
+                key = (-self.priority[pid], self.arrival[pid], int(pid))
+            else:
+                key = (self.remaining[pid], int(pid))
+            heapq.heappush(self.heap, (key, pid))
+
+    def pop(self, t):
+        if self.algorithm == "MLFQ":
+            queues = self.queues
+            if queues.nonempty & ~1:
+                for level, promoted in queues.age(t, self.aging_threshold):
+                    for pid in promoted:
+                        self.level[pid] = level
+            pid, level = queues.pop()
+            return pid, self.quanta[level], level
+        if self.algorithm == "FCFS":
+            return self.fifo.popleft(), math.inf, None
+        if self.algorithm == "RR":
+            return self.fifo.popleft(), self.quantum, None
+        pid = heapq.heappop(self.heap)[1]
+        return pid, self.quantum if self.algorithm == "SRTN" else math.inf, None
+
+
+def burst_schedule(data, algorithm="FCFS", quantum=1.0, context_switch=0.0, levels=3, quanta_list=None,
+                   aging_threshold=10.0, coalesce=True, timeline=True, telemetry=None, policies=None):
+    """
+    Simulates CPU scheduling of processes that alternate CPU bursts and I/O.
+
+    Each device has its own FCFS queue; a process blocked on a busy device
+    waits there (io_wait) until the device is free. A context switch follows
+    a CPU slice whenever another process is ready to take over.
+
+    Args:
+        data (dict): {pid: [arrival, burst, priority, sequence]}; see burst_sequence().
+                     Processes without a sequence run one CPU burst.
+        algorithm (str): CPU policy: "FCFS", "SJF", "HPF", "RR", "SRTN" or "MLFQ".
+        quantum (float): Time slice for RR and SRTN.
+        context_switch (float): Context switch time.
+        levels (int): MLFQ levels.
+        quanta_list (list[float], optional): MLFQ quantum per level; defaults to doubling from 1.
+        aging_threshold (float): Time after which a waiting MLFQ process is promoted one level.
+        coalesce (bool, optional): Merge adjacent segments. Defaults to True.
+        timeline (bool, optional): Record the timeline; False returns a NullTimeline. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector. Defaults to None.
+        policies (list[str], optional): MLFQ policy per level (see algorithms.mlfq);
+                                        defaults to RR, SRTN, then FCFS. SJF levels compare
+                                        the length of the current CPU burst.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (Timeline): CPU segments as for the other algorithms, with the
+              device segments {"start", "duration", "pid", "device"} in
+              timeline.io_segments and the busy time per device in timeline.io_totals.
+            - stats (dict): Per-process statistics; "burst" is the total CPU time,
+              "io" the total I/O time, "io_wait" the time spent queued for a device
+              and "waiting" the time spent in the ready queue.
+    """
+    algorithm = algorithm.upper()
+    if algorithm not in ("FCFS", "SJF", "HPF", "RR", "SRTN", "MLFQ"):
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if quanta_list is None:
+        quanta_list = [1 * (2 ** i) for i in range(levels)]
+    quanta_list = list(quanta_list)
+    while len(quanta_list) < levels:
+        quanta_list.append(quanta_list[-1] * 2)
+
+    timeline, stats = new_timeline(timeline, coalesce, telemetry), {}
+    if not data:
+        return timeline, stats
+
+    sequences = {pid: burst_sequence(values) for pid, values in data.items()}
+    arrival = {pid: float(values[0]) for pid, values in data.items()}
+    priority = {pid: values[2] if len(values) > 2 else 0 for pid, values in data.items()}
+    cpu_total = {pid: sum(item for item in seq if not isinstance(item, tuple)) for pid, seq in sequences.items()}
+    position = dict.fromkeys(data, 0)
+    remaining = {}
+    cpu_burst = {}
+    io_time = dict.fromkeys(data, 0.0)
+    io_wait = dict.fromkeys(data, 0.0)
+    first_run = {}
+    ready = _ReadyQueue(algorithm, quantum, remaining, cpu_burst, arrival, priority, levels, quanta_list,
+                        aging_threshold, policies)
+
+    # Event heap: (time, sequence number, pid, device); device None marks an arrival
+    events = []
+    counter = 0
+    for pid in sorted(data, key=lambda p: (arrival[p], int(p))):
+        events.append((arrival[pid], counter, pid, None))
+        counter += 1
+    heapq.heapify(events)
+    if telemetry is not None:
+        telemetry.expect(sorted(arrival.values()))
+    device_busy = {}
+    device_queue = {}
+
+    def start_io(pid, device, duration, t, requested):
+        nonlocal counter
+        device_busy[device] = True
+        io_wait[pid] += t - requested
+        io_time[pid] += duration
+        timeline.emit_io(t, duration, pid, device)
+        heapq.heappush(events, (t + duration, counter, pid, device))
+        if telemetry is not None:
+            # Back in the ready queue when the request is served (left again at once if no CPU burst follows)
+            telemetry.arrive(t + duration)
+        counter += 1
+
+    def advance(pid, t):
+        """Move `pid` past its finished burst at time t: ready, blocked on a device, or done."""
+        seq = sequences[pid]
+        k = position[pid]
+        if k == len(seq):
+            stats[pid] = make_stats_entry(data, pid, arrival[pid], cpu_total[pid], t, first_run.get(pid, t))
+            stats[pid]["io"] = io_time[pid]
+            stats[pid]["io_wait"] = io_wait[pid]
+            stats[pid]["waiting"] -= io_time[pid] + io_wait[pid]
+            if telemetry is not None:
+                telemetry.complete(t)
+            return
+        item = seq[k]
+        position[pid] = k + 1
+        if isinstance(item, tuple):
+            device, duration = item
+            if telemetry is not None:
+                telemetry.leave(t)
+            if device_busy.get(device):
+                device_queue.setdefault(device, deque()).append((pid, duration, t))
+            else:
+                start_io(pid, device, duration, t, t)
+        else:
+            remaining[pid] = cpu_burst[pid] = item
+            ready.push(pid, t)
+
+    def handle_events(t):
+        """Process every arrival and I/O completion up to time t."""
+        while events and events[0][0] <= t:
+            when, _, pid, device = heapq.heappop(events)
+            if device is not None:
+                device_busy[device] = False
+                waiting = device_queue.get(device)
+                if waiting:
+                    next_pid, duration, requested = waiting.popleft()
+                    start_io(next_pid, device, duration, when, requested)
+            advance(pid, when)
+
+    current_time = events[0][0]
+    while True:
+        handle_events(current_time)
+        if not len(ready):
+            if not events:
+                break
+            next_event = events[0][0]
+            timeline.emit(current_time, next_event - current_time, None, "idle")
+            current_time = next_event
+            continue
+
+        pid, limit, level = ready.pop(current_time)
+        exec_time = min(remaining[pid], limit)
+        if telemetry is not None and ready.sizes() is not None:
+            telemetry.queue_levels(current_time, ready.sizes())
+        first_run.setdefault(pid, current_time)
+        # Events during the slice are handled before it is emitted, so that the telemetry
+        # gets their times ahead of the segment instead of after it
+        handle_events(current_time + exec_time)
+        timeline.emit(current_time, exec_time, pid, "proc", level)
+        current_time += exec_time
+        remaining[pid] -= exec_time
+
+        if remaining[pid] <= 1e-9:
+            advance(pid, current_time)
+        else:
+            ready.push(pid, current_time, demote=algorithm == "MLFQ")
+        if telemetry is not None and ready.sizes() is not None:
+            telemetry.queue_levels(current_time, ready.sizes())
+
+        if context_switch and len(ready):
+            timeline.emit(current_time, context_switch, None, "cs")
+            current_time += context_switch
+
+    if telemetry is not None:
+        telemetry.finish(current_time)
+    return timeline, stats
@@ -0,0 +1,186 @@
+# algorithms/fair_share.py
+"""
+Hierarchical fair-share scheduling.
+
+Processes belong to groups (users, teams, cgroups). The CPU is shared
+between the groups that have ready processes in proportion to their
+weights, and each group picks its own process with a child policy (RR,
+SRTN or FCFS).
+
+Every group has a virtual time that advances by run time / weight while
+it runs; the active group with the lowest virtual time runs next, for at
+most one quantum. Active groups sit in a heap ordered by virtual time, so
+a dispatch costs O(log groups). A group that becomes active again starts
+no lower than the smallest virtual time in the heap, so it cannot bank
+credit while idle.
+
+The entitled share of a group is what weighted fair sharing owes it: each
+slice of CPU time is divided among the groups active at that moment in
+proportion to their weights. It is accumulated per unit of weight, so it
+also costs O(1) per slice.
+"""
+import heapq
+from collections import deque
+
+from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
+
+# Child policies a group can use
+CHILD_POLICIES = ("RR", "SRTN", "FCFS")
+
+
+def fair_share(data, groups=None, weights=None, policies="RR", quantum=1.0, context_switch=0.0, coalesce=True,
+               timeline=True, telemetry=None):
+    """
+    Simulates hierarchical fair-share scheduling (preemptive at quantum boundaries).
+
+    Args:
+        data (dict): Process dictionary in the format {pid: (arrival_time, burst_time, priority)}.
+        groups (dict, optional): {pid: group}. Processes not listed are grouped by their
+                                 priority; without `groups`, every priority is a group.
+        weights (dict, optional): {group: weight}; groups not listed get weight 1.
+        policies (str|dict, optional): Child policy of every group ("RR", "SRTN" or "FCFS"),
+                                       or {group: policy} with RR for groups not listed.
+                                       Defaults to "RR".
+        quantum (float, optional): Longest slice a group runs before the next group choice. Defaults to 1.0.
+        context_switch (float, optional): Context switch time. Defaults to 0.0.
+        coalesce (bool, optional): Merge adjacent segments. Defaults to True.
+        timeline (bool, optional): Record the timeline; False returns a NullTimeline. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector. Defaults to None.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (Timeline): Segments as for the other algorithms, with
+              timeline.group_shares = {group: {"weight", "received", "entitled"}}
+              (CPU time received and owed by fair sharing).
+            - stats (dict): Per-process statistics with the process' "group".
+    """
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+    timeline, stats = new_timeline(timeline, coalesce, telemetry), {}
+    timeline.group_shares = {}
+    if not sorted_data:
+        return timeline, stats
+
+    groups = groups or {}
+    weights = weights or {}
+    group_of = {pid: groups.get(pid, values[2] if len(values) > 2 else 0) for pid, values in sorted_data}
+    rank, weight, policy = {}, {}, {}
+    for pid, _ in sorted_data:
+        g = group_of[pid]
+        if g not in rank:
+            rank[g] = len(rank)
+            weight[g] = float(weights.get(g, 1.0))
+            if weight[g] <= 0:
+                raise ValueError(f"weight of group {g} must be positive")
+            policy[g] = (policies if isinstance(policies, str) else policies.get(g, "RR")).upper()
+            if policy[g] not in CHILD_POLICIES:
+                raise ValueError(f"Unknown child policy for group {g}: {policy[g]}")
+
+    remaining = {pid: float(values[1]) for pid, values in sorted_data}
+    arrival_map = {pid: float(values[0]) for pid, values in sorted_data}
+    first_run = {}
+    child = {g: [] if policy[g] == "SRTN" else deque() for g in rank}
+    counter = 0
+
+    vtime = dict.fromkeys(rank, 0.0)
+    received = dict.fromkeys(rank, 0.0)
+    entitled = dict.fromkeys(rank, 0.0)
+    # Entitlement per unit of weight handed out so far, and its value when each group became active
+    per_weight = 0.0
+    joined = {}
+    active = set()
+    active_weight = 0.0
+    heap = []
+    last_vtime = 0.0
+    ready = 0
+
+    def enqueue(pid, g):
+        nonlocal counter
+        if policy[g] == "SRTN":
+            heapq.heappush(child[g], (remaining[pid], int(pid), counter, pid))
+            counter += 1
+        else:
+            child[g].append(pid)
+
+    def activate(g):
+        nonlocal active_weight
+        floor = min(heap[0][0], last_vtime) if heap else last_vtime
+        vtime[g] = max(vtime[g], floor)
+        heapq.heappush(heap, (vtime[g], rank[g], g))
+        active.add(g)
+        active_weight += weight[g]
+        joined[g] = per_weight
+
+    i, n = 0, len(sorted_data)
+    if telemetry is not None:
+        telemetry.expect([float(values[0]) for _, values in sorted_data])
+
+    def admit(t):
+        nonlocal i, ready
+        while i < n and sorted_data[i][1][0] <= t:
+            pid = sorted_data[i][0]
+            g = group_of[pid]
+            enqueue(pid, g)
+            ready += 1
+            if g not in active:
+                activate(g)
+            i += 1
+
+    current_time = sorted_data[0][1][0]
+    while i < n or ready:
+        admit(current_time)
+        if not ready:
+            next_arr = sorted_data[i][1][0]
+            timeline.emit(current_time, next_arr - current_time, None, "idle")
+            current_time = next_arr
+            continue
+
+        vt, _, g = heapq.heappop(heap)
+        if policy[g] == "SRTN":
+            pid = heapq.heappop(child[g])[3]
+        else:
+            pid = child[g].popleft()
+        ready -= 1
+        exec_time = min(remaining[pid], quantum)
+        if pid not in first_run:
+            first_run[pid] = current_time
+        timeline.emit(current_time, exec_time, pid, "proc")
+        current_time += exec_time
+        remaining[pid] -= exec_time
+        received[g] += exec_time
+        per_weight += exec_time / active_weight
+        vtime[g] = last_vtime = vt + exec_time / weight[g]
+
+        # Arrivals during the slice queue up before the preempted process
+        admit(current_time)
+        if remaining[pid] <= 1e-12:
+            stats[pid] = make_stats_entry(data, pid, arrival_map[pid], float(data[pid][1]), current_time,
+                                          first_run[pid])
+            stats[pid]["group"] = g
+            if telemetry is not None:
+                telemetry.complete(current_time)
+        elif policy[g] == "FCFS":
+            child[g].appendleft(pid)
+            ready += 1
+        else:
+            enqueue(pid, g)
+            ready += 1
+
+        if child[g]:
+            heapq.heappush(heap, (vtime[g], rank[g], g))
+        else:
+            active.discard(g)
+            active_weight -= weight[g]
+            entitled[g] += weight[g] * (per_weight - joined.pop(g))
+
+        if context_switch and ready:
+            timeline.emit(current_time, context_switch, None, "cs")
+            current_time += context_switch
+
+    # Reported in group order: numeric groups (priorities) ascending, then named ones
+    order = sorted(rank, key=lambda g: (0, g, "") if isinstance(g, (int, float)) else (1, 0, str(g)))
+    timeline.group_shares = {g: {"weight": weight[g], "received": received[g], "entitled": entitled[g]}
+                             for g in order}
+    if telemetry is not None:
+        telemetry.finish(current_time)
+    return timeline, stats
@@ -1,8 +1,9 @@
 # algorithms/fcfs.py
 
 from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
 
-def fcfs(data, context_switch=0.0):
+def fcfs(data, context_switch=0.0, coalesce=True, timeline=True, telemetry=None):
     """
     First-Come, First-Served (FCFS) scheduling algorithm.
 
@@ -13,6 +14,14 @@ def fcfs(data, context_switch=0.0):
     Args:
         data (dict): Mapping of process ID -> [arrival(float), burst(float), priority(int)]
         context_switch (float, optional): Time taken for context switching between processes. Defaults to 0.0.
+        coalesce (bool, optional): Merge adjacent segments of the same process. FCFS runs
+                                   every process in a single segment, so this leaves its
+                                   timeline unchanged; kept for the common interface. Defaults to True.
+        timeline (bool, optional): With False the segments are not stored; a NullTimeline
+                                   with the segment count and the busy/idle/cs totals is
+                                   returned, for stats-only runs. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector, given the arrival times up
+                                         front, then each process's run and completion. Defaults to None.
 
     Returns:
         tuple:
@@ -22,14 +31,14 @@ def fcfs(data, context_switch=0.0):
                 - 'pid': process ID (None for idle or context switch)
                 - 'type': 'proc', 'idle', or 'cs'
             stats (dict): Process statistics mapping PID -> {
-                'arrival', 'burst', 'priority', 'completion', 'turnaround', 'waiting', 'norm_turnaround'
+                'arrival', 'burst', 'priority', 'completion', 'turnaround', 'waiting', 'norm_turnaround', 'response'
             }
     """
 
     # Sort processes by arrival time, breaking ties by PID
     sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
 
-    timeline = []
+    timeline = new_timeline(timeline, coalesce, telemetry)
     stats = {}
     current_time = 0.0
 
@@ -37,6 +46,9 @@ def fcfs(data, context_switch=0.0):
     if not sorted_data:
         return timeline, stats
 
+    if telemetry is not None:
+        telemetry.expect([float(v[0]) for _, v in sorted_data])
+
     for pid, (arrival, burst, _) in sorted_data:
         # Convert arrival and burst to float
         arrival = float(arrival)
@@ -44,35 +56,25 @@ def fcfs(data, context_switch=0.0):
 
         # If the CPU is idle until this process arrives
         if arrival > current_time:
-            timeline.append({
-                "start": current_time,
-                "duration": arrival - current_time,
-                "pid": None,
-                "type": "idle"
-            })
+            timeline.emit(current_time, arrival - current_time, None, "idle")
             current_time = arrival
 
         # Run the process
-        timeline.append({
-            "start": current_time,
-            "duration": burst,
-            "pid": pid,
-            "type": "proc"
-        })
+        first_run = current_time
+        timeline.emit(current_time, burst, pid, "proc")
         current_time += burst
         completion = current_time
+        if telemetry is not None:
+            telemetry.complete(completion)
 
         # Record process statistics
-        stats[pid] = make_stats_entry(data, pid, arrival, burst, completion)
+        stats[pid] = make_stats_entry(data, pid, arrival, burst, completion, first_run)
 
         # Context switch after process if specified
         if context_switch:
-            timeline.append({
-                "start": current_time,
-                "duration": context_switch,
-                "pid": None,
-                "type": "cs"
-            })
+            timeline.emit(current_time, context_switch, None, "cs")
             current_time += context_switch
 
+    if telemetry is not None:
+        telemetry.finish(current_time)
     return timeline, stats
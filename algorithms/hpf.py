@@ -1,8 +1,9 @@
 # algorithm/hpf.py
 
 from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
 
-def hpf(data, context_switch=0.0):
+def hpf(data, context_switch=0.0, coalesce=True, timeline=True, telemetry=None):
     """
     Non-preemptive Highest Priority First (HPF) scheduling algorithm.
     
@@ -12,6 +13,13 @@ def hpf(data, context_switch=0.0):
     Args:
         data (dict): Dictionary of processes with structure {pid: (arrival, burst, priority)}
         context_switch (float, optional): Context switch duration between processes. Defaults to 0.0.
+        coalesce (bool, optional): Merge adjacent segments of the same process. Has no effect
+                                   here: a dispatched process runs to completion in one segment.
+                                   Defaults to True.
+        timeline (bool, optional): Keep the segments. False returns a NullTimeline holding only
+                                   the segment count and per-type time totals. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector; sees the arrivals, each
+                                         process's single run and its completion. Defaults to None.
 
     Returns:
         tuple:
@@ -28,7 +36,7 @@ def hpf(data, context_switch=0.0):
     # Sort processes by arrival time, then PID
     sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
     
-    timeline = []
+    timeline = new_timeline(timeline, coalesce, telemetry)
     stats = {}
     current_time = sorted_data[0][1][0] if sorted_data else 0.0
     ready = []
@@ -39,6 +47,8 @@ def hpf(data, context_switch=0.0):
     
     i = 0
     n = len(sorted_data)
+    if telemetry is not None:
+        telemetry.expect([float(v[0]) for _, v in sorted_data])
     
     while i < n or ready:
         # Enqueue all processes that have arrived
@@ -49,12 +59,7 @@ def hpf(data, context_switch=0.0):
         if not ready:
             # CPU idle until next arrival
             next_arrival = sorted_data[i][1][0]
-            timeline.append({
-                "start": current_time,
-                "duration": next_arrival - current_time,
-                "pid": None,
-                "type": "idle"
-            })
+            timeline.emit(current_time, next_arrival - current_time, None, "idle")
             current_time = next_arrival
             continue
 
@@ -65,34 +70,24 @@ def hpf(data, context_switch=0.0):
 
         # Add idle time if process arrived after current time
         if arrival > current_time:
-            timeline.append({
-                "start": current_time,
-                "duration": arrival - current_time,
-                "pid": None,
-                "type": "idle"
-            })
+            timeline.emit(current_time, arrival - current_time, None, "idle")
             current_time = arrival
 
         # Schedule the process
-        timeline.append({
-            "start": current_time,
-            "duration": burst,
-            "pid": pid,
-            "type": "proc"
-        })
+        first_run = current_time
+        timeline.emit(current_time, burst, pid, "proc")
         current_time += burst
+        if telemetry is not None:
+            telemetry.complete(current_time)
 
         # Record stats
-        stats[pid] = make_stats_entry(data, pid, arrival, burst, current_time)
+        stats[pid] = make_stats_entry(data, pid, arrival, burst, current_time, first_run)
 
         # Context switch block
         if context_switch:
-            timeline.append({
-                "start": current_time,
-                "duration": context_switch,
-                "pid": None,
-                "type": "cs"
-            })
+            timeline.emit(current_time, context_switch, None, "cs")
             current_time += context_switch
 
+    if telemetry is not None:
+        telemetry.finish(current_time)
     return timeline, stats
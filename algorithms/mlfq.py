@@ -1,9 +1,142 @@
 # algorithms/mlfq.py
 
+import heapq
 from collections import deque
 from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
 
-def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=10.0):
+# Policies a level can use to pick its next process
+LEVEL_POLICIES = ("RR", "SRTN", "FCFS", "SJF")
+
+# Level policies when none are given: RR on top, SRTN below it, FCFS for the rest
+DEFAULT_LEVEL_POLICIES = ("RR", "SRTN")
+
+
+def level_policies(policies, levels):
+    """Policy per level: `policies` (default DEFAULT_LEVEL_POLICIES) upper-cased, cut or padded with FCFS."""
+    policies = [p.upper() for p in (policies or DEFAULT_LEVEL_POLICIES)][:levels]
+    while len(policies) < levels:
+        policies.append("FCFS")
+    for policy in policies:
+        if policy not in LEVEL_POLICIES:
+            raise ValueError(f"Unknown MLFQ level policy: {policy}")
+    return policies
+
+
+class LevelQueues:
+    """
+    Ready queues of an MLFQ, one per level, each served by its level's policy.
+
+    Used by mlfq(), the online MLFQ (algorithms.online) and the burst
+    scheduler (algorithms.bursts), so all three pick and age processes the
+    same way. Every queued process is an entry; entries leave `live` when
+    popped or promoted and are skipped wherever they are still referenced.
+    Holds plain containers only, so it pickles with a checkpoint.
+
+    Args:
+        policies (list[str]): Policy per level (see level_policies()).
+        remaining (dict): Remaining time per pid; the key of SRTN levels.
+        burst (dict): Burst time per pid; the key of SJF levels.
+        last_active (dict): Time of last activity per pid, for aging; updated on promotion.
+
+    Attributes:
+        counts (list[int]): Queued processes per level.
+        nonempty (int): Bitmap with bit L set while level L has processes.
+    """
+
+    def __init__(self, policies, remaining, burst, last_active):
+        levels = len(policies)
+        self.policies = policies
+        self.heap_level = [policy in ("SRTN", "SJF") for policy in policies]
+        self.remaining = remaining
+        self.burst = burst
+        self.last_active = last_active
+        self.order = [deque() for _ in range(levels)]   # entry ids per level, in queue order
+        self.heaps = [[] for _ in range(levels)]         # (key, entry id) for SRTN/SJF levels
+        self.live = {}                                   # entry id -> pid
+        self.counts = [0] * levels
+        self.nonempty = 0
+        self.next_entry = 0
+
+    def __len__(self):
+        return len(self.live)
+
+    def push(self, pid, lvl):
+        """Queue `pid` at the back of level `lvl`."""
+        entry = self.next_entry
+        self.next_entry += 1
+        self.live[entry] = pid
+        self.order[lvl].append(entry)
+        if self.heap_level[lvl]:
+            key = self.remaining[pid] if self.policies[lvl] == "SRTN" else self.burst[pid]
+            heapq.heappush(self.heaps[lvl], (key, entry))
+        self.counts[lvl] += 1
+        self.nonempty |= 1 << lvl
+
+    def _remove(self, entry, lvl):
+        pid = self.live.pop(entry)
+        self.counts[lvl] -= 1
+        if not self.counts[lvl]:
+            self.nonempty &= ~(1 << lvl)
+        return pid
+
+    def age(self, now, threshold):
+        """
+        Promote every process below the top level that has been inactive for
+        `threshold` one level up. Levels are in last-activity order, so the
+        processes due are a prefix of each level.
+
+        Returns:
+            list[tuple]: (level promoted to, [pids]) per level with promotions.
+        """
+        promotions = []
+        last_active, live = self.last_active, self.live
+        waiting = self.nonempty & ~1
+        while waiting:
+            lvl = (waiting & -waiting).bit_length() - 1
+            waiting &= waiting - 1
+            queue = self.order[lvl]
+            promoted = []
+            while queue:
+                entry = queue[0]
+                if entry not in live:
+                    queue.popleft()
+                    continue
+                pid = live[entry]
+                if now - last_active[pid] < threshold:
+                    break
+                queue.popleft()
+                self._remove(entry, lvl)
+                last_active[pid] = now
+                self.push(pid, lvl - 1)
+                promoted.append(pid)
+            if promoted:
+                promotions.append((lvl - 1, promoted))
+        return promotions
+
+    def pop(self):
+        """(pid, level) of the next process: the highest non-empty level (lowest set bit), by its policy."""
+        nonempty = self.nonempty
+        lvl = (nonempty & -nonempty).bit_length() - 1
+        live = self.live
+        if self.heap_level[lvl]:
+            heap = self.heaps[lvl]
+            while heap[0][1] not in live:
+                heapq.heappop(heap)
+            pid = self._remove(heapq.heappop(heap)[1], lvl)
+            # The queue order only drops entries at its front; compact it once mostly dead
+            if len(self.order[lvl]) > 2 * self.counts[lvl] + 64:
+                self.order[lvl] = deque(entry for entry in self.order[lvl] if entry in live)
+        else:
+            queue = self.order[lvl]
+            while queue[0] not in live:
+                queue.popleft()
+            pid = self._remove(queue.popleft(), lvl)
+        return pid, lvl
+
+
+def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=10.0, coalesce=True, timeline=True,
+         telemetry=None, policies=None, aging_log=None):
     """
     Simulates a realistic Multi-Level Feedback Queue (MLFQ) CPU scheduling algorithm.
 
@@ -22,6 +155,19 @@ def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=1
         - Level 0 → Round Robin (small quantum, preemptive) - favors interactive tasks.
         - Level 1 → Shortest Remaining Time Next (SRTN) - favors medium-length CPU-bound tasks.
         - Level 2 or above → First Come First Serve (FCFS) - for long background or batch jobs.
+        The policy of each level can be chosen with `policies` ("RR", "SRTN", "FCFS" or
+        "SJF"). It decides which ready process of the level runs next; every level still
+        preempts at its quantum, so RR and FCFS both take the longest-waiting process,
+        SRTN the one with the least remaining time and SJF the one with the shortest burst.
+
+    Data structures (LevelQueues):
+        - A bitmap of non-empty levels gives the highest ready level in O(1), like the
+          Linux O(1) scheduler.
+        - SRTN and SJF levels keep a heap keyed by remaining time / burst (ties in queue
+          order), so a dispatch is O(log n) instead of a scan and a deque.remove.
+        - Every level also keeps its processes in queue order, which is the order of
+          their last activity, so aging only looks at the front of each level.
+          Processes leaving a level out of order are dropped lazily.
 
     Args:
         data (dict): Dictionary of processes in the form:
@@ -34,6 +180,19 @@ def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=1
         context_switch (float, optional): Context switch time between processes. Default is 0.0.
         aging_threshold (float, optional): Time threshold after which waiting processes
                                            are promoted one level up. Default is 10.0.
+        coalesce (bool, optional): Merge consecutive slices of a process on the same level.
+                                   A slice that uses up its quantum demotes the process, so
+                                   this mostly joins slices on the lowest level (or of a
+                                   single-level MLFQ) run without a context switch in between.
+                                   False keeps every slice. Defaults to True.
+        timeline (bool, optional): False stores no segments; the NullTimeline returned keeps
+                                   the segment count and per-type totals. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector fed with every slice, arrival
+                                         and completion, and with the level sizes around each
+                                         dispatch for its per-level queue series. Defaults to None.
+        policies (list[str], optional): Policy per level; defaults to RR, SRTN, then FCFS.
+        aging_log (file, optional): Text stream the processes promoted by aging are reported on
+                                    (e.g. sys.stderr). Defaults to None: nothing is reported.
 
     Returns:
         tuple: (timeline, stats)
@@ -56,76 +215,64 @@ def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=1
     while len(quanta_list) < levels:
         quanta_list.append(quanta_list[-1] * 2)
 
+    policies = level_policies(policies, levels)
+
     # Sort input data: (arrival_time, burst_time, priority)
     sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
-    timeline, stats = [], {}
+    timeline, stats = new_timeline(timeline, coalesce, telemetry), {}
     if not sorted_data:
         return timeline, stats
 
     remaining = {pid: float(burst) for pid, (_, burst, _) in sorted_data}
+    burst = dict(remaining)
     arrival = {pid: float(arr) for pid, (arr, _, _) in sorted_data}
     last_active = {pid: arrival[pid] for pid in remaining}
+    first_run = {}
+
+    queues = LevelQueues(policies, remaining, burst, last_active)
+    enqueue, counts = queues.push, queues.counts
+
+    if telemetry is not None:
+        telemetry.expect([float(v[0]) for _, v in sorted_data])
 
-    queues = [deque() for _ in range(levels)]
     current_time = sorted_data[0][1][0]
     i, n = 0, len(sorted_data)
 
     # Enqueue initial arrivals
     while i < n and sorted_data[i][1][0] <= current_time:
-        queues[0].append(sorted_data[i][0])
+        enqueue(sorted_data[i][0], 0)
         i += 1
 
-    while any(queues) or i < n:
+    while queues.nonempty or i < n:
         # Add new arrivals
         while i < n and sorted_data[i][1][0] <= current_time:
-            queues[0].append(sorted_data[i][0])
             last_active[sorted_data[i][0]] = current_time
+            enqueue(sorted_data[i][0], 0)
             i += 1
 
         # Apply aging: promote if waiting too long
-        for lvl in range(1, levels):
-            promoted = []
-            for pid in list(queues[lvl]):
-                if current_time - last_active[pid] >= aging_threshold:
-                    queues[lvl].remove(pid)
-                    queues[lvl - 1].append(pid)
-                    promoted.append(pid)
-                    last_active[pid] = current_time
-            if promoted:
-                print(f"Aged up: {promoted}")
+        if queues.nonempty & ~1:
+            for _, promoted in queues.age(current_time, aging_threshold):
+                if aging_log is not None:
+                    print(f"Aged up: {promoted}", file=aging_log)
 
-        # Find first non-empty queue
-        cur_level = next((L for L in range(levels) if queues[L]), None)
-        if cur_level is None:
+        if not queues.nonempty:
             if i < n:
                 next_arr = sorted_data[i][1][0]
-                timeline.append({"start": current_time, 
-                                 "duration": next_arr - current_time, 
-                                 "pid": None, 
-                                 "type": "idle"})
+                timeline.emit(current_time, next_arr - current_time, None, "idle")
                 current_time = next_arr
                 continue
             break
-
-        # Choose process based on queue algorithm
-        if cur_level == 0:
-            # Round Robin
-            pid = queues[cur_level].popleft()
-        elif cur_level == 1:
-            # Shortest Remaining Time Next (SRTN)
-            pid = min(queues[cur_level], key=lambda p: remaining[p])
-            queues[cur_level].remove(pid)
-        else:
-            # FCFS
-            pid = queues[cur_level].popleft()
+        # Highest non-empty level, process chosen by the level's policy
+        pid, cur_level = queues.pop()
 
         quantum = quanta_list[cur_level]
         exec_time = min(remaining[pid], quantum)
-        timeline.append({"start": current_time, 
-                         "duration": exec_time, 
-                         "pid": pid, 
-                         "type": "proc", 
-                         "level": cur_level})
+        if telemetry is not None:
+            telemetry.queue_levels(current_time, counts)
+        if pid not in first_run:
+            first_run[pid] = current_time
+        timeline.emit(current_time, exec_time, pid, "proc", cur_level)
         current_time += exec_time
         remaining[pid] -= exec_time
 
@@ -134,23 +281,26 @@ def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=1
 
         # New arrivals during execution
         while i < n and sorted_data[i][1][0] <= current_time:
-            queues[0].append(sorted_data[i][0])
             last_active[sorted_data[i][0]] = current_time
+            enqueue(sorted_data[i][0], 0)
             i += 1
 
         # Process completion or demotion
         if remaining[pid] <= 1e-9:
-            stats[pid] = make_stats_entry(data, pid, arrival[pid], float(data[pid][1]), current_time)
+            stats[pid] = make_stats_entry(data, pid, arrival[pid], float(data[pid][1]), current_time, first_run[pid])
+            if telemetry is not None:
+                telemetry.complete(current_time)
         else:
             new_level = min(levels - 1, cur_level + 1)
-            queues[new_level].append(pid)
+            enqueue(pid, new_level)
+        if telemetry is not None:
+            telemetry.queue_levels(current_time, counts)
 
         # Context switch
-        if context_switch and any(queues):
-            timeline.append({"start": current_time, 
-                             "duration": context_switch, 
-                             "pid": None, 
-                             "type": "cs"})
+        if context_switch and queues.nonempty:
+            timeline.emit(current_time, context_switch, None, "cs")
             current_time += context_switch
 
+    if telemetry is not None:
+        telemetry.finish(current_time)
     return timeline, stats
@@ -0,0 +1,651 @@
+# algorithms/online.py
+
+"""
+Online mode: the six algorithms driven by an unbounded arrival stream.
+
+The batch functions need the whole workload up front and sort it. Here
+arrivals are pulled lazily from an iterable that yields them in time order
+(a generator, a pipe, a file being tailed), completed processes are
+retired from every internal dict and their stats entries are handed to a
+callback, and finished timeline segments go to another callback. Memory is
+proportional to the processes in flight, not to the processes seen.
+
+Each algorithm is a class holding the state its batch loop keeps in local
+variables; step() performs one iteration of that loop. Between steps an
+algorithm can be pickled (utils.checkpoint) and later continued with
+attach(). The iterations, tie-breaking and float operations are the same
+as in the batch functions, so on the same workload (streamed in
+(arrival, pid) order) the stats and segments are identical. MLFQ uses the
+batch loop's own level queues (algorithms.mlfq.LevelQueues), level policies
+included. Differences: MLFQ has no aging log, and SJF/HPF keep their ready
+set in a heap instead of re-sorting a list.
+"""
+
+import heapq
+import math
+from collections import deque
+
+from utils.make_stats_entry import make_stats_entry
+from utils.timeline import NullTimeline, StreamTimeline
+
+
+class ArrivalStream:
+    """
+    One-record lookahead over an arrival iterable.
+
+    Records are (arrival, burst, priority) tuples, which get pids "1", "2",
+    ... in stream order (as load_trace numbers trace jobs), or
+    (pid, arrival, burst, priority) tuples with numeric pids. Arrivals must
+    not decrease; equal arrivals are served in stream order, so to match a
+    batch run they should come in pid order.
+
+    Records can also be read further ahead for announce(), which hands a
+    telemetry collector each arrival time once the run reaches it.
+
+    Attributes:
+        consumed (int): Records popped so far.
+        announced (int): Records whose arrival was announced so far.
+    """
+
+    def __init__(self, records, first_pid=1, announced=0):
+        self.records = iter(records)
+        self.first_pid = first_pid
+        self.next_pid = first_pid
+        self.last_arrival = -math.inf
+        self.consumed = 0
+        self.read = 0
+        self.announced = announced
+        self.ahead = deque()        # records read beyond the head
+        self.unannounced = deque()  # arrival times of records read but not announced
+        self.head = None
+        self._advance()
+
+    def _read(self):
+        record = next(self.records, None)
+        if record is None:
+            return None
+        if len(record) == 4:
+            pid, arrival, burst, priority = record
+        else:
+            (arrival, burst, priority), pid = record, self.next_pid
+        self.next_pid += 1
+        if arrival < self.last_arrival:
+            raise ValueError(f"Arrival stream out of order: {arrival} after {self.last_arrival}")
+        self.last_arrival = arrival
+        self.read += 1
+        if self.read > self.announced:
+            self.unannounced.append(arrival)
+        return (str(pid), arrival, burst, priority)
+
+    def _advance(self):
+        self.head = self.ahead.popleft() if self.ahead else self._read()
+
+    def __bool__(self):
+        return self.head is not None
+
+    def peek(self):
+        """Arrival time of the next record, or inf when the stream is exhausted."""
+        return self.head[1] if self.head is not None else math.inf
+
+    def pop(self):
+        """Next record as (pid, arrival, burst, priority)."""
+        record = self.head
+        self.consumed += 1
+        self._advance()
+        return record
+
+    def announce(self, t):
+        """Arrival times up to t not announced before, reading ahead as far as needed."""
+        unannounced = self.unannounced
+        while not unannounced or unannounced[-1] <= t:
+            record = self._read()
+            if record is None:
+                break
+            self.ahead.append(record)
+        times = []
+        while unannounced and unannounced[0] <= t:
+            times.append(unannounced.popleft())
+        self.announced += len(times)
+        return times
+
+    def cursor(self):
+        """Position in the stream, for resume()."""
+        return {"consumed": self.consumed, "first_pid": self.first_pid, "announced": self.announced}
+
+    @classmethod
+    def resume(cls, records, cursor):
+        """Stream over the same records, skipping the ones consumed before `cursor` was taken."""
+        stream = cls(records, cursor["first_pid"], cursor.get("announced", 0))
+        while stream.consumed < cursor["consumed"]:
+            if not stream:
+                raise ValueError("Arrival stream is shorter than the checkpoint's position in it")
+            stream.pop()
+        return stream
+
+
+def workload_records(data):
+    """A workload dict as a stream in batch order: (pid, arrival, burst, priority) by (arrival, pid)."""
+    for pid, values in sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0]))):
+        yield pid, values[0], values[1], values[2] if len(values) > 2 else 0
+
+
+class OnlineAlgorithm:
+    """
+    Shared state and driver of the online algorithms.
+
+    Args:
+        records (iterable | ArrivalStream): Arrivals in time order (see ArrivalStream).
+        context_switch (float): Context switch time.
+        coalesce (bool): Merge adjacent segments before handing them over.
+        on_complete (callable, optional): on_complete(pid, stats_entry) per finished process.
+        on_segment (callable, optional): on_segment(seg) per final timeline segment;
+                                         without it only segment counts and totals are kept.
+        telemetry (Telemetry, optional): utils.telemetry collector.
+
+    Attributes:
+        current_time (float): Simulation clock (None before the first step).
+        completed (int): Processes finished so far.
+        timeline (Timeline): StreamTimeline or NullTimeline with running totals and raw_count.
+        finished (bool): True once the stream is exhausted and every process has completed.
+    """
+
+    def __init__(self, records, context_switch=0.0, coalesce=True, on_complete=None, on_segment=None,
+                 telemetry=None):
+        self.stream = records if isinstance(records, ArrivalStream) else ArrivalStream(records)
+        self.context_switch = context_switch
+        self.on_complete = on_complete
+        self.timeline = StreamTimeline(on_segment, coalesce) if on_segment else NullTimeline()
+        self.timeline.telemetry = telemetry
+        self.telemetry = telemetry
+        if telemetry is not None:
+            telemetry.track(self.stream)
+        self.current_time = None
+        self.completed = 0
+        self.finished = False
+        self.closed = False
+
+    def __getstate__(self):
+        # Pickled for checkpoints: the stream is saved as its cursor and callbacks are dropped
+        state = self.__dict__.copy()
+        state["stream"] = self.stream.cursor() if isinstance(self.stream, ArrivalStream) else self.stream
+        state["on_complete"] = None
+        return state
+
+    def attach(self, records, on_complete=None, on_segment=None):
+        """
+        Reconnect an algorithm restored from a checkpoint to its input and
+        callbacks. `records` must yield the same records as the original
+        input; the ones already consumed are skipped.
+        """
+        self.stream = ArrivalStream.resume(records, self.stream)
+        self.on_complete = on_complete
+        if self.telemetry is not None:
+            self.telemetry.track(self.stream)
+        if isinstance(self.timeline, StreamTimeline):
+            self.timeline.on_segment = on_segment
+        return self
+
+    def _complete(self, pid, arrival, burst, priority, completion, first_run):
+        entry = make_stats_entry({pid: (arrival, burst, priority)}, pid, arrival, burst, completion, first_run)
+        self.completed += 1
+        if self.telemetry is not None:
+            self.telemetry.complete(completion)
+        if self.on_complete:
+            self.on_complete(pid, entry)
+
+    def step(self):
+        """One iteration of the algorithm's scheduling loop."""
+        raise NotImplementedError
+
+    def in_flight(self):
+        """Processes admitted but not completed."""
+        raise NotImplementedError
+
+    def run(self, max_steps=None):
+        """
+        Step until the stream is exhausted and drained, or for at most
+        `max_steps` steps. Can be called again to continue.
+
+        Returns:
+            bool: True when the run has finished.
+        """
+        steps = 0
+        step = self.step
+        while not self.finished and (max_steps is None or steps < max_steps):
+            step()
+            steps += 1
+        if self.finished:
+            self.close()
+        return self.finished
+
+    def close(self):
+        """Hand over the held-back segment and close the telemetry (once)."""
+        if self.closed:
+            return
+        self.closed = True
+        if isinstance(self.timeline, StreamTimeline):
+            self.timeline.flush()
+        if self.telemetry is not None and self.current_time is not None:
+            self.telemetry.finish(self.current_time)
+
+    def summary(self):
+        """{"completed", "time", "in_flight", "consumed", "totals", "raw_segments"} so far."""
+        return {"completed": self.completed, "time": self.current_time, "in_flight": self.in_flight(),
+                "consumed": self.stream.consumed, "totals": dict(self.timeline.totals),
+                "raw_segments": self.timeline.raw_count}
+
+
+class OnlineFCFS(OnlineAlgorithm):
+    """
+    algorithms.fcfs.fcfs on a stream. Arrivals up to the clock wait in a
+    FIFO; the clock starts at 0 and every process is followed by a context switch.
+    """
+
+    def __init__(self, records, context_switch=0.0, **kwargs):
+        super().__init__(records, context_switch, **kwargs)
+        self.ready = deque()
+
+    def in_flight(self):
+        return len(self.ready)
+
+    def _admit(self):
+        stream, ready = self.stream, self.ready
+        while stream.peek() <= self.current_time:
+            ready.append(stream.pop())
+
+    def step(self):
+        if self.current_time is None:
+            self.current_time = 0.0
+        self._admit()
+        if not self.ready:
+            if not self.stream:
+                self.finished = True
+                return
+            self.ready.append(self.stream.pop())
+        pid, arrival, burst, priority = self.ready.popleft()
+        arrival = float(arrival)
+        burst = float(burst)
+        timeline = self.timeline
+
+        if arrival > self.current_time:
+            timeline.emit(self.current_time, arrival - self.current_time, None, "idle")
+            self.current_time = arrival
+            self._admit()
+
+        first_run = self.current_time
+        timeline.emit(self.current_time, burst, pid, "proc")
+        self.current_time += burst
+        self._complete(pid, arrival, burst, priority, self.current_time, first_run)
+
+        if self.context_switch:
+            timeline.emit(self.current_time, self.context_switch, None, "cs")
+            self.current_time += self.context_switch
+
+
+class _OnlineNonPreemptive(OnlineAlgorithm):
+    """SJF/HPF on a stream: a heap ordered by key() replaces the sorted ready list."""
+
+    # Whether a context switch follows the last process
+    trailing_cs = True
+
+    def __init__(self, records, context_switch=0.0, **kwargs):
+        super().__init__(records, context_switch, **kwargs)
+        self.ready = []
+
+    def in_flight(self):
+        return len(self.ready)
+
+    @staticmethod
+    def key(pid, arrival, burst, priority):
+        raise NotImplementedError
+
+    def step(self):
+        stream, ready, timeline = self.stream, self.ready, self.timeline
+        if self.current_time is None:
+            if not stream:
+                self.finished = True
+                return
+            self.current_time = stream.peek()
+
+        # Add all processes that have arrived by current time
+        while stream.peek() <= self.current_time:
+            record = stream.pop()
+            heapq.heappush(ready, (self.key(*record), record))
+
+        # If no ready process, CPU idles until next arrival
+        if not ready:
+            if stream:
+                next_arr = stream.peek()
+                timeline.emit(self.current_time, next_arr - self.current_time, None, "idle")
+                self.current_time = next_arr
+                return
+            self.finished = True
+            return
+
+        _, (pid, arrival, burst, priority) = heapq.heappop(ready)
+        arrival = float(arrival)
+        burst = float(burst)
+        if arrival > self.current_time:
+            timeline.emit(self.current_time, arrival - self.current_time, None, "idle")
+            self.current_time = arrival
+
+        first_run = self.current_time
+        timeline.emit(self.current_time, burst, pid, "proc")
+        self.current_time += burst
+        self._complete(pid, arrival, burst, priority, self.current_time, first_run)
+
+        if self.context_switch and (self.trailing_cs or ready or stream):
+            timeline.emit(self.current_time, self.context_switch, None, "cs")
+            self.current_time += self.context_switch
+
+        if not ready and not stream:
+            self.finished = True
+
+
+class OnlineSJF(_OnlineNonPreemptive):
+    """algorithms.sjf.sjf on a stream (no context switch after the last process)."""
+
+    trailing_cs = False
+
+    @staticmethod
+    def key(pid, arrival, burst, priority):
+        return burst, int(pid)
+
+
+class OnlineHPF(_OnlineNonPreemptive):
+    """algorithms.hpf.hpf on a stream (larger priority first, then earlier arrival, then pid)."""
+
+    @staticmethod
+    def key(pid, arrival, burst, priority):
+        return -priority, arrival, int(pid)
+
+
+class OnlineRR(OnlineAlgorithm):
+    """algorithms.rr.rr on a stream, including round compression (`compress`)."""
+
+    # Steps before the next compression attempt (a class default, so older checkpoints load)
+    wait = 0
+
+    def __init__(self, records, quantum=1.0, context_switch=0.0, compress=False, **kwargs):
+        super().__init__(records, context_switch, **kwargs)
+        self.quantum = quantum
+        self.compress = compress
+        self.q = deque()
+        self.remaining = {}
+        self.info = {}
+        self.first_run = {}
+        self.changed = True
+
+    def in_flight(self):
+        return len(self.info)
+
+    def _admit_one(self):
+        pid, arrival, burst, priority = self.stream.pop()
+        self.info[pid] = (float(arrival), float(burst), priority)
+        self.remaining[pid] = float(burst)
+        self.q.append(pid)
+
+    def step(self):
+        stream, q, remaining, first_run, timeline = self.stream, self.q, self.remaining, self.first_run, self.timeline
+        quantum, context_switch = self.quantum, self.context_switch
+        if self.current_time is None:
+            if not stream:
+                self.finished = True
+                return
+            self.current_time = stream.peek()
+            # Seed initial arrivals
+            while stream.peek() <= self.current_time:
+                self._admit_one()
+
+        self.wait -= 1
+        if self.compress and self.changed and self.wait <= 0:
+            self.changed = False
+            m = len(q)
+            slot = quantum + context_switch
+            round_len = m * slot
+            next_arrival = float(stream.peek())
+            # No arrival may land on or before the end of the last slice of round k
+            k = math.ceil((next_arrival - self.current_time + context_switch) / round_len) - 1 if stream else math.inf
+            if k >= 1:
+                # No process may reach the completion threshold within k rounds
+                k = min(k, min(math.ceil((remaining[p] - 1e-12) / quantum) - 1 for p in q))
+                if k < 1:
+                    # The scan failed; wait a full rotation before the next one (as in algorithms.rr)
+                    self.wait = m
+            if k >= 1:
+                for j, p in enumerate(q):
+                    if p not in first_run:
+                        first_run[p] = self.current_time + j * slot
+                    remaining[p] -= k * quantum
+                timeline.emit_rounds(self.current_time, q, k, quantum, context_switch)
+                self.current_time += k * round_len
+
+        pid = q.popleft()
+        run_time = min(quantum, remaining[pid])
+        arrival = self.info[pid][0]
+
+        # Handle CPU idle if process arrived in future
+        if arrival > self.current_time:
+            timeline.emit(self.current_time, arrival - self.current_time, None, "idle")
+            self.current_time = arrival
+
+        if pid not in first_run:
+            first_run[pid] = self.current_time
+        timeline.emit(self.current_time, run_time, pid, "proc")
+        self.current_time += run_time
+        remaining[pid] -= run_time
+
+        # Enqueue any new arrivals during this time slice
+        while stream.peek() <= self.current_time:
+            self._admit_one()
+            self.changed = True
+
+        if remaining[pid] > 1e-12:
+            q.append(pid)
+        else:
+            self.changed = True
+            arrival, burst, priority = self.info.pop(pid)
+            del remaining[pid]
+            self._complete(pid, arrival, burst, priority, self.current_time, first_run.pop(pid))
+
+        if context_switch and q:
+            timeline.emit(self.current_time, context_switch, None, "cs")
+            self.current_time += context_switch
+
+        # If queue empty but there are future arrivals, jump to next arrival
+        if not q and stream:
+            self.current_time = stream.peek()
+            self._admit_one()
+            self.changed = True
+        if not q:
+            self.finished = True
+
+
+class OnlineSRTN(OnlineAlgorithm):
+    """algorithms.srtn.srtn on a stream."""
+
+    def __init__(self, records, quantum=0.5, context_switch=0.0, **kwargs):
+        super().__init__(records, context_switch, **kwargs)
+        self.quantum = quantum
+        self.active = {}
+        self.info = {}
+        self.first_run = {}
+
+    def in_flight(self):
+        return len(self.active)
+
+    def _admit(self):
+        stream = self.stream
+        while stream.peek() <= self.current_time:
+            pid, arrival, burst, priority = stream.pop()
+            self.info[pid] = (float(arrival), float(burst), priority)
+            self.active[pid] = float(burst)
+
+    def step(self):
+        stream, active, timeline = self.stream, self.active, self.timeline
+        if self.current_time is None:
+            if not stream:
+                self.finished = True
+                return
+            self.current_time = stream.peek()
+
+        self._admit()
+        if not active:
+            if stream:
+                next_arr = stream.peek()
+                timeline.emit(self.current_time, next_arr - self.current_time, None, "idle")
+                self.current_time = next_arr
+                return
+            self.finished = True
+            return
+
+        # Select process with the shortest remaining time
+        pid = min(active.items(), key=lambda kv: (kv[1], int(kv[0])))[0]
+        step = min(active[pid], self.quantum)
+
+        if pid not in self.first_run:
+            self.first_run[pid] = self.current_time
+        timeline.emit(self.current_time, step, pid, "proc")
+        self.current_time += step
+        active[pid] -= step
+
+        self._admit()
+
+        if active[pid] <= 1e-12:
+            del active[pid]
+            arrival, burst, priority = self.info.pop(pid)
+            self._complete(pid, arrival, burst, priority, self.current_time, self.first_run.pop(pid))
+
+        if self.context_switch and active:
+            timeline.emit(self.current_time, self.context_switch, None, "cs")
+            self.current_time += self.context_switch
+
+        if not active and not stream:
+            self.finished = True
+
+
+class OnlineMLFQ(OnlineAlgorithm):
+    """algorithms.mlfq.mlfq on a stream: the same LevelQueues, level policies and aging, without the aging log."""
+
+    def __init__(self, records, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=10.0, policies=None,
+                 **kwargs):
+        from algorithms.mlfq import LevelQueues, level_policies
+
+        super().__init__(records, context_switch, **kwargs)
+        quanta_list = list(quanta_list) if quanta_list is not None else [1 * (2 ** i) for i in range(levels)]
+        while len(quanta_list) < levels:
+            quanta_list.append(quanta_list[-1] * 2)
+        self.levels = levels
+        self.quanta_list = quanta_list
+        self.aging_threshold = aging_threshold
+        self.remaining = {}
+        self.burst = {}
+        self.info = {}
+        self.last_active = {}
+        self.first_run = {}
+        self.queues = LevelQueues(level_policies(policies, levels), self.remaining, self.burst, self.last_active)
+
+    def in_flight(self):
+        return len(self.info)
+
+    def _admit(self, seeding=False):
+        stream = self.stream
+        while stream.peek() <= self.current_time:
+            pid, arrival, burst, priority = stream.pop()
+            self.info[pid] = (float(arrival), float(burst), priority)
+            self.remaining[pid] = self.burst[pid] = float(burst)
+            # The batch loop seeds initial arrivals with last_active = arrival
+            self.last_active[pid] = float(arrival) if seeding else self.current_time
+            self.queues.push(pid, 0)
+
+    def step(self):
+        stream, queues, remaining, timeline = self.stream, self.queues, self.remaining, self.timeline
+        if self.current_time is None:
+            if not stream:
+                self.finished = True
+                return
+            self.current_time = stream.peek()
+            self._admit(seeding=True)
+
+        self._admit()
+
+        # Apply aging: promote if waiting too long
+        if queues.nonempty & ~1:
+            queues.age(self.current_time, self.aging_threshold)
+
+        if not queues.nonempty:
+            if stream:
+                next_arr = stream.peek()
+                timeline.emit(self.current_time, next_arr - self.current_time, None, "idle")
+                self.current_time = next_arr
+                return
+            self.finished = True
+            return
+
+        # Highest non-empty level, process chosen by the level's policy
+        pid, cur_level = queues.pop()
+        exec_time = min(remaining[pid], self.quanta_list[cur_level])
+        if self.telemetry is not None:
+            self.telemetry.queue_levels(self.current_time, queues.counts)
+        if pid not in self.first_run:
+            self.first_run[pid] = self.current_time
+        timeline.emit(self.current_time, exec_time, pid, "proc", cur_level)
+        self.current_time += exec_time
+        remaining[pid] -= exec_time
+        self.last_active[pid] = self.current_time
+
+        self._admit()
+
+        if remaining[pid] <= 1e-9:
+            arrival, burst, priority = self.info.pop(pid)
+            del remaining[pid], self.burst[pid], self.last_active[pid]
+            self._complete(pid, arrival, burst, priority, self.current_time, self.first_run.pop(pid))
+        else:
+            queues.push(pid, min(self.levels - 1, cur_level + 1))
+        if self.telemetry is not None:
+            self.telemetry.queue_levels(self.current_time, queues.counts)
+
+        if self.context_switch and queues.nonempty:
+            timeline.emit(self.current_time, self.context_switch, None, "cs")
+            self.current_time += self.context_switch
+
+        if not stream and not queues.nonempty:
+            self.finished = True
+
+
+# UI names (see scheduler.ALGORITHMS) -> online classes
+ONLINE_ALGORITHMS = {
+    "FCFS": OnlineFCFS,
+    "SJF": OnlineSJF,
+    "HPF": OnlineHPF,
+    "RR": OnlineRR,
+    "SRTN": OnlineSRTN,
+    "MLFQ": OnlineMLFQ,
+}
+
+
+def create_online(algorithm, records, context_switch=0, quantum=1, levels=3, quanta_list=None, fast=False,
+                  coalesce=True, aging_threshold=10.0, level_policies=None, on_complete=None, on_segment=None,
+                  telemetry=None):
+    """
+    Online counterpart of Scheduler.run: build the algorithm by its UI name,
+    ignoring parameters it does not take. `fast` enables RR round compression
+    and `level_policies` sets the MLFQ level policies.
+
+    Returns:
+        OnlineAlgorithm: Not yet started; call run().
+    """
+    algorithm = algorithm.upper()
+    if algorithm not in ONLINE_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    opts = {"coalesce": coalesce, "on_complete": on_complete, "on_segment": on_segment, "telemetry": telemetry}
+    if algorithm == "RR":
+        return OnlineRR(records, quantum, context_switch, compress=fast, **opts)
+    if algorithm == "SRTN":
+        return OnlineSRTN(records, quantum, context_switch, **opts)
+    if algorithm == "MLFQ":
+        if quanta_list is None:
+            from scheduler import DEFAULT_QUANTA
+            quanta_list = DEFAULT_QUANTA
+        return OnlineMLFQ(records, levels, quanta_list, context_switch, aging_threshold, level_policies, **opts)
+    return ONLINE_ALGORITHMS[algorithm](records, context_switch, **opts)
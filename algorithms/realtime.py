@@ -0,0 +1,240 @@
+# algorithms/realtime.py
+"""
+Real-time scheduling of periodic tasks: Earliest Deadline First (EDF) and
+Rate-Monotonic (RM).
+
+A task set has the form
+
+    {tid: [phase, wcet, period, deadline]}
+
+where `deadline` is relative to each release and defaults to the period.
+Task tid releases job k (k = 1, 2, ...) at phase + (k - 1) * period with
+absolute deadline release + deadline. Jobs are generated lazily from a
+heap of next releases and kept in a heap ordered by absolute deadline
+(EDF) or by period (RM), so a run costs O(log n) per job event however
+many jobs the horizon holds.
+
+Both schedulers are preemptive: a release with a higher priority than the
+running job preempts it. Jobs that miss their deadline still run to
+completion (soft real-time); the miss is recorded in their stats.
+"""
+import heapq
+import math
+from fractions import Fraction
+
+from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
+
+
+def task_params(values):
+    """(phase, wcet, period, deadline) of a task entry, with the deadline defaulting to the period."""
+    phase, wcet, period = (float(v) for v in values[:3])
+    deadline = float(values[3]) if len(values) > 3 and values[3] is not None else period
+    return phase, wcet, period, deadline
+
+
+def _task_key(tid):
+    # Numeric ids in numeric order, then named ones
+    return (0, int(tid), "") if str(tid).isdigit() else (1, 0, str(tid))
+
+
+def hyperperiod(tasks):
+    """Least common multiple of the task periods (exact for decimal periods such as 0.25)."""
+    periods = [Fraction(str(task_params(values)[2])) for values in tasks.values()]
+    if not periods:
+        return 0.0
+    numerator = math.lcm(*(p.numerator for p in periods))
+    denominator = math.gcd(*(p.denominator for p in periods))
+    return float(Fraction(numerator, denominator))
+
+
+def schedulability(tasks, algorithm="EDF"):
+    """
+    Schedulability analysis of a task set (context switches not included).
+
+    EDF: with implicit deadlines (deadline == period) the set is schedulable
+    iff the utilization is at most 1; otherwise the processor demand
+    criterion is checked at every absolute deadline up to the busy-period
+    bound. RM: exact response-time analysis with priorities by period; the
+    Liu-Layland bound n(2^(1/n) - 1) is reported alongside.
+
+    Returns:
+        dict: {"algorithm", "utilization", "bound" (utilization bound of the
+               test), "schedulable" (bool), "test" (name of the deciding test)
+               and for RM "response_times" {tid: worst-case response time, inf
+               when it exceeds the deadline}}.
+    """
+    algorithm = algorithm.upper()
+    params = {tid: task_params(values) for tid, values in tasks.items()}
+    utilization = sum(wcet / period for _, wcet, period, _ in params.values())
+    n = len(params)
+    result = {"algorithm": algorithm, "utilization": utilization}
+    if algorithm == "EDF":
+        result["bound"] = 1.0
+        if all(deadline == period for _, _, period, deadline in params.values()):
+            result["test"] = "utilization"
+            result["schedulable"] = utilization <= 1.0 + 1e-9
+        else:
+            result["test"] = "processor demand"
+            result["schedulable"] = utilization <= 1.0 + 1e-9 and _demand_ok(params, utilization)
+        return result
+    if algorithm != "RM":
+        raise ValueError(f"Unknown real-time algorithm: {algorithm}")
+
+    result["bound"] = n * (2 ** (1 / n) - 1) if n else 1.0
+    result["test"] = "response time"
+    order = sorted(params, key=lambda tid: (params[tid][2], _task_key(tid)))
+    response = {}
+    for i, tid in enumerate(order):
+        _, wcet, _, deadline = params[tid]
+        higher = [params[other] for other in order[:i]]
+        r = wcet
+        while True:
+            r_next = wcet + sum(math.ceil(r / period - 1e-9) * c for _, c, period, _ in higher)
+            if r_next > deadline + 1e-9:
+                r = math.inf
+                break
+            if r_next <= r + 1e-9:
+                break
+            r = r_next
+        response[tid] = r
+    result["response_times"] = response
+    result["schedulable"] = all(r <= params[tid][3] + 1e-9 for tid, r in response.items())
+    return result
+
+
+def _demand_ok(params, utilization):
+    """Processor demand criterion: demand in [0, L] <= L at every absolute deadline L up to the bound."""
+    max_deadline = max(deadline for _, _, _, deadline in params.values())
+    limit = hyperperiod({tid: list(p) for tid, p in params.items()}) + max_deadline
+    if utilization < 1.0:
+        busy_bound = sum((period - deadline) * wcet / period
+                         for _, wcet, period, deadline in params.values()) / (1.0 - utilization)
+        limit = min(limit, max(max_deadline, busy_bound))
+    deadlines = [(deadline, period) for _, _, period, deadline in params.values()]
+    heapq.heapify(deadlines)
+    while deadlines and deadlines[0][0] <= limit + 1e-9:
+        L, period = heapq.heappop(deadlines)
+        heapq.heappush(deadlines, (L + period, period))
+        demand = sum((math.floor((L - deadline) / p + 1e-9) + 1) * wcet
+                     for _, wcet, p, deadline in params.values() if L >= deadline - 1e-9)
+        if demand > L + 1e-9:
+            return False
+    return True
+
+
+def _realtime(tasks, algorithm, horizon, context_switch, coalesce, timeline, telemetry):
+    timeline, stats = new_timeline(timeline, coalesce, telemetry), {}
+    timeline.schedulability = schedulability(tasks, algorithm)
+    if not tasks:
+        return timeline, stats
+
+    params = {tid: task_params(values) for tid, values in tasks.items()}
+    for tid, (_, wcet, period, deadline) in params.items():
+        if wcet <= 0 or period <= 0 or deadline <= 0:
+            raise ValueError(f"task {tid} needs a positive wcet, period and deadline")
+    if horizon is None:
+        horizon = max(phase for phase, _, _, _ in params.values()) + hyperperiod(tasks)
+    edf = algorithm == "EDF"
+
+    # Next release per task: (time, rank, tid, job number)
+    releases = [(params[tid][0], rank, tid, 1) for rank, tid in enumerate(sorted(params, key=_task_key))
+                if params[tid][0] < horizon]
+    heapq.heapify(releases)
+    # Released jobs: (deadline or period, release, rank, job number, job id); the head runs
+    ready = []
+    remaining, jobs, first_run = {}, {}, {}
+
+    def release_until(t):
+        while releases and releases[0][0] <= t:
+            release, rank, tid, k = heapq.heappop(releases)
+            phase, wcet, period, deadline = params[tid]
+            job = f"{tid}.{k}"
+            heapq.heappush(ready, (release + deadline if edf else period, release, rank, k, job))
+            remaining[job] = wcet
+            jobs[job] = (tid, release, release + deadline)
+            if telemetry is not None:
+                telemetry.arrive(release)
+            # Computed from the phase, not accumulated, so long horizons do not drift
+            next_release = phase + k * period
+            if next_release < horizon - 1e-9:
+                heapq.heappush(releases, (next_release, rank, tid, k + 1))
+
+    current_time = releases[0][0] if releases else 0.0
+    while True:
+        release_until(current_time)
+        if not ready:
+            if not releases:
+                break
+            next_release = releases[0][0]
+            timeline.emit(current_time, next_release - current_time, None, "idle")
+            current_time = next_release
+            continue
+
+        # Run the head until it completes or the next release may preempt it
+        job = ready[0][-1]
+        tid = jobs[job][0]
+        exec_time = remaining[job]
+        if releases:
+            exec_time = min(exec_time, releases[0][0] - current_time)
+        first_run.setdefault(job, current_time)
+        timeline.emit(current_time, exec_time, tid, "proc")
+        current_time += exec_time
+        remaining[job] -= exec_time
+
+        done = remaining[job] <= 1e-9
+        if done:
+            heapq.heappop(ready)
+            _, release, deadline = jobs.pop(job)
+            del remaining[job]
+            entry = make_stats_entry(tasks, job, release, params[tid][1], current_time, first_run.pop(job))
+            entry["task"] = tid
+            entry["deadline"] = deadline
+            entry["lateness"] = current_time - deadline
+            entry["missed"] = current_time > deadline + 1e-9
+            stats[job] = entry
+            if telemetry is not None:
+                telemetry.complete(current_time)
+        release_until(current_time)
+
+        # Switch only when another job takes over
+        if context_switch and ready and (done or ready[0][-1] != job):
+            timeline.emit(current_time, context_switch, None, "cs")
+            current_time += context_switch
+
+    if telemetry is not None:
+        telemetry.finish(current_time)
+    return timeline, stats
+
+
+def edf(tasks, horizon=None, context_switch=0.0, coalesce=True, timeline=True, telemetry=None):
+    """
+    Earliest Deadline First: the released job with the earliest absolute
+    deadline runs (ties: earlier release, then task id).
+
+    Args:
+        tasks (dict): Periodic task set {tid: [phase, wcet, period, deadline]}.
+        horizon (float, optional): Jobs are released before this time. Defaults to the
+                                   largest phase plus the hyperperiod.
+        context_switch (float, optional): Context switch time when another job takes over. Defaults to 0.0.
+        coalesce (bool, optional): Merge adjacent segments. Defaults to True.
+        timeline (bool, optional): Record the timeline; False returns a NullTimeline. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector. Defaults to None.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (Timeline): Segments with the task id as pid; the result of
+              schedulability() is attached as timeline.schedulability.
+            - stats (dict): Per-job statistics keyed "<tid>.<k>", with the usual fields
+              plus "task", "deadline" (absolute), "lateness" (completion - deadline)
+              and "missed".
+    """
+    return _realtime(tasks, "EDF", horizon, context_switch, coalesce, timeline, telemetry)
+
+
+def rate_monotonic(tasks, horizon=None, context_switch=0.0, coalesce=True, timeline=True, telemetry=None):
+    """
+    Rate-Monotonic: fixed priorities, the task with the shortest period first
+    (ties: earlier release, then task id). Arguments and results as for edf().
+    """
+    return _realtime(tasks, "RM", horizon, context_switch, coalesce, timeline, telemetry)
@@ -1,38 +1,66 @@
 # algorithms/rr.py
 
+import math
 from collections import deque
 from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
 
-def rr(data, quantum=1.0, context_switch=0.0):
+def rr(data, quantum=1.0, context_switch=0.0, compress=False, coalesce=True, timeline=True, telemetry=None):
     """
     Round Robin (RR) CPU scheduling algorithm (preemptive).
 
+    With `compress`, stretches in which no process arrives or completes are
+    advanced several full rounds at a time: every queued process loses
+    k * quantum and a single "rounds" record stands for the k * len(queue)
+    slices (and their context switches). The queue order is unchanged by
+    full rounds, so the schedule is the same as without compression; see
+    utils.timeline.expand_timeline to recover the individual slices. Times
+    may differ from the slice-by-slice run by float rounding, since k rounds
+    are added in one step.
+
     Args:
         data (dict): Dictionary of processes with structure {pid: (arrival, burst, priority)}.
         quantum (float): Maximum CPU time a process can run per turn.
         context_switch (float): Time taken for context switching between processes.
+        compress (bool, optional): Enable round compression. Defaults to False.
+        coalesce (bool, optional): Merge consecutive slices of one process. Without a context
+                                   switch, a process alone in the queue runs slice after slice
+                                   and they become one segment; False keeps every quantum slice.
+                                   Compressed "rounds" records are never merged. Defaults to True.
+        timeline (bool, optional): False stores no segments and returns a NullTimeline whose
+                                   segment count and totals include every slice a compressed
+                                   stretch stands for. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector fed with every slice, arrival
+                                         and completion; a compressed stretch is accounted as its
+                                         processes sharing the CPU in turn. Defaults to None.
 
     Returns:
         tuple: (timeline, stats)
             - timeline (list of dicts): Each dict contains {"start", "duration", "pid", "type"}.
               'type' is "proc" for running process, "idle" for CPU idle, "cs" for context switch.
+              Compressed stretches are {"start", "duration", "pid": None, "type": "rounds",
+              "pids", "rounds", "quantum", "context_switch"}.
             - stats (dict): Per-process statistics {pid: {"arrival", "burst", "priority", "completion",
-              "turnaround", "waiting", "norm_turnaround"}}.
+              "turnaround", "waiting", "norm_turnaround", "response"}}.
     """
     
     # Sort processes by arrival time (tie-break by PID)
     sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
     
-    timeline = []
+    timeline = new_timeline(timeline, coalesce, telemetry)
     stats = {}
     
     # if empty, return early
     if not sorted_data:
         return timeline, stats
 
+    if telemetry is not None:
+        telemetry.expect([float(v[0]) for _, v in sorted_data])
+
     # Remaining burst times and arrival mapping
     remaining = {pid: float(burst) for pid, (_, burst, _) in sorted_data}
     arrival_map = {pid: float(arr) for pid, (arr, _, _) in sorted_data}
+    first_run = {}
 
     current_time = sorted_data[0][1][0]
     
@@ -51,24 +79,50 @@ def rr(data, quantum=1.0, context_switch=0.0):
         q.append(sorted_data[i][0])
         i += 1
 
+    # Round compression is attempted once after every arrival or completion;
+    # in between, the queue just rotates and nothing new can be learned.
+    changed = True
+    # Slices to run before the next attempt: one that fails on the remaining
+    # times has scanned the whole queue, so the next waits a full rotation
+    # (otherwise a long queue with frequent arrivals costs O(n) per slice)
+    wait = 0
+
     # Main RR loop
     while q:
+        wait -= 1
+        if compress and changed and wait <= 0:
+            changed = False
+            m = len(q)
+            slot = quantum + context_switch
+            round_len = m * slot
+            next_arrival = float(sorted_data[i][1][0]) if i < n else math.inf
+            # No arrival may land on or before the end of the last slice of round k
+            k = math.ceil((next_arrival - current_time + context_switch) / round_len) - 1 if i < n else math.inf
+            if k >= 1:
+                # No process may reach the completion threshold within k rounds
+                k = min(k, min(math.ceil((remaining[p] - 1e-12) / quantum) - 1 for p in q))
+                if k < 1:
+                    wait = m
+            if k >= 1:
+                for j, p in enumerate(q):
+                    if p not in first_run:
+                        first_run[p] = current_time + j * slot
+                    remaining[p] -= k * quantum
+                timeline.emit_rounds(current_time, q, k, quantum, context_switch)
+                current_time += k * round_len
+
         pid = q.popleft()
         run_time = min(quantum, remaining[pid])
 
         # Handle CPU idle if process arrived in future
         if arrival_map[pid] > current_time:
-            timeline.append({"start": current_time,
-                             "duration": arrival_map[pid] - current_time,
-                             "pid": None,
-                             "type": "idle"})
+            timeline.emit(current_time, arrival_map[pid] - current_time, None, "idle")
             current_time = arrival_map[pid]
 
         # Run the process
-        timeline.append({"start": current_time,
-                         "duration": run_time,
-                         "pid": pid,
-                         "type": "proc"})
+        if pid not in first_run:
+            first_run[pid] = current_time
+        timeline.emit(current_time, run_time, pid, "proc")
         
         current_time += run_time
         remaining[pid] -= run_time
@@ -77,17 +131,21 @@ def rr(data, quantum=1.0, context_switch=0.0):
         while i < n and sorted_data[i][1][0] <= current_time:
             q.append(sorted_data[i][0])
             i += 1
+            changed = True
 
         # If process not finished, requeue
         if remaining[pid] > 1e-12:
             q.append(pid)
         else:
+            changed = True
+            if telemetry is not None:
+                telemetry.complete(current_time)
             # Process finished: record stats
-            stats[pid] = make_stats_entry(data, pid, arrival_map[pid], float(data[pid][1]), current_time)
+            stats[pid] = make_stats_entry(data, pid, arrival_map[pid], float(data[pid][1]), current_time, first_run[pid])
 
         # Add context switch if needed and queue not empty
         if context_switch and q:
-            timeline.append({"start": current_time, "duration": context_switch, "pid": None, "type": "cs"})
+            timeline.emit(current_time, context_switch, None, "cs")
             current_time += context_switch
 
         # If queue empty but there are future arrivals, jump to next arrival
@@ -95,5 +153,8 @@ def rr(data, quantum=1.0, context_switch=0.0):
             current_time = sorted_data[i][1][0]
             q.append(sorted_data[i][0])
             i += 1
+            changed = True
 
+    if telemetry is not None:
+        telemetry.finish(current_time)
     return timeline, stats
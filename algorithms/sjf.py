@@ -1,9 +1,10 @@
 # algorithms/sjf.py
 
 from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
 
 
-def sjf(data, context_switch=0.0):
+def sjf(data, context_switch=0.0, coalesce=True, timeline=True, telemetry=None):
     """
     Implements the Shortest Job First (SJF) scheduling algorithm (non-preemptive).
 
@@ -15,6 +16,14 @@ def sjf(data, context_switch=0.0):
         data (dict): Process dictionary in the format:
                      {pid: (arrival_time, burst_time, priority)}
         context_switch (float, optional): Context switch overhead in time units. Defaults to 0.0.
+        coalesce (bool, optional): Merge adjacent segments of the same process. SJF is
+                                   non-preemptive, one segment per process, so the timeline
+                                   is the same either way. Defaults to True.
+        timeline (bool, optional): False returns an empty NullTimeline that only counts the
+                                   segments and totals busy, idle and context-switch time.
+                                   Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector; receives the arrival times,
+                                         the run of each picked job and its completion. Defaults to None.
 
     Returns:
         tuple: (timeline, stats)
@@ -25,12 +34,15 @@ def sjf(data, context_switch=0.0):
     # Sort by arrival time first, then PID
     sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
 
-    timeline = []
+    timeline = new_timeline(timeline, coalesce, telemetry)
     stats = {}
     n = len(sorted_data)
     if n == 0:
         return timeline, stats
 
+    if telemetry is not None:
+        telemetry.expect([float(v[0]) for _, v in sorted_data])
+
     ready = []
     current_time = sorted_data[0][1][0]
     i = 0
@@ -45,12 +57,7 @@ def sjf(data, context_switch=0.0):
         if not ready:
             if i < n:
                 next_arr = sorted_data[i][1][0]
-                timeline.append({
-                    "start": current_time,
-                    "duration": next_arr - current_time,
-                    "pid": None,
-                    "type": "idle"
-                })
+                timeline.emit(current_time, next_arr - current_time, None, "idle")
                 current_time = next_arr
                 continue
             break
@@ -63,33 +70,23 @@ def sjf(data, context_switch=0.0):
 
         # Execute it
         if arrival > current_time:
-            timeline.append({
-                "start": current_time,
-                "duration": arrival - current_time,
-                "pid": None,
-                "type": "idle"
-            })
+            timeline.emit(current_time, arrival - current_time, None, "idle")
             current_time = arrival
 
-        timeline.append({
-            "start": current_time,
-            "duration": burst,
-            "pid": pid,
-            "type": "proc"
-        })
+        first_run = current_time
+        timeline.emit(current_time, burst, pid, "proc")
         current_time += burst
+        if telemetry is not None:
+            telemetry.complete(current_time)
 
         # Record stats
-        stats[pid] = make_stats_entry(data, pid, arrival, burst, current_time)
+        stats[pid] = make_stats_entry(data, pid, arrival, burst, current_time, first_run)
 
         # Optional context switch
         if context_switch and (ready or i < n):
-            timeline.append({
-                "start": current_time,
-                "duration": context_switch,
-                "pid": None,
-                "type": "cs"
-            })
+            timeline.emit(current_time, context_switch, None, "cs")
             current_time += context_switch
 
+    if telemetry is not None:
+        telemetry.finish(current_time)
     return timeline, stats
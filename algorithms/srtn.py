@@ -1,8 +1,9 @@
 # algorithms/srtn.py
 
 from utils.make_stats_entry import make_stats_entry
+from utils.timeline import new_timeline
 
-def srtn(data, quantum=0.5, context_switch=0.0):
+def srtn(data, quantum=0.5, context_switch=0.0, coalesce=True, timeline=True, telemetry=None):
     """
     Implements the Shortest Remaining Time Next (SRTN) scheduling algorithm (preemptive).
 
@@ -14,6 +15,14 @@ def srtn(data, quantum=0.5, context_switch=0.0):
                      {pid: (arrival_time, burst_time, priority)}
         quantum (float, optional): Simulation granularity (smaller = more accurate). Defaults to 0.5.
         context_switch (float, optional): Context switch overhead (in time units). Defaults to 0.0.
+        coalesce (bool, optional): Merge consecutive quantum steps of the same process, which
+                                   happens while it keeps the shortest remaining time and no
+                                   context switch separates the steps (context_switch 0).
+                                   False keeps one segment per step. Defaults to True.
+        timeline (bool, optional): False skips storing the steps; the NullTimeline returned
+                                   only counts them and totals busy/idle/cs time. Defaults to True.
+        telemetry (Telemetry, optional): utils.telemetry collector fed with every step, arrival
+                                         and completion. Defaults to None.
 
     Returns:
         tuple: (timeline, stats)
@@ -23,7 +32,7 @@ def srtn(data, quantum=0.5, context_switch=0.0):
 
     # Sort processes by arrival time and PID
     sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
-    timeline = []
+    timeline = new_timeline(timeline, coalesce, telemetry)
     stats = {}
 
     if not sorted_data:
@@ -32,6 +41,10 @@ def srtn(data, quantum=0.5, context_switch=0.0):
     # Remaining burst time per process
     remaining = {pid: float(burst) for pid, (_, burst, _) in sorted_data}
     arrival_map = {pid: float(arr) for pid, (arr, _, _) in sorted_data}
+    first_run = {}
+
+    if telemetry is not None:
+        telemetry.expect([float(v[0]) for _, v in sorted_data])
 
     current_time = sorted_data[0][1][0]
     i = 0
@@ -49,12 +62,7 @@ def srtn(data, quantum=0.5, context_switch=0.0):
         if not active:
             if i < n:
                 next_arr = sorted_data[i][1][0]
-                timeline.append({
-                    "start": current_time,
-                    "duration": next_arr - current_time,
-                    "pid": None,
-                    "type": "idle"
-                })
+                timeline.emit(current_time, next_arr - current_time, None, "idle")
                 current_time = next_arr
                 continue
             break
@@ -64,12 +72,9 @@ def srtn(data, quantum=0.5, context_switch=0.0):
         step = min(active[pid], quantum)
 
         # Execute the selected process
-        timeline.append({
-            "start": current_time,
-            "duration": step,
-            "pid": pid,
-            "type": "proc"
-        })
+        if pid not in first_run:
+            first_run[pid] = current_time
+        timeline.emit(current_time, step, pid, "proc")
         
         current_time += step
         active[pid] -= step
@@ -83,18 +88,17 @@ def srtn(data, quantum=0.5, context_switch=0.0):
         # If the process finishes, record stats
         if active[pid] <= 1e-12:
             completion = current_time
+            if telemetry is not None:
+                telemetry.complete(completion)
             stats[pid] = make_stats_entry(data, pid, arrival_map[pid],
-                                          float(data[pid][1]), completion)
+                                          float(data[pid][1]), completion, first_run[pid])
             del active[pid]
 
         # Apply context switch delay if applicable
         if context_switch and active:
-            timeline.append({
-                "start": current_time,
-                "duration": context_switch,
-                "pid": None,
-                "type": "cs"
-            })
+            timeline.emit(current_time, context_switch, None, "cs")
             current_time += context_switch
 
+    if telemetry is not None:
+        telemetry.finish(current_time)
     return timeline, stats
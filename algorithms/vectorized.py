@@ -0,0 +1,310 @@
+# algorithms/vectorized.py
+
+"""
+NumPy fast path for non-preemptive schedules (FCFS, and SJF/HPF once their
+dispatch order is known).
+
+For a fixed dispatch order the whole schedule follows from one recurrence:
+
+    start_i      = max(arrival_i, start_{i-1} + burst_{i-1} + cs)
+    completion_i = start_i + burst_i
+
+With D_i = sum_{j<i} (burst_j + cs) this unrolls to
+
+    start_i = D_i + max(t0, max_{j<=i} (arrival_j - D_j))
+
+which is a cumulative sum followed by a running maximum, so the schedule,
+the idle gaps and the timeline columns are computed with vectorized scans.
+
+The results follow the same dispatch order, segment layout and
+context-switch placement as the loop implementations. Times agree up to
+floating-point rounding, because the loops add one burst at a time and
+restart the sum after every idle gap. They are exactly equal when all
+times are integers or otherwise exactly representable.
+"""
+
+import heapq
+from operator import itemgetter
+
+import numpy as np
+
+from utils.timeline import NullTimeline
+
+# Segment type codes used in columnar timelines
+TYPE_NAMES = ("proc", "idle", "cs")
+PROC, IDLE, CS = 0, 1, 2
+
+# (arrival, burst) of a workload entry
+_arrival_burst = itemgetter(0, 1)
+
+
+def fixed_order_schedule(arrival, burst, context_switch=0.0, t0=None, trailing_cs=True, build_timeline=True):
+    """
+    Schedule processes that are dispatched in the given (array) order.
+
+    Args:
+        arrival (np.ndarray): Arrival times, in dispatch order.
+        burst (np.ndarray): Burst times, in dispatch order.
+        context_switch (float): Context switch time after each process.
+        t0 (float, optional): Clock at the start; defaults to the first arrival
+                              (no leading idle segment).
+        trailing_cs (bool): Whether the last process is followed by a context switch.
+        build_timeline (bool): Skip the timeline columns when False.
+
+    Returns:
+        dict: Columns
+            - "start", "completion": per-process times (dispatch order)
+            - "idle_start", "idle": start and length of the idle gap before
+              each process (0 where the CPU was not idle)
+            - "timeline": {"start", "duration", "index", "type"} where index
+              points into the dispatch order (-1 for idle/cs) and type holds
+              PROC/IDLE/CS codes (None when build_timeline is False)
+    """
+    arrival = np.asarray(arrival, dtype=np.float64)
+    burst = np.asarray(burst, dtype=np.float64)
+    n = arrival.shape[0]
+    cs = float(context_switch or 0.0)
+    if n == 0:
+        empty = np.empty(0)
+        timeline = {"start": empty, "duration": empty,
+                    "index": np.empty(0, dtype=np.int64), "type": np.empty(0, dtype=np.int8)}
+        return {"start": empty, "completion": empty, "idle_start": empty, "idle": empty,
+                "timeline": timeline if build_timeline else None}
+    if t0 is None:
+        t0 = float(arrival[0])
+
+    step = burst + cs
+    offset = np.empty(n)
+    offset[0] = 0.0
+    np.cumsum(step[:-1], out=offset[1:])
+    start = offset + np.maximum(np.maximum.accumulate(arrival - offset), t0)
+    completion = start + burst
+
+    # The CPU becomes free at prev_free; it idles whenever the next arrival is later
+    prev_free = np.empty(n)
+    prev_free[0] = t0
+    prev_free[1:] = completion[:-1] + cs
+    idle = np.where(arrival > prev_free, arrival - prev_free, 0.0)
+    if not build_timeline:
+        return {"start": start, "completion": completion, "idle_start": prev_free, "idle": idle, "timeline": None}
+
+    # Timeline layout per process: [idle gap], run, [context switch]
+    has_idle = idle > 0
+    per_proc = 2 if cs else 1
+    idle_before = np.cumsum(has_idle)
+    proc_pos = np.arange(n) * per_proc + idle_before
+    total = n * per_proc + int(idle_before[-1])
+    seg_start = np.empty(total)
+    seg_dur = np.empty(total)
+    seg_type = np.empty(total, dtype=np.int8)
+    seg_index = np.empty(total, dtype=np.int64)
+    if idle_before[-1] == 0:
+        # No idle gaps: the layout is regular and strided writes suffice
+        seg_start[0::per_proc] = start
+        seg_dur[0::per_proc] = burst
+        seg_type[0::per_proc] = PROC
+        seg_index[0::per_proc] = np.arange(n)
+        if cs:
+            seg_start[1::2] = completion
+            seg_dur[1::2] = cs
+            seg_type[1::2] = CS
+            seg_index[1::2] = -1
+    else:
+        seg_start[proc_pos] = start
+        seg_dur[proc_pos] = burst
+        seg_type[proc_pos] = PROC
+        seg_index[proc_pos] = np.arange(n)
+        idle_pos = proc_pos[has_idle] - 1
+        seg_start[idle_pos] = prev_free[has_idle]
+        seg_dur[idle_pos] = idle[has_idle]
+        seg_type[idle_pos] = IDLE
+        seg_index[idle_pos] = -1
+        if cs:
+            seg_start[proc_pos + 1] = completion
+            seg_dur[proc_pos + 1] = cs
+            seg_type[proc_pos + 1] = CS
+            seg_index[proc_pos + 1] = -1
+    if cs and not trailing_cs:
+        total -= 1
+        seg_start, seg_dur, seg_type, seg_index = seg_start[:total], seg_dur[:total], seg_type[:total], seg_index[:total]
+
+    return {
+        "start": start,
+        "completion": completion,
+        "idle_start": prev_free,
+        "idle": idle,
+        "timeline": {
+            "start": seg_start,
+            "duration": seg_dur,
+            "index": seg_index,
+            "type": seg_type,
+        },
+    }
+
+
+def fcfs_arrays(arrival, burst, context_switch=0.0, assume_sorted=False, pid_order=None, build_timeline=True):
+    """
+    FCFS on plain arrays, without building per-process Python objects.
+
+    Matches algorithms.fcfs: the clock starts at 0 (leading idle gap if the
+    first arrival is later) and every process, including the last, is
+    followed by a context switch.
+
+    Args:
+        arrival, burst (array-like): Per-process times.
+        context_switch (float): Context switch time.
+        assume_sorted (bool): Skip sorting when the input is already in
+                              (arrival, pid) order.
+        pid_order (array-like, optional): Numeric pids used to break arrival ties.
+        build_timeline (bool): Skip the timeline columns when False.
+
+    Returns:
+        dict: As fixed_order_schedule, plus "order" (dispatch order as indices
+              into the input arrays).
+    """
+    arrival = np.asarray(arrival, dtype=np.float64)
+    burst = np.asarray(burst, dtype=np.float64)
+    if assume_sorted:
+        order = np.arange(arrival.shape[0])
+    elif pid_order is not None:
+        order = np.lexsort((np.asarray(pid_order), arrival))
+    else:
+        order = np.argsort(arrival, kind="stable")
+    result = fixed_order_schedule(arrival[order], burst[order], context_switch, t0=0.0, trailing_cs=True,
+                                  build_timeline=build_timeline)
+    result["order"] = order
+    return result
+
+
+def dispatch_order(data, policy, context_switch=0.0):
+    """
+    Dispatch order of the non-preemptive SJF or HPF schedule, using a heap
+    instead of re-sorting the ready list at every decision.
+
+    The clock is advanced with the same sequence of additions as the loop
+    implementations, so ready-set membership (and therefore the order) is
+    identical to theirs.
+
+    Args:
+        data (dict): {pid: [arrival, burst, priority]}
+        policy (str): "sjf" or "hpf".
+        context_switch (float): Context switch time.
+
+    Returns:
+        list: PIDs in dispatch order.
+    """
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+    n = len(sorted_data)
+    if n == 0:
+        return []
+    if policy == "sjf":
+        key = lambda kv: (kv[1][1], int(kv[0]))
+    elif policy == "hpf":
+        key = lambda kv: (-kv[1][2], kv[1][0], int(kv[0]))
+    else:
+        raise ValueError(f"Unknown policy: {policy}")
+
+    order = []
+    ready = []
+    current_time = sorted_data[0][1][0]
+    i = 0
+    while i < n or ready:
+        while i < n and sorted_data[i][1][0] <= current_time:
+            heapq.heappush(ready, (key(sorted_data[i]), i))
+            i += 1
+        if not ready:
+            current_time = sorted_data[i][1][0]
+            continue
+        _, idx = heapq.heappop(ready)
+        pid, (arrival, burst, _) = sorted_data[idx]
+        order.append(pid)
+        current_time = max(current_time, float(arrival)) + float(burst)
+        if context_switch and (policy == "hpf" or ready or i < n):
+            current_time += context_switch
+    return order
+
+
+def columns_to_timeline(columns, pids):
+    """Convert a columnar timeline into the list-of-dicts form used by the loop algorithms."""
+    tl = columns["timeline"]
+    # Index -1 (idle/cs) picks the trailing None
+    pid_col = np.array(list(pids) + [None], dtype=object)[tl["index"]].tolist()
+    type_col = np.array(TYPE_NAMES, dtype=object)[tl["type"]].tolist()
+    return [{"start": start, "duration": dur, "pid": pid, "type": typ}
+            for start, dur, pid, typ in zip(tl["start"].tolist(), tl["duration"].tolist(), pid_col, type_col)]
+
+
+def null_timeline(columns, burst, context_switch, trailing_cs):
+    """NullTimeline with the segment count and time totals of a schedule built without timeline columns."""
+    n = burst.shape[0]
+    switches = n if trailing_cs or n == 0 else n - 1
+    idle = columns["idle"]
+    timeline = NullTimeline()
+    timeline.raw_count = n + int(np.count_nonzero(idle)) + (switches if context_switch else 0)
+    timeline.totals = {"proc": float(burst.sum()), "idle": float(idle.sum()),
+                       "cs": switches * float(context_switch or 0.0)}
+    return timeline
+
+
+def _materialize(data, pids, columns, arrival, burst, timeline=None):
+    """
+    (timeline, stats) in the loop algorithms' format. The stats are computed
+    a column at a time, with the same float operations as make_stats_entry,
+    and only the final dicts are built per process.
+    """
+    start, completion = columns["start"], columns["completion"]
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    norm = np.divide(turnaround, burst, out=np.zeros_like(turnaround), where=burst > 0).tolist()
+    for k in np.flatnonzero(~(burst > 0)).tolist():
+        norm[k] = 0
+    response = start - arrival
+    stats = {pid: {"arrival": a, "burst": b, "priority": data[pid][2], "completion": c, "turnaround": t,
+                   "waiting": w, "norm_turnaround": nt, "response": r}
+             for pid, a, b, c, t, w, nt, r in zip(pids, arrival.tolist(), burst.tolist(), completion.tolist(),
+                                                  turnaround.tolist(), waiting.tolist(), norm, response.tolist())}
+    return (columns_to_timeline(columns, pids) if timeline is None else timeline), stats
+
+
+def fcfs_fast(data, context_switch=0.0, timeline=True):
+    """
+    Vectorized equivalent of algorithms.fcfs.fcfs (same arguments and return format).
+
+    The schedule itself takes a few NumPy passes; most of the time goes into
+    the per-process stats and segment dicts of the return format, so the gain
+    over the loop is under 2x. Callers that can use columns should call
+    fcfs_arrays(), which builds none of them.
+    """
+    if not data:
+        return ([] if timeline else NullTimeline()), {}
+    pids = list(data)
+    values = np.array(list(map(_arrival_burst, data.values())), dtype=np.float64)
+    columns = fcfs_arrays(values[:, 0], values[:, 1], context_switch,
+                          pid_order=np.array(list(map(int, pids))), build_timeline=timeline)
+    order = columns["order"]
+    ordered = [pids[k] for k in order.tolist()]
+    arrival, burst = values[order, 0], values[order, 1]
+    sink = None if timeline else null_timeline(columns, burst, context_switch, trailing_cs=True)
+    return _materialize(data, ordered, columns, arrival, burst, sink)
+
+
+def _ordered_fast(data, policy, context_switch, trailing_cs, timeline=True):
+    if not data:
+        return ([] if timeline else NullTimeline()), {}
+    pids = dispatch_order(data, policy, context_switch)
+    values = np.array([_arrival_burst(data[p]) for p in pids], dtype=np.float64)
+    arrival, burst = values[:, 0], values[:, 1]
+    columns = fixed_order_schedule(arrival, burst, context_switch, t0=float(min(arrival)),
+                                   trailing_cs=trailing_cs, build_timeline=timeline)
+    sink = None if timeline else null_timeline(columns, burst, context_switch, trailing_cs)
+    return _materialize(data, pids, columns, arrival, burst, sink)
+
+
+def sjf_fast(data, context_switch=0.0, timeline=True):
+    """Heap-ordered, vectorized equivalent of algorithms.sjf.sjf (no context switch after the last process)."""
+    return _ordered_fast(data, "sjf", context_switch, trailing_cs=False, timeline=timeline)
+
+
+def hpf_fast(data, context_switch=0.0, timeline=True):
+    """Heap-ordered, vectorized equivalent of algorithms.hpf.hpf."""
+    return _ordered_fast(data, "hpf", context_switch, trailing_cs=True, timeline=timeline)
@@ -0,0 +1,515 @@
+"""
+Command line entry point for headless runs.
+
+    python cli.py run --generate 1000 --seed 1 --algorithm RR --quantum 2 --report out.jsonl.gz
+    python cli.py run --generate 200 --algorithm MLFQ --telemetry-window 5 --report out.csv
+    python cli.py run --generate 100000 --algorithm MLFQ --levels 32 --level-policies RR,SRTN,SJF --stats-only
+    python cli.py run --generate 50 --io disk,net --algorithm RR --report out.txt
+    python cli.py run --generate 500 --algorithm FAIR --group-weights 1=4,2=1 --group-policy SRTN --report fs.txt
+    python cli.py run --generate-tasks 8 --utilization 0.9 --algorithm EDF --report rt.txt
+    python cli.py replicate --algorithm SRTN -n 500 --replications 50 --rel-tol 0.02
+    python cli.py render --generate 20 --seeds 0:100 --algorithm RR,SRTN,MLFQ --grid --out-dir charts
+    python cli.py stream --rate 0.2 --limit 1000000 --algorithm SRTN --stats-out done.csv.gz
+    tail -f jobs.txt | python cli.py stream --input - --algorithm RR
+    python cli.py stream --trace sched.dat.gz -a MLFQ --checkpoint run.ckpt --resume
+    python cli.py fuzz --iterations 2000 --engines online,fast --seed 1
+    python cli.py tune --generate 5000 --arrival 0,25000 --algorithm MLFQ --cache tune.json
+    python cli.py sweep --trace big.csv -a RR,SRTN --quantum 0.5,1,2,4 --serve 0.0.0.0:7070 --out sweep.jsonl
+    python cli.py worker --connect coordinator-host:7070 --processes 8 --cache-dir ~/.sweep-cache
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from utils.file_io import follow_lines, iter_process_lines, load_input_file, load_task_file
+from utils.metrics import StreamingMetrics, compute_metrics
+from utils.report import STATS_FIELDS, TIMELINE_FIELDS, detect_format, export_report, open_output
+from utils.timeline import expand_timeline, segment_counts
+from utils.traces import detect_trace_kind, iter_cluster_csv, iter_ftrace, load_trace
+from utils.workload import add_io_bursts, generate_processes, generate_tasks, stream_processes
+
+
+def _pair(text, cast=float):
+    lo, hi = (cast(x) for x in text.split(","))
+    return lo, hi
+
+
+def _mapping(text, cast=str):
+    """Parse "a=1,b=2" into {"a": cast("1"), ...}; numeric keys become ints, like priority groups."""
+    result = {}
+    for item in text.split(","):
+        key, value = item.split("=", 1)
+        result[int(key) if key.isdigit() else key] = cast(value)
+    return result
+
+
+def add_algorithm_args(parser):
+    parser.add_argument("--algorithm", "-a", default="FCFS",
+                        help="FCFS, SJF, HPF, RR, SRTN, MLFQ or FAIR; EDF or RM for task sets "
+                             "(render: comma separated list)")
+    parser.add_argument("--quantum", type=float, default=1.0)
+    parser.add_argument("--context-switch", type=float, default=0.0)
+    parser.add_argument("--levels", type=int, default=3, help="MLFQ levels")
+    parser.add_argument("--quanta", default="1,2,4", help="MLFQ quanta, comma separated")
+    parser.add_argument("--level-policies", metavar="POLICY,...",
+                        help="MLFQ: policy per level, RR, SRTN, FCFS or SJF (default RR,SRTN then FCFS)")
+    parser.add_argument("--fast", action="store_true",
+                        help="NumPy path for FCFS/SJF/HPF, round compression for RR")
+    parser.add_argument("--raw-segments", action="store_true",
+                        help="keep every quantum slice instead of coalescing adjacent segments")
+    parser.add_argument("--group-weights", metavar="G=W,...",
+                        help="FAIR: CPU share weight per group (groups are priorities; default weight 1)")
+    parser.add_argument("--group-policy", metavar="POLICY|G=POLICY,...",
+                        help="FAIR: child policy RR, SRTN or FCFS, for all groups or per group (default RR)")
+
+
+def algorithm_params(args):
+    params = {"context_switch": args.context_switch, "quantum": args.quantum,
+              "levels": args.levels, "quanta_list": [float(q) for q in args.quanta.split(",")],
+              "fast": args.fast, "coalesce": not args.raw_segments}
+    if args.level_policies:
+        params["level_policies"] = args.level_policies.split(",")
+    if args.group_weights:
+        params["group_weights"] = _mapping(args.group_weights, float)
+    if args.group_policy:
+        params["group_policies"] = _mapping(args.group_policy) if "=" in args.group_policy else args.group_policy
+    return params
+
+
+def add_workload_args(parser):
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--input", help="process file: pid arrival burst [priority] [bursts] per line")
+    source.add_argument("--trace", help="ftrace text output or cluster CSV trace")
+    source.add_argument("--generate", type=int, metavar="N", help="generate N random processes")
+    source.add_argument("--tasks", help="periodic task set for EDF/RM: tid phase wcet period [deadline] per line")
+    source.add_argument("--generate-tasks", type=int, metavar="N", help="generate N periodic tasks for EDF/RM")
+    parser.add_argument("--utilization", type=float, default=0.7, help="with --generate-tasks: total utilization")
+    parser.add_argument("--arrival", default="0,10", help="generator arrival range min,max")
+    parser.add_argument("--burst", default="1,10", help="generator burst range min,max")
+    parser.add_argument("--priority", default="1,5", help="generator priority range min,max")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--io", metavar="DEVICES",
+                        help="split bursts into CPU/I-O sequences on these comma separated devices")
+    parser.add_argument("--io-time", default="1,5", help="with --io: I/O time range min,max")
+    parser.add_argument("--io-cycles", default="1,3", help="with --io: I/O requests per process min,max")
+
+
+def with_io(args, data, seed):
+    """Add I/O burst sequences to a workload when --io is given."""
+    if not args.io:
+        return data
+    return add_io_bursts(data, tuple(args.io.split(",")), _pair(args.io_cycles, int), _pair(args.io_time),
+                         seed=seed)
+
+
+def add_checkpoint_args(parser):
+    parser.add_argument("--checkpoint", metavar="PATH", help="save the simulation state to PATH periodically and on Ctrl-C")
+    parser.add_argument("--checkpoint-interval", type=float, default=60.0, metavar="SECONDS")
+    parser.add_argument("--resume", action="store_true", help="with --checkpoint: continue from PATH if it exists")
+
+
+def load_workload(args):
+    if args.tasks:
+        return load_task_file(args.tasks)
+    if args.generate_tasks:
+        return generate_tasks(args.generate_tasks, args.utilization, seed=args.seed)
+    if args.input:
+        data = load_input_file(args.input)
+    elif args.trace:
+        data = load_trace(args.trace)
+    else:
+        data = generate_processes(args.generate or 5, _pair(args.arrival), _pair(args.burst),
+                                  _pair(args.priority, int), seed=args.seed)
+    return with_io(args, data, args.seed)
+
+
+def cmd_run(args):
+    from scheduler import Scheduler
+
+    data = load_workload(args)
+    sched = Scheduler(data, resolution=args.resolution)
+    timeline, stats = sched.run(args.algorithm, timeline=not args.stats_only,
+                                telemetry_window=args.telemetry_window, checkpoint=args.checkpoint,
+                                checkpoint_interval=args.checkpoint_interval, resume=args.resume,
+                                horizon=args.horizon, aging_log=sys.stderr if args.verbose else None,
+                                **algorithm_params(args))
+    metrics = compute_metrics(stats, timeline)
+    if args.report:
+        header = {"Algorithm": args.algorithm.upper(), "Quantum": args.quantum,
+                  "Context-switch": args.context_switch, "Segments": "%d (raw %d)" % segment_counts(timeline)}
+        for path in export_report(args.report, stats, None if args.stats_only else timeline,
+                                  header=header, metrics=metrics, telemetry=timeline.telemetry):
+            print(f"wrote {path}", file=sys.stderr)
+    json.dump(metrics, sys.stdout, indent=2)
+    print()
+
+
+def cmd_replicate(args):
+    from utils.replication import replicate
+
+    def progress(done, summary):
+        print(f"replication {done}", file=sys.stderr)
+
+    result = replicate(args.algorithm, args.n, _pair(args.arrival), _pair(args.burst), _pair(args.priority, int),
+                       params=algorithm_params(args), replications=args.replications,
+                       seed=args.seed or 0, confidence=args.confidence, rel_tol=args.rel_tol,
+                       min_replications=args.min_replications, max_workers=args.workers,
+                       progress=progress if args.verbose else None)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+
+def cmd_render(args):
+    from utils.batch_render import batch_render
+
+    if args.seeds:
+        first, last = (int(x) for x in args.seeds.split(":"))
+        workloads = {f"seed{seed}": with_io(args, generate_processes(args.generate or 5, _pair(args.arrival),
+                                                                     _pair(args.burst), _pair(args.priority, int),
+                                                                     seed=seed), seed)
+                     for seed in range(first, last)}
+    else:
+        source = args.input or args.trace
+        name = os.path.splitext(os.path.basename(source))[0] if source else f"seed{args.seed}"
+        workloads = {name: load_workload(args)}
+
+    def progress(done, total):
+        print(f"rendered {done}/{total}", file=sys.stderr)
+
+    algorithms = [a.strip().upper() for a in args.algorithm.split(",")]
+    paths = batch_render(workloads, algorithms, args.out_dir, algorithm_params(args), args.format,
+                         args.grid, args.dpi, args.workers, progress if args.verbose else None)
+    for path in paths:
+        print(path)
+
+
+def cmd_stream(args):
+    import random
+
+    from algorithms.online import create_online
+    from utils.checkpoint import load_checkpoint, run_checkpointed
+
+    state = load_checkpoint(args.checkpoint) if args.checkpoint and args.resume else None
+    seed = args.seed
+    if state is not None:
+        seed = state["seed"]
+    elif seed is None and args.checkpoint:
+        # A resumed generator has to replay the same arrivals
+        seed = random.randrange(2**32)
+
+    if args.input:
+        records = iter_process_lines(follow_lines(args.input, idle_timeout=None if args.follow else 0))
+    elif args.trace:
+        records = (iter_cluster_csv if detect_trace_kind(args.trace) == "csv" else iter_ftrace)(args.trace)
+    else:
+        records = stream_processes(args.rate, _pair(args.burst), _pair(args.priority, int), seed=seed)
+    if args.limit is not None:
+        records = (record for _, record in zip(range(args.limit), records))
+
+    metrics = state["metrics"] if state is not None else StreamingMetrics()
+    offsets = state["offsets"] if state is not None else {}
+    outputs = {}
+
+    def open_csv(path, header):
+        compress = detect_format(path)[1]
+        if args.checkpoint and compress:
+            sys.exit(f"{path}: compressed outputs cannot be resumed; use an uncompressed file with --checkpoint")
+        if path in offsets:
+            # Drop rows written after the checkpoint; they will be produced again
+            os.truncate(path, offsets[path])
+            outputs[path] = open(path, "a", encoding="utf-8", newline="")
+            return csv.writer(outputs[path])
+        outputs[path] = open_output(path, compress)
+        writer = csv.writer(outputs[path])
+        writer.writerow(header)
+        return writer
+
+    stats_writer = open_csv(args.stats_out, ["pid"] + STATS_FIELDS) if args.stats_out else None
+    segment_writer = open_csv(args.segments_out, TIMELINE_FIELDS) if args.segments_out else None
+
+    def on_complete(pid, entry):
+        metrics.add(entry)
+        if stats_writer:
+            stats_writer.writerow([pid] + [entry[k] for k in STATS_FIELDS])
+        if args.progress and metrics.pcount % args.progress == 0:
+            print(f"{metrics.pcount} done, t={engine.current_time:.2f}, in flight {engine.in_flight()}",
+                  file=sys.stderr)
+
+    def on_segment(seg):
+        for s in expand_timeline([seg]):
+            segment_writer.writerow([s["start"], s["duration"], s["pid"], s["type"], s.get("level")])
+
+    def before_save():
+        for path, f in outputs.items():
+            f.flush()
+            offsets[path] = f.tell()
+
+    if state is not None:
+        engine = state["engine"].attach(records, on_complete, on_segment if segment_writer else None)
+        print(f"resuming after {engine.completed} completions at t={engine.current_time}", file=sys.stderr)
+    else:
+        engine = create_online(args.algorithm, records, on_complete=on_complete,
+                               on_segment=on_segment if segment_writer else None, **algorithm_params(args))
+    try:
+        if args.checkpoint:
+            run_checkpointed(engine, args.checkpoint, {"seed": seed, "metrics": metrics, "offsets": offsets},
+                             args.checkpoint_interval, before_save)
+        else:
+            engine.run()
+    finally:
+        for f in outputs.values():
+            f.close()
+    json.dump({"summary": engine.summary(), "metrics": metrics.result()}, sys.stdout, indent=2)
+    print()
+
+
+def cmd_fuzz(args):
+    from utils.differential import ALGORITHMS, ENGINES, fuzz
+
+    def progress(done, total):
+        if done % 100 == 0 or done == total:
+            print(f"case {done}/{total}", file=sys.stderr)
+
+    algorithms = [a.strip().upper() for a in args.algorithm.split(",")] if args.algorithm else ALGORITHMS
+    engines = [e.strip() for e in args.engines.split(",")] if args.engines else list(ENGINES)
+    result = fuzz(algorithms, engines, args.iterations, args.seed, args.max_processes, args.tol,
+                  args.max_failures, progress if args.verbose else None)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    if result["failures"]:
+        sys.exit(1)
+
+
+def cmd_tune(args):
+    from utils.tuning import tune
+
+    cache = {}
+    if args.cache and os.path.exists(args.cache):
+        with open(args.cache, encoding="utf-8") as f:
+            cache = json.load(f)
+
+    def progress(rung, rungs, size, configs):
+        print(f"rung {rung}/{rungs}: {configs} configurations on {size} processes", file=sys.stderr)
+
+    result = tune(load_workload(args), args.algorithm, args.objective, args.context_switch, args.candidates,
+                  args.eta, args.min_size, args.seed, args.workers, cache, progress if args.verbose else None)
+    if args.cache:
+        with open(args.cache, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+
+def _address(text):
+    host, port = text.rsplit(":", 1)
+    return host, int(port)
+
+
+def _floats(text):
+    return [float(x) for x in text.split(",")]
+
+
+def cmd_sweep(args):
+    import multiprocessing
+    import time
+
+    from utils.sweep import Coordinator, expand_grid, run_sweep, run_worker
+
+    data = load_workload(args)
+    if args.configs:
+        with open(args.configs, encoding="utf-8") as f:
+            configs = [json.loads(line) for line in f if line.strip()]
+    else:
+        grid = {"algorithm": [a.strip().upper() for a in args.algorithm.split(",")],
+                "quantum": _floats(args.quantum), "context_switch": _floats(args.context_switch)}
+        if args.levels:
+            grid["levels"] = [int(x) for x in args.levels.split(",")]
+        if args.aging:
+            grid["aging_threshold"] = _floats(args.aging)
+        configs = expand_grid(grid)
+
+    out = open_output(args.out, detect_format(args.out)[1]) if args.out else None
+    finished = [0]
+
+    def on_result(index, result):
+        finished[0] += 1
+        if out:
+            out.write(json.dumps({"index": index, **result}) + "\n")
+        if args.verbose and finished[0] % 100 == 0:
+            print(f"{finished[0]}/{len(configs)} configurations", file=sys.stderr)
+
+    started = time.perf_counter()
+    workers = {}
+    try:
+        if args.serve:
+            host, port = _address(args.serve)
+            coordinator = Coordinator(data, configs, host, port, args.batch_size, args.steal_after,
+                                      args.max_attempts, args.timeout, on_result).start()
+            print(f"coordinator listening on {coordinator.address[0]}:{coordinator.address[1]}", file=sys.stderr)
+            local = [multiprocessing.Process(target=run_worker, args=(coordinator.address, f"local{k}"))
+                     for k in range(args.local_workers)]
+            for process in local:
+                process.start()
+            try:
+                results = coordinator.wait()
+            finally:
+                coordinator.close()
+            for process in local:
+                process.join()
+            workers = coordinator.workers
+        else:
+            results = run_sweep(data, configs, args.workers, on_result)
+    finally:
+        if out:
+            out.close()
+
+    ranked = [r for r in results if "metrics" in r]
+    best = min(ranked, key=lambda r: r["metrics"][args.objective]) if ranked else None
+    json.dump({"configurations": len(configs), "errors": len(results) - len(ranked), "workers": workers,
+               "elapsed": time.perf_counter() - started, "objective": args.objective, "best": best},
+              sys.stdout, indent=2)
+    print()
+
+
+def cmd_worker(args):
+    from utils.sweep import run_worker
+
+    done = run_worker(_address(args.connect), args.name, args.processes, args.cache_dir, args.heartbeat,
+                      args.connect_timeout)
+    print(f"{done} configurations run", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="OS Scheduler command line")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run one algorithm on one workload")
+    add_workload_args(run)
+    add_algorithm_args(run)
+    run.add_argument("--report", help="export report; format from suffix (.txt .csv .jsonl .json .col [.gz .bz2 .xz])")
+    run.add_argument("--stats-only", action="store_true", help="do not record the timeline (stats and metrics only)")
+    run.add_argument("--resolution", type=float, default=None,
+                     help="simulate on an integer tick time base, e.g. 1e-6 (times are rounded to ticks)")
+    run.add_argument("--telemetry-window", type=float, default=None,
+                     help="collect per-window utilization and ready-queue series and add them to the report")
+    run.add_argument("--horizon", type=float, default=None,
+                     help="EDF/RM: release jobs before this time (default: hyperperiod)")
+    run.add_argument("--verbose", "-v", action="store_true", help="MLFQ: report aging promotions on stderr")
+    add_checkpoint_args(run)
+    run.set_defaults(func=cmd_run)
+
+    rep = sub.add_parser("replicate", help="Monte-Carlo replications with confidence intervals")
+    add_algorithm_args(rep)
+    rep.add_argument("-n", type=int, default=100, help="processes per workload")
+    rep.add_argument("--arrival", default="0,10")
+    rep.add_argument("--burst", default="1,10")
+    rep.add_argument("--priority", default="1,5")
+    rep.add_argument("--seed", type=int, default=0, help="base seed; replication k uses seed + k")
+    rep.add_argument("--replications", type=int, default=30, help="upper bound on replications")
+    rep.add_argument("--min-replications", type=int, default=5)
+    rep.add_argument("--confidence", type=float, default=0.95)
+    rep.add_argument("--rel-tol", type=float, default=0.05, help="stop when every CI half-width <= rel_tol * mean")
+    rep.add_argument("--workers", type=int, default=None)
+    rep.add_argument("--verbose", "-v", action="store_true")
+    rep.set_defaults(func=cmd_replicate)
+
+    render = sub.add_parser("render", help="render Gantt charts to image files without a display")
+    add_workload_args(render)
+    add_algorithm_args(render)
+    render.add_argument("--seeds", metavar="FIRST:LAST", help="with --generate: one workload per seed in [FIRST, LAST)")
+    render.add_argument("--out-dir", default="charts")
+    render.add_argument("--format", default="png", choices=("png", "svg", "pdf"))
+    render.add_argument("--grid", action="store_true", help="one image per workload with a chart per algorithm")
+    render.add_argument("--dpi", type=int, default=100)
+    render.add_argument("--workers", type=int, default=None)
+    render.add_argument("--verbose", "-v", action="store_true")
+    render.set_defaults(func=cmd_render)
+
+    stream = sub.add_parser("stream", help="online run over an arrival stream in bounded memory")
+    source = stream.add_mutually_exclusive_group()
+    source.add_argument("--input", help="process lines (pid arrival burst [priority]) in arrival order; - for stdin")
+    source.add_argument("--trace", help="ftrace text output or arrival-ordered cluster CSV trace")
+    stream.add_argument("--follow", action="store_true", help="with --input: keep reading lines appended to the file")
+    stream.add_argument("--rate", type=float, default=1.0, help="without a source: Poisson arrivals per time unit")
+    stream.add_argument("--burst", default="1,10", help="generator burst range min,max")
+    stream.add_argument("--priority", default="1,5", help="generator priority range min,max")
+    stream.add_argument("--seed", type=int, default=None)
+    stream.add_argument("--limit", type=int, default=None, help="stop after this many arrivals")
+    add_algorithm_args(stream)
+    stream.add_argument("--stats-out", help="CSV of completed processes, written as they finish [.gz .bz2 .xz]")
+    stream.add_argument("--segments-out", help="CSV of timeline segments, written as they are final")
+    stream.add_argument("--progress", type=int, default=0, metavar="N", help="report to stderr every N completions")
+    add_checkpoint_args(stream)
+    stream.set_defaults(func=cmd_stream)
+
+    fuzz = sub.add_parser("fuzz", help="differential fuzzing of the engines against the reference algorithms")
+    fuzz.add_argument("--algorithm", "-a", help="comma separated algorithms (default: FCFS,SJF,HPF,RR,SRTN,MLFQ)")
+    fuzz.add_argument("--engines", help="comma separated engines: default, fast, raw, stats-only, online, ticks, telemetry (default: all)")
+    fuzz.add_argument("--iterations", type=int, default=500, help="random cases per algorithm")
+    fuzz.add_argument("--seed", type=int, default=None)
+    fuzz.add_argument("--max-processes", type=int, default=12)
+    fuzz.add_argument("--tol", type=float, default=1e-9, help="time tolerance relative to the end of the run")
+    fuzz.add_argument("--max-failures", type=int, default=10)
+    fuzz.add_argument("--verbose", "-v", action="store_true")
+    fuzz.set_defaults(func=cmd_fuzz)
+
+    tune = sub.add_parser("tune", help="search RR/MLFQ parameters that minimize p95 waiting time")
+    add_workload_args(tune)
+    tune.add_argument("--algorithm", "-a", default="RR", choices=("RR", "MLFQ"))
+    tune.add_argument("--objective", default="p95_wait", help="metric to minimize (a compute_metrics key)")
+    tune.add_argument("--context-switch", type=float, default=0.0)
+    tune.add_argument("--candidates", type=int, default=27, help="parameter sets drawn (the default included)")
+    tune.add_argument("--eta", type=int, default=3, help="keep 1/eta of the candidates per rung")
+    tune.add_argument("--min-size", type=int, default=50, help="processes in the shortest workload prefix")
+    tune.add_argument("--workers", type=int, default=None)
+    tune.add_argument("--cache", metavar="PATH", help="JSON file of earlier evaluations, read and updated")
+    tune.add_argument("--verbose", "-v", action="store_true")
+    tune.set_defaults(func=cmd_tune)
+
+    sweep = sub.add_parser("sweep", help="metrics of a parameter grid, locally or over TCP workers")
+    add_workload_args(sweep)
+    sweep.add_argument("--algorithm", "-a", default="RR", help="comma separated algorithms")
+    sweep.add_argument("--quantum", default="1", help="comma separated quanta")
+    sweep.add_argument("--context-switch", default="0", help="comma separated context switch times")
+    sweep.add_argument("--levels", help="comma separated MLFQ level counts")
+    sweep.add_argument("--aging", help="comma separated MLFQ aging thresholds")
+    sweep.add_argument("--configs", metavar="PATH", help="JSON lines of configurations instead of the grid")
+    sweep.add_argument("--objective", default="p95_wait", help="metric of the reported best configuration")
+    sweep.add_argument("--out", help="JSON lines of every result, written as they arrive [.gz .bz2 .xz]")
+    sweep.add_argument("--workers", type=int, default=None, help="local worker processes (without --serve)")
+    sweep.add_argument("--serve", metavar="HOST:PORT", help="coordinate remote workers (cli.py worker)")
+    sweep.add_argument("--local-workers", type=int, default=0, help="with --serve: also start N workers here")
+    sweep.add_argument("--batch-size", type=int, default=16)
+    sweep.add_argument("--steal-after", type=float, default=30.0, metavar="SECONDS",
+                       help="idle workers take over half of a batch running this long")
+    sweep.add_argument("--max-attempts", type=int, default=3)
+    sweep.add_argument("--timeout", type=float, default=60.0, metavar="SECONDS",
+                       help="a worker silent this long is dead and its batches are requeued")
+    sweep.add_argument("--verbose", "-v", action="store_true")
+    sweep.set_defaults(func=cmd_sweep)
+
+    worker = sub.add_parser("worker", help="run configurations for a sweep coordinator")
+    worker.add_argument("--connect", required=True, metavar="HOST:PORT")
+    worker.add_argument("--name", help="worker name (default host:pid)")
+    worker.add_argument("--processes", type=int, default=1, help="configurations run in parallel")
+    worker.add_argument("--cache-dir", help="keep workloads here by content hash")
+    worker.add_argument("--heartbeat", type=float, default=10.0, metavar="SECONDS")
+    worker.add_argument("--connect-timeout", type=float, default=30.0, metavar="SECONDS")
+    worker.set_defaults(func=cmd_worker)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except KeyboardInterrupt:
+        if getattr(args, "checkpoint", None):
+            sys.exit(f"interrupted; continue with --checkpoint {args.checkpoint} --resume")
+        raise
+
+
+if __name__ == "__main__":
+    main()
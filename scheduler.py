@@ -1,39 +1,354 @@
-from tkinter import Tk
-from ui.main_window import SchedulerApp
-from algorithms.fcfs import fcfs
-from algorithms.hpf import hpf
-from algorithms.rr import rr
-from algorithms.srtn import srtn
-from algorithms.mlfq import mlfq
-from algorithms.sjf import sjf
+from utils import startup
+from utils.timeline import as_timeline
+
+# Algorithm modules are imported on first use (see the methods below), so
+# importing Scheduler stays cheap for the GUI and for worker processes.
+
+# Algorithm names as shown in the UI, in menu order
+ALGORITHMS = ("SJF", "HPF", "FCFS", "RR", "SRTN", "MLFQ", "FAIR")
+
+# Real-time algorithms; their workload is a periodic task set (see algorithms.realtime)
+REALTIME_ALGORITHMS = ("EDF", "RM")
+
+# MLFQ quanta used when none are given
+DEFAULT_QUANTA = [1, 2, 4]
+
+# Segments or stats entries pickled together into a checkpointed run's output files
+SPILL_BATCH = 4096
 
 class Scheduler:
-    def __init__(self, processes):
+    """
+    Runs the scheduling algorithms on one workload.
+
+    With `resolution` (e.g. 1e-6), run() executes on an integer tick time base
+    (utils.timebase): inputs and parameters are rounded to whole ticks, the
+    algorithm steps exactly, and results are converted back to time units.
+    """
+    def __init__(self, processes, resolution=None):
         self.processes = processes
+        self.timebase = None
+        if resolution:
+            from utils.timebase import TimeBase
+            self.timebase = TimeBase(resolution)
+            self.tick_processes = self.timebase.workload_to_ticks(processes)
 
-    def fcfs(self, context_switch=0):
-        return fcfs(self.processes, context_switch)
+    def fcfs(self, context_switch=0, fast=False, coalesce=True, timeline=True, telemetry=None):
+        if fast:
+            from algorithms.vectorized import fcfs_fast
+            return fcfs_fast(self.processes, context_switch, timeline)
+        from algorithms.fcfs import fcfs
+        return fcfs(self.processes, context_switch, coalesce, timeline, telemetry)
 
-    def hpf(self, context_switch=0):
-        return hpf(self.processes, context_switch)
+    def hpf(self, context_switch=0, fast=False, coalesce=True, timeline=True, telemetry=None):
+        if fast:
+            from algorithms.vectorized import hpf_fast
+            return hpf_fast(self.processes, context_switch, timeline)
+        from algorithms.hpf import hpf
+        return hpf(self.processes, context_switch, coalesce, timeline, telemetry)
 
-    def rr(self, quantum=1, context_switch=0):
-        return rr(self.processes, quantum, context_switch)
+    def rr(self, quantum=1, context_switch=0, compress=False, coalesce=True, timeline=True, telemetry=None):
+        from algorithms.rr import rr
+        return rr(self.processes, quantum, context_switch, compress, coalesce, timeline, telemetry)
 
-    def srtn(self, quantum=1, context_switch=0):
-        return srtn(self.processes, quantum, context_switch)
+    def srtn(self, quantum=1, context_switch=0, coalesce=True, timeline=True, telemetry=None):
+        from algorithms.srtn import srtn
+        return srtn(self.processes, quantum, context_switch, coalesce, timeline, telemetry)
 
-    def mlfq(self, levels=3, quanta_list=None, context_switch=0):
+    def mlfq(self, levels=3, quanta_list=None, context_switch=0, coalesce=True, timeline=True, aging_threshold=10.0,
+             telemetry=None, level_policies=None, aging_log=None):
+        from algorithms.mlfq import mlfq
         if quanta_list is None:
-            quanta_list = [1,2,4]
-        return mlfq(self.processes, levels, quanta_list, context_switch)
+            quanta_list = list(DEFAULT_QUANTA)
+        return mlfq(self.processes, levels, quanta_list, context_switch, aging_threshold, coalesce, timeline,
+                    telemetry, level_policies, aging_log)
+
+    def sjf(self,context_switch=0, fast=False, coalesce=True, timeline=True, telemetry=None):
+        if fast:
+            from algorithms.vectorized import sjf_fast
+            return sjf_fast(self.processes, context_switch, timeline)
+        from algorithms.sjf import sjf
+        return sjf(self.processes,context_switch, coalesce, timeline, telemetry)
+
+    def bursts(self, algorithm, quantum=1, context_switch=0, levels=3, quanta_list=None, coalesce=True,
+               timeline=True, aging_threshold=10.0, telemetry=None, level_policies=None):
+        from algorithms.bursts import burst_schedule
+        if quanta_list is None:
+            quanta_list = list(DEFAULT_QUANTA)
+        return burst_schedule(self.processes, algorithm, quantum, context_switch, levels, quanta_list,
+                              aging_threshold, coalesce, timeline, telemetry, level_policies)
+
+    def fair(self, quantum=1, context_switch=0, groups=None, group_weights=None, group_policies="RR", coalesce=True,
+             timeline=True, telemetry=None):
+        from algorithms.fair_share import fair_share
+        return fair_share(self.processes, groups, group_weights, group_policies, quantum, context_switch, coalesce,
+                          timeline, telemetry)
+
+    def edf(self, context_switch=0, horizon=None, coalesce=True, timeline=True, telemetry=None):
+        from algorithms.realtime import edf
+        return edf(self.processes, horizon, context_switch, coalesce, timeline, telemetry)
+
+    def rm(self, context_switch=0, horizon=None, coalesce=True, timeline=True, telemetry=None):
+        from algorithms.realtime import rate_monotonic
+        return rate_monotonic(self.processes, horizon, context_switch, coalesce, timeline, telemetry)
+
+    def run(self, algorithm, context_switch=0, quantum=1, levels=3, quanta_list=None, fast=False, coalesce=True,
+            timeline=True, aging_threshold=10.0, telemetry_window=None, checkpoint=None, checkpoint_interval=60.0,
+            resume=False, horizon=None, groups=None, group_weights=None, group_policies="RR", level_policies=None,
+            aging_log=None):
+        """
+        Run an algorithm by its UI name (see ALGORITHMS), ignoring parameters it does not take.
+
+        `fast` selects the NumPy path (algorithms.vectorized) for FCFS, SJF and HPF,
+        and round compression for RR. `coalesce=False` keeps every quantum slice
+        as its own timeline segment. `timeline=False` is the stats-only mode: no
+        segments are stored and the returned timeline is an empty NullTimeline
+        holding only segment counts and proc/idle/cs totals.
+
+        The returned timeline is always a utils.timeline.Timeline; its time_index()
+        answers "running at t" and windowed utilization/overhead queries.
+
+        With `telemetry_window`, the run also collects a utils.telemetry.Telemetry
+        (busy/idle/cs fractions and ready-queue lengths per window of that
+        length), returned as the timeline's `telemetry` attribute. The NumPy
+        paths have no scheduling loop to observe, so `fast` is ignored for
+        FCFS, SJF and HPF in that case.
+
+        With `checkpoint` (a file path), the run goes through the online
+        algorithm (algorithms.online) and its full state is saved there every
+        `checkpoint_interval` seconds and on Ctrl-C (utils.checkpoint). With
+        `resume`, a run continues from that file when it exists; the results
+        are identical to an uninterrupted run. Segments and stats are written
+        to `<checkpoint>.segments` and `<checkpoint>.stats` as the run goes, so
+        a checkpoint holds only the engine and their offsets. The files are
+        removed when the run completes. Checkpointed runs use the loop algorithms (`fast` only
+        enables RR round compression).
+
+        Workloads with CPU/I-O burst sequences (a fourth field per process,
+        see algorithms.bursts) run on the event-driven burst scheduler with
+        the chosen policy; `fast` does not apply to them and they cannot be
+        checkpointed. The device segments and busy times are returned as the
+        timeline's `io_segments` and `io_totals`.
+
+        "EDF" and "RM" (REALTIME_ALGORITHMS) expect the Scheduler's workload to
+        be a periodic task set {tid: [phase, wcet, period, deadline]} and
+        simulate it up to `horizon` (default: largest phase plus hyperperiod).
+        Stats are per job, with deadline, lateness and miss flags; the
+        schedulability analysis is returned as the timeline's `schedulability`.
+
+        "FAIR" is hierarchical fair-share scheduling (algorithms.fair_share):
+        `groups` maps pids to groups (default: one group per priority),
+        `group_weights` gives the CPU share weights and `group_policies` the
+        child policy ("RR", "SRTN" or "FCFS", or a dict per group). The CPU
+        time received and entitled per group is returned as the timeline's
+        `group_shares`.
 
-    def sjf(self,context_switch=0):
-        return sjf(self.processes,context_switch)
+        `level_policies` sets the policy of each MLFQ level ("RR", "SRTN",
+        "FCFS" or "SJF"; default RR, SRTN, then FCFS), checkpointed runs and
+        I/O burst sequences included. `aging_log` is a
+        text stream the MLFQ loop algorithm reports its aging promotions on.
+        """
+        if self.timebase is not None:
+            tb = self.timebase
+            tick_timeline, tick_stats = self.run_ticks(algorithm, context_switch, quantum, levels, quanta_list,
+                                                       fast, coalesce, timeline, aging_threshold, telemetry_window,
+                                                       checkpoint, checkpoint_interval, resume, horizon, groups,
+                                                       group_weights, group_policies, level_policies, aging_log)
+            return tb.timeline_from_ticks(tick_timeline), tb.stats_from_ticks(tick_stats)
+        realtime = algorithm.upper() in REALTIME_ALGORITHMS
+        from algorithms.bursts import has_io
+        io = not realtime and has_io(self.processes)
+        if io and checkpoint:
+            raise ValueError("checkpointed runs do not support I/O burst sequences")
+        if realtime and checkpoint:
+            raise ValueError("checkpointed runs do not support real-time algorithms")
+        if checkpoint:
+            params = {"context_switch": context_switch, "quantum": quantum, "levels": levels,
+                      "quanta_list": quanta_list, "fast": fast, "coalesce": coalesce,
+                      "aging_threshold": aging_threshold, "level_policies": level_policies}
+            return self._run_checkpointed(algorithm, params, timeline, telemetry_window, checkpoint,
+                                          checkpoint_interval, resume)
+        opts = {"coalesce": coalesce, "timeline": timeline}
+        algorithm = algorithm.upper()
+        if telemetry_window:
+            from utils.telemetry import Telemetry
+            opts["telemetry"] = Telemetry(telemetry_window, levels if algorithm == "MLFQ" else 0)
+            if algorithm in ("FCFS", "HPF", "SJF"):
+                fast = False
+        if realtime:
+            result, stats = getattr(self, algorithm.lower())(context_switch=context_switch, horizon=horizon, **opts)
+        elif io:
+            result, stats = self.bursts(algorithm, quantum=quantum, context_switch=context_switch, levels=levels,
+                                        quanta_list=quanta_list, aging_threshold=aging_threshold,
+                                        level_policies=level_policies, **opts)
+        elif algorithm == "FAIR":
+            result, stats = self.fair(quantum=quantum, context_switch=context_switch, groups=groups,
+                                      group_weights=group_weights, group_policies=group_policies, **opts)
+        elif algorithm in ("FCFS", "HPF", "SJF"):
+            result, stats = getattr(self, algorithm.lower())(context_switch=context_switch, fast=fast, **opts)
+        elif algorithm == "RR":
+            result, stats = self.rr(quantum=quantum, context_switch=context_switch, compress=fast, **opts)
+        elif algorithm == "SRTN":
+            result, stats = self.srtn(quantum=quantum, context_switch=context_switch, **opts)
+        elif algorithm == "MLFQ":
+            result, stats = self.mlfq(levels=levels, quanta_list=quanta_list, context_switch=context_switch,
+                                      aging_threshold=aging_threshold, level_policies=level_policies,
+                                      aging_log=aging_log, **opts)
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        return as_timeline(result), stats
 
-def main():
+    def _run_checkpointed(self, algorithm, params, timeline, telemetry_window, checkpoint, interval, resume):
+        import hashlib
+        import os
+        import pickle
+
+        from algorithms.online import create_online, workload_records
+        from utils.checkpoint import load_checkpoint, run_checkpointed
+        from utils.timeline import NullTimeline, Timeline
+
+        # A checkpoint only resumes the run it was written for
+        key = hashlib.sha256(repr((algorithm.upper(), sorted(params.items()), timeline, telemetry_window,
+                                   sorted(self.processes.items()))).encode()).hexdigest()
+        state = load_checkpoint(checkpoint) if resume else None
+        if state is not None and state["key"] != key:
+            raise ValueError(f"{checkpoint} was written for a different workload or parameters")
+
+        # Segments and stats are streamed to files beside the checkpoint as pickled batches;
+        # the checkpoint only records how far they go, so saving it does not grow with the run
+        offsets = state["offsets"] if state is not None else {}
+        outputs, batches = {}, {}
+        for name in ("segments", "stats"):
+            path = f"{checkpoint}.{name}"
+            if name in offsets:
+                # Drop batches written after the checkpoint; they will be produced again
+                os.truncate(path, offsets[name])
+                outputs[name] = open(path, "ab")
+            else:
+                outputs[name] = open(path, "wb")
+            batches[name] = []
+
+        def writer(name):
+            batch, f = batches[name], outputs[name]
+
+            def write(record):
+                batch.append(record)
+                if len(batch) >= SPILL_BATCH:
+                    pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+                    batch.clear()
+            return write
+
+        def before_save():
+            for name, f in outputs.items():
+                if batches[name]:
+                    pickle.dump(batches[name], f, pickle.HIGHEST_PROTOCOL)
+                    batches[name].clear()
+                f.flush()
+                os.fsync(f.fileno())
+                offsets[name] = f.tell()
+
+        write_stats = writer("stats")
+
+        def on_complete(pid, entry):
+            write_stats((pid, entry))
+
+        on_segment = writer("segments") if timeline else None
+        try:
+            if state is not None:
+                engine = state["engine"]
+                engine.attach(workload_records(self.processes), on_complete, on_segment)
+            else:
+                telemetry = None
+                if telemetry_window:
+                    from utils.telemetry import Telemetry
+                    telemetry = Telemetry(telemetry_window, params["levels"] if algorithm.upper() == "MLFQ" else 0)
+                engine = create_online(algorithm, workload_records(self.processes), on_complete=on_complete,
+                                       on_segment=on_segment, telemetry=telemetry, **params)
+            run_checkpointed(engine, checkpoint, {"key": key, "offsets": offsets}, interval, before_save)
+            before_save()
+        finally:
+            for f in outputs.values():
+                f.close()
+
+        def read(name):
+            path = f"{checkpoint}.{name}"
+            with open(path, "rb") as f:
+                while True:
+                    try:
+                        yield from pickle.load(f)
+                    except EOFError:
+                        break
+            os.remove(path)
+
+        stats = dict(read("stats"))
+        if timeline:
+            result = Timeline(params["coalesce"])
+            result.extend(read("segments"))
+        else:
+            os.remove(f"{checkpoint}.segments")
+            result = NullTimeline()
+        result.raw_count = engine.timeline.raw_count
+        result.totals = dict(engine.timeline.totals)
+        result.telemetry = engine.telemetry
+        return result, stats
+
+    def run_ticks(self, algorithm, context_switch=0, quantum=1, levels=3, quanta_list=None, fast=False,
+                  coalesce=True, timeline=True, aging_threshold=10.0, telemetry_window=None, checkpoint=None,
+                  checkpoint_interval=60.0, resume=False, horizon=None, groups=None, group_weights=None,
+                  group_policies="RR", level_policies=None, aging_log=None):
+        """
+        Like run(), but return the raw results in integer ticks; requires `resolution`.
+        Use self.timebase.timeline_arrays() to store the timeline as int64 columns.
+        """
+        if self.timebase is None:
+            raise ValueError("run_ticks needs a Scheduler created with a resolution")
+        tb = self.timebase
+        if quanta_list is None:
+            quanta_list = DEFAULT_QUANTA
+        if algorithm.upper() in REALTIME_ALGORITHMS:
+            ticked = Scheduler(tb.tasks_to_ticks(self.processes))
+        else:
+            ticked = Scheduler(self.tick_processes)
+        return ticked.run(algorithm, context_switch=tb.to_ticks(context_switch),
+                          quantum=tb.positive_ticks(quantum, "quantum"), levels=levels,
+                          quanta_list=[tb.positive_ticks(q, "quantum") for q in quanta_list],
+                          fast=fast, coalesce=coalesce, timeline=timeline,
+                          aging_threshold=tb.to_ticks(aging_threshold),
+                          telemetry_window=tb.positive_ticks(telemetry_window, "telemetry window")
+                          if telemetry_window else None,
+                          checkpoint=checkpoint, checkpoint_interval=checkpoint_interval, resume=resume,
+                          horizon=tb.to_ticks(horizon) if horizon is not None else None,
+                          groups=groups, group_weights=group_weights, group_policies=group_policies,
+                          level_policies=level_policies, aging_log=aging_log)
+
+def preload_algorithms():
+    """Import every algorithm module (used by the GUI's background preload)."""
+    import algorithms.fcfs, algorithms.hpf, algorithms.rr, algorithms.srtn, algorithms.mlfq, algorithms.sjf
+
+
+def main(argv=None):
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="OS Scheduler Visualizer")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print startup timings to stderr once the chart is ready")
+    parser.add_argument("--exit", action="store_true", help="with --startup-report: quit after reporting")
+    args = parser.parse_args(argv)
+
+    from tkinter import Tk
+    startup.mark("tkinter imported")
+    # UI imported here so worker processes can import Scheduler without Tk widgets
+    from ui.main_window import SchedulerApp
+    startup.mark("ui imported")
     root = Tk()
     app = SchedulerApp(root)  # UI only
+
+    if args.startup_report:
+        def on_ready():
+            print(startup.report(), file=sys.stderr)
+            if args.exit:
+                root.destroy()
+        app.on_plot_ready = on_ready
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,342 @@
+"""
+Local JSON-over-HTTP simulation service.
+
+    python service.py --port 8080 --workers 4
+
+Endpoints:
+    POST /simulate   {"processes": {pid: [arrival, burst, priority]},
+                      "algorithm": "RR",
+                      "params": {"quantum": 2, "context_switch": 0.1},
+                      "timeline": false}
+                     -> {"stats": {...}, "metrics": {...}, ["timeline": [...]]}
+    GET  /health     -> {"status": "ok", ...}
+    GET  /metrics    -> service counters, queue depth and latency percentiles
+
+Simulations run on a process pool. Requests wait in a bounded queue; when
+it is full the service answers 503 with Retry-After instead of buffering
+without limit. Small requests are grouped into batches so that one pool
+round-trip serves many of them.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from utils.metrics import compute_metrics
+from utils.sketch import QuantileSketch
+
+# Largest request body accepted, in bytes
+MAX_BODY = 256 * 1024 * 1024
+
+# Parameters forwarded to Scheduler.run
+RUN_PARAMS = ("context_switch", "quantum", "levels", "quanta_list")
+
+
+def run_batch(jobs):
+    """
+    Execute a batch of simulation jobs (runs in a pool worker).
+
+    Args:
+        jobs (list[dict]): Each {"processes", "algorithm", "params", "timeline"}.
+
+    Returns:
+        list[dict]: One result per job; failed jobs carry an "error" message.
+    """
+    from scheduler import Scheduler
+
+    results = []
+    for job in jobs:
+        try:
+            timeline, stats = Scheduler(job["processes"]).run(job["algorithm"], timeline=job["timeline"],
+                                                              **job["params"])
+            result = {"stats": stats, "metrics": compute_metrics(stats, timeline)}
+            if job["timeline"]:
+                result["timeline"] = list(timeline)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        results.append(result)
+    return results
+
+
+def _finite(value, name, minimum=None, strict=False):
+    """`value` as a float; ValueError unless it is finite and above (or, not `strict`, at) `minimum`."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number")
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be finite")
+    if minimum is not None and (value <= minimum if strict else value < minimum):
+        raise ValueError(f"{name} must be {'>' if strict else '>='} {minimum:g}")
+    return value
+
+
+def parse_params(params):
+    """Validate the Scheduler.run parameters of a request; the loops never end on a zero or negative quantum."""
+    if not isinstance(params, dict):
+        raise ValueError("'params' must be an object")
+    unknown = set(params) - set(RUN_PARAMS)
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)}")
+    params = dict(params)
+    if "context_switch" in params:
+        params["context_switch"] = _finite(params["context_switch"], "context_switch", 0.0)
+    if "quantum" in params:
+        params["quantum"] = _finite(params["quantum"], "quantum", 0.0, strict=True)
+    if "levels" in params:
+        levels = params["levels"]
+        if isinstance(levels, bool) or not isinstance(levels, int) or levels < 1:
+            raise ValueError("levels must be an integer >= 1")
+    if "quanta_list" in params:
+        quanta = params["quanta_list"]
+        if not isinstance(quanta, list) or not quanta:
+            raise ValueError("quanta_list must be a non-empty list")
+        params["quanta_list"] = [_finite(q, "every quanta_list entry", 0.0, strict=True) for q in quanta]
+    return params
+
+
+def parse_job(body):
+    """Validate a /simulate request body and normalize it into a job dict."""
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise ValueError(f"invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise ValueError("request body must be a JSON object")
+    processes = payload.get("processes")
+    if not isinstance(processes, dict) or not processes:
+        raise ValueError("'processes' must be a non-empty object {pid: [arrival, burst, priority]}")
+    workload = {}
+    for pid, values in processes.items():
+        if not isinstance(values, (list, tuple)) or len(values) < 2:
+            raise ValueError(f"process {pid}: expected [arrival, burst, priority]")
+        priority = int(_finite(values[2], f"process {pid}: priority")) if len(values) > 2 else 0
+        workload[str(pid)] = [_finite(values[0], f"process {pid}: arrival"),
+                              _finite(values[1], f"process {pid}: burst", 0.0), priority]
+    algorithm = str(payload.get("algorithm", "FCFS")).upper()
+    params = parse_params(payload.get("params") or {})
+    return {"processes": workload, "algorithm": algorithm, "params": params,
+            "timeline": bool(payload.get("timeline", False))}
+
+
+class SimulationService:
+    """
+    asyncio HTTP front end with a bounded request queue, a batcher and a process pool.
+
+    Args:
+        workers (int): Pool size; also the number of batches in flight at once.
+        queue_size (int): Requests allowed to wait before 503 is returned.
+        batch_window (float): Seconds the batcher waits to fill a batch.
+        batch_max_jobs (int): Jobs per batch at most.
+        small_job (int): Requests with at most this many processes are batchable;
+                         larger ones are dispatched alone.
+    """
+
+    def __init__(self, workers=None, queue_size=256, batch_window=0.005, batch_max_jobs=32, small_job=2000):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.batch_window = batch_window
+        self.batch_max_jobs = batch_max_jobs
+        self.small_job = small_job
+        self.queue = None
+        self.pool = None
+        self.slots = None
+        self.started = time.time()
+        self.counters = {"requests": 0, "completed": 0, "failed": 0, "rejected": 0,
+                         "batches": 0, "batched_jobs": 0, "in_flight_batches": 0}
+        self.latency = QuantileSketch()
+
+    # -------- Batching --------
+
+    async def batcher(self):
+        loop = asyncio.get_running_loop()
+        held = None
+        while True:
+            # A large job taken from the queue while filling a batch is the next batch
+            first = held if held is not None else await self.queue.get()
+            held = None
+            batch = [first]
+            if len(first[0]["processes"]) <= self.small_job:
+                deadline = loop.time() + self.batch_window
+                while len(batch) < self.batch_max_jobs:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if len(item[0]["processes"]) > self.small_job:
+                        held = item
+                        break
+                    batch.append(item)
+            # Nothing more leaves the queue until a pool slot is free, so waiting jobs stay bounded
+            await self.slots.acquire()
+            asyncio.ensure_future(self.dispatch(batch))
+
+    async def dispatch(self, batch):
+        """Run a batch on the pool; the caller holds one of `slots`, released here."""
+        loop = asyncio.get_running_loop()
+        self.counters["batches"] += 1
+        self.counters["batched_jobs"] += len(batch)
+        self.counters["in_flight_batches"] += 1
+        try:
+            results = await loop.run_in_executor(self.pool, run_batch, [job for job, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result({"error": f"{type(e).__name__}: {e}"})
+        finally:
+            self.counters["in_flight_batches"] -= 1
+            self.slots.release()
+
+    # -------- HTTP --------
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, HTTPStatus.BAD_REQUEST, {"error": "malformed request line"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self.respond(writer, HTTPStatus.BAD_REQUEST, {"error": "invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self.respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close") or \
+                             headers.get("connection", "").lower() == "keep-alive"
+                status, payload, extra = await self.route(method, target.split("?", 1)[0], body)
+                await self.respond(writer, status, payload, keep_alive, extra)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive, extra=None):
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        head = [f"HTTP/1.1 {status.value} {status.phrase}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(body)}",
+                f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        for name, value in (extra or {}).items():
+            head.append(f"{name}: {value}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+        await writer.drain()
+
+    async def route(self, method, path, body):
+        if path == "/health" and method == "GET":
+            return HTTPStatus.OK, {"status": "ok", "workers": self.workers,
+                                   "queue_depth": self.queue.qsize(), "queue_size": self.queue_size}, None
+        if path == "/metrics" and method == "GET":
+            return HTTPStatus.OK, self.service_metrics(), None
+        if path == "/simulate":
+            if method != "POST":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use POST"}, {"Allow": "POST"}
+            return await self.simulate(body)
+        return HTTPStatus.NOT_FOUND, {"error": f"no route for {method} {path}"}, None
+
+    async def simulate(self, body):
+        self.counters["requests"] += 1
+        started = time.perf_counter()
+        try:
+            job = parse_job(body)
+        except (ValueError, TypeError) as e:
+            self.counters["failed"] += 1
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}, None
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            self.counters["rejected"] += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "queue full, retry later"}, {"Retry-After": "1"}
+        result = await future
+        self.latency.add(time.perf_counter() - started)
+        if "error" in result:
+            self.counters["failed"] += 1
+            return HTTPStatus.UNPROCESSABLE_ENTITY, result, None
+        self.counters["completed"] += 1
+        return HTTPStatus.OK, result, None
+
+    def service_metrics(self):
+        metrics = dict(self.counters)
+        metrics.update({
+            "uptime": time.time() - self.started,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue_size,
+            "workers": self.workers,
+            "avg_batch_size": self.counters["batched_jobs"] / self.counters["batches"] if self.counters["batches"] else 0.0,
+            "latency_avg": self.latency.mean(),
+            "latency_p50": self.latency.quantile(0.50),
+            "latency_p95": self.latency.quantile(0.95),
+            "latency_p99": self.latency.quantile(0.99),
+        })
+        return metrics
+
+    # -------- Lifecycle --------
+
+    async def serve(self, host="127.0.0.1", port=8080, ready=None):
+        """Serve until cancelled. `ready`, if given, is called with the bound port."""
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.slots = asyncio.Semaphore(self.workers)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        batcher = asyncio.ensure_future(self.batcher())
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=1 << 20)
+        if ready:
+            ready(server.sockets[0].getsockname()[1])
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OS Scheduler simulation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--queue-size", type=int, default=256, help="waiting requests before 503")
+    parser.add_argument("--batch-window-ms", type=float, default=5.0)
+    parser.add_argument("--batch-max-jobs", type=int, default=32)
+    parser.add_argument("--small-job", type=int, default=2000, help="largest request (processes) that is batched")
+    args = parser.parse_args(argv)
+
+    service = SimulationService(args.workers, args.queue_size, args.batch_window_ms / 1000.0,
+                                args.batch_max_jobs, args.small_job)
+    print(f"Serving on http://{args.host}:{args.port} with {service.workers} workers")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
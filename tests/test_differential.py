@@ -0,0 +1,11 @@
+"""Seeded differential fuzz of every engine against the frozen reference algorithms."""
+import pytest
+
+from utils.differential import ENGINES, fuzz
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_engine_matches_reference(engine):
+    result = fuzz(engines=[engine], iterations=200, seed=20240601)
+    assert result["cases"] > 0
+    assert result["failures"] == [], result["failures"][0]
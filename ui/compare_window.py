@@ -0,0 +1,79 @@
+"""
+Side-by-side results window for "Compare All"
+"""
+import math
+from tkinter import *
+from tkinter import ttk
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from utils.compare import best_per_metric, NOT_RANKED
+from utils.gantt_chart import draw_gantt, pid_colors, sort_pids
+
+# Row labels for the metrics table, in display order
+METRIC_LABELS = [
+    ("total_time", "Makespan"),
+    ("cpu_util", "CPU util %"),
+    ("throughput", "Throughput"),
+    ("avg_wait", "Avg waiting"),
+    ("p95_wait", "p95 waiting"),
+    ("p99_wait", "p99 waiting"),
+    ("avg_turn", "Avg turnaround"),
+    ("p95_turn", "p95 turnaround"),
+    ("avg_norm_turn", "Avg norm. turnaround"),
+    ("avg_response", "Avg response"),
+    ("p95_response", "p95 response"),
+    ("p99_response", "p99 response"),
+]
+
+BEST_COLOR = "#c8f0c8"
+
+
+def show_comparison(master, results, params, wall_time):
+    """
+    Open a window with one small Gantt chart per algorithm and a metrics
+    table in which the best value of every metric is highlighted.
+    """
+    win = Toplevel(master)
+    win.title("Algorithm Comparison")
+    win.geometry("1400x900")
+
+    # Small multiples
+    n = len(results)
+    cols = min(3, n)
+    rows = math.ceil(n / cols)
+    figure = Figure(figsize=(4 * cols, 2.6 * rows), dpi=100)
+    plot_frame = ttk.LabelFrame(win, text="Gantt Charts", padding=6)
+    plot_frame.pack(fill=BOTH, expand=True, padx=8, pady=8)
+    canvas = FigureCanvasTkAgg(figure, master=plot_frame)
+    canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+    # One color per pid across all charts
+    color_map = pid_colors(sort_pids({pid for res in results.values() for pid in res["stats"]}))
+    for idx, (algo, res) in enumerate(results.items(), 1):
+        ax = figure.add_subplot(rows, cols, idx)
+        draw_gantt(ax, res["timeline"], res["stats"], color_map)
+        ax.set_title(f"{algo} ({res['elapsed']*1000:.0f} ms)", fontsize=9)
+        ax.tick_params(labelsize=7)
+        ax.set_xlabel("")
+    figure.tight_layout()
+    canvas.draw()
+
+    # Metrics table: one column per algorithm, best cell per row highlighted
+    table = ttk.LabelFrame(win, text=f"Metrics (wall time {wall_time:.2f}s, "
+                                     f"quantum {params.get('quantum')}, context switch {params.get('context_switch')})",
+                           padding=6)
+    table.pack(fill=X, padx=8, pady=(0, 8))
+    best = best_per_metric(results)
+    Label(table, text="Metric", font=("Consolas", 10, "bold"), anchor="w").grid(row=0, column=0, sticky="we")
+    for col, algo in enumerate(results, 1):
+        Label(table, text=algo, font=("Consolas", 10, "bold"), width=12).grid(row=0, column=col)
+    for row, (key, label) in enumerate(METRIC_LABELS, 1):
+        Label(table, text=label, font=("Consolas", 10), anchor="w").grid(row=row, column=0, sticky="we")
+        for col, (algo, res) in enumerate(results.items(), 1):
+            value = res["metrics"].get(key)
+            text = "-" if value is None else f"{value:.3f}"
+            winner = key not in NOT_RANKED and algo in best.get(key, ())
+            Label(table, text=text, font=("Consolas", 10), width=12,
+                  bg=BEST_COLOR if winner else table.winfo_toplevel().cget("bg")).grid(row=row, column=col, sticky="we")
+    return win
@@ -12,7 +12,7 @@ class ControlsFrame:
 
         ttk.Label(sched_frame, text="Algorithm:").grid(row=0, column=0, sticky="w")
         self.algorithm_var = StringVar(value="SELECT")
-        ttk.OptionMenu(sched_frame, self.algorithm_var, "SELECT", "SJF", "HPF", "FCFS", "RR", "SRTN", "MLFQ").grid(row=0, column=1, sticky="w", padx=(6,12))
+        ttk.OptionMenu(sched_frame, self.algorithm_var, "SELECT", "SJF", "HPF", "FCFS", "RR", "SRTN", "MLFQ", "FAIR").grid(row=0, column=1, sticky="w", padx=(6,12))
 
         ttk.Label(sched_frame, text="Quantum:").grid(row=1, column=0, sticky="w", pady=(4,0))
         self.quantum_var = StringVar(value="1")
@@ -22,6 +22,19 @@ class ControlsFrame:
         self.context_var = StringVar(value="0")
         ttk.Entry(sched_frame, textvariable=self.context_var, width=8).grid(row=2, column=1, sticky="w", padx=(6,12), pady=(4,0))
 
+        ttk.Button(sched_frame, text="⚙ Auto-tune", command=lambda: app.auto_tune()).grid(row=3, column=0, columnspan=2, sticky="w", pady=(6,0))
+
+        # -------- Compare All --------
+        cmp_frame = ttk.LabelFrame(parent, text="Compare Algorithms", padding=10)
+        cmp_frame.pack(fill=X, pady=(0,10))
+
+        self.compare_vars = {}
+        for idx, name in enumerate(("SJF", "HPF", "FCFS", "RR", "SRTN", "MLFQ", "FAIR")):
+            var = BooleanVar(value=True)
+            ttk.Checkbutton(cmp_frame, text=name, variable=var).grid(row=idx // 3, column=idx % 3, sticky="w", padx=(0,8))
+            self.compare_vars[name] = var
+        ttk.Button(cmp_frame, text="⇶ Compare All", command=lambda: app.compare_all()).grid(row=3, column=0, columnspan=3, pady=(6,0))
+
         # -------- MLFQ Settings --------
         mlfq_frame = ttk.LabelFrame(parent, text="MLFQ Settings", padding=10)
         mlfq_frame.pack(fill=X, pady=(0,10))
@@ -34,6 +47,10 @@ class ControlsFrame:
         self.mlfq_quanta_var = StringVar(value="1,2,4")
         ttk.Entry(mlfq_frame, textvariable=self.mlfq_quanta_var, width=16).grid(row=1, column=1, sticky="w", padx=(6,12), pady=(4,0))
 
+        ttk.Label(mlfq_frame, text="Aging threshold:").grid(row=2, column=0, sticky="w", pady=(4,0))
+        self.mlfq_aging_var = StringVar(value="10")
+        ttk.Entry(mlfq_frame, textvariable=self.mlfq_aging_var, width=8).grid(row=2, column=1, sticky="w", padx=(6,12), pady=(4,0))
+
         # -------- Input Generator --------
         gen_frame = ttk.LabelFrame(parent, text="Input Generator", padding=10)
         gen_frame.pack(fill=X, pady=(0,10))
@@ -77,6 +94,8 @@ class ControlsFrame:
         ttk.Button(io_frame, text="⟲ Reset", command=lambda: app.reset_all()).grid(row=2, column=1)
         ttk.Button(io_frame, text="📤 Export Input", command=lambda: app.export_input()).grid(row=3, column=0, pady=(6,0))
         ttk.Button(io_frame, text="📄 Load Sample", command=lambda: app.load_sample_input()).grid(row=3, column=1, pady=(6,0))
+        ttk.Button(io_frame, text="📈 Load Trace", command=lambda: app.load_trace_file()).grid(row=4, column=0, pady=(6,0))
+        ttk.Button(io_frame, text="⏯ Playback", command=lambda: app.playback()).grid(row=4, column=1, pady=(6,0))
 
         # -------- Process Table --------
         proc_frame = ttk.LabelFrame(parent, text="Processes Table", padding=10)
@@ -3,17 +3,27 @@ Event handlers for UI interactions
 """
 from tkinter import *
 from tkinter import messagebox, filedialog
-from datetime import datetime
+import sys
 import time
-import random
+import threading
 
-from utils.gantt_chart import plot_gantt
+from utils.gantt_chart import draw_gantt, draw_telemetry
 from utils.metrics import compute_metrics, show_stats_summary
+from utils.timeline import segment_counts
+from utils.compare import compare_all
+from utils.file_io import format_burst_sequence, parse_burst_sequence
+from utils.report import export_report
+from utils.telemetry import auto_window
+from utils.traces import load_trace
+from utils.tuning import TUNABLE_ALGORITHMS, tune
+from utils.workload import generate_processes
 
 
 class EventHandlers:
     def __init__(self, app):
         self.app = app
+        # Auto-tune evaluations, kept for the session (keys include the workload digest)
+        self.tune_cache = {}
 
     def load_input_file(self):
         path = filedialog.askopenfilename(title="Select input file", filetypes=[("Text files","*.txt"), ("All files","*.*")])
@@ -35,12 +45,35 @@ class EventHandlers:
                     burst = float(parts[2])
                     pr = int(parts[3]) if len(parts) >= 4 else 0
                     loaded[pid] = [arrival, burst, pr]
+                    if len(parts) >= 5:
+                        sequence = parse_burst_sequence(parts[4])
+                        loaded[pid] = [arrival, sum(b for b in sequence if not isinstance(b, tuple)), pr, sequence]
             self.app.data = loaded
             self.refresh_tree()
             messagebox.showinfo("Loaded", f"Loaded {len(self.app.data)} processes from file.")
         except Exception as e:
             messagebox.showerror("Load error", f"Failed to load file: {e}")
 
+    def load_trace_file(self):
+        path = filedialog.askopenfilename(title="Select trace file",
+                                          filetypes=[("Traces", "*.txt *.trace *.csv *.gz *.bz2 *.xz"), ("All files","*.*")])
+        if not path:
+            return
+        self.app.path_var.set(path)
+
+        def progress(fraction):
+            self.app.path_var.set(f"Loading {path} ... {fraction*100:.0f}%")
+            self.app.master.update_idletasks()
+
+        try:
+            self.app.data = load_trace(path, progress=progress)
+            self.app.path_var.set(path)
+            self.refresh_tree()
+            messagebox.showinfo("Loaded", f"Loaded {len(self.app.data)} processes from trace.")
+        except Exception as e:
+            self.app.path_var.set(path)
+            messagebox.showerror("Load error", f"Failed to load trace: {e}")
+
     def export_input(self):
         if not self.app.data:
             messagebox.showwarning("No data", "No processes to export.")
@@ -52,8 +85,11 @@ class EventHandlers:
             with open(path, "w") as f:
                 f.write("Process Count : " + str(len(self.app.data)) + "\n")
                 for pid in sorted(self.app.data.keys(), key=lambda x: int(x) if str(x).isdigit() else x):
-                    arr,bus,pr = self.app.data[pid]
-                    f.write(f"{pid}\t{arr}\t{bus}\t{pr}\n")
+                    arr,bus,pr = self.app.data[pid][:3]
+                    if len(self.app.data[pid]) > 3 and self.app.data[pid][3]:
+                        f.write(f"{pid}\t{arr}\t{bus}\t{pr}\t{format_burst_sequence(self.app.data[pid][3])}\n")
+                    else:
+                        f.write(f"{pid}\t{arr}\t{bus}\t{pr}\n")
             messagebox.showinfo("Exported", f"Input exported to {path}")
         except Exception as e:
             messagebox.showerror("Export error", str(e))
@@ -72,7 +108,7 @@ class EventHandlers:
         for r in self.app.tree.get_children():
             self.app.tree.delete(r)
         for pid in sorted(self.app.data.keys(), key=lambda x: int(x) if str(x).isdigit() else x):
-            arr,bus,pr = self.app.data[pid]
+            arr,bus,pr = self.app.data[pid][:3]
             self.app.tree.insert("", "end", values=(str(pid), str(arr), str(bus), str(pr)))
 
     def add_process_from_entries(self):
@@ -129,8 +165,10 @@ class EventHandlers:
         self.app.last_stats = {}
         self.app.last_timeline = []
         self.refresh_tree()
-        self.app.ax.clear()
-        self.app.canvas.draw()
+        if self.app.canvas is not None:
+            self.app.ax.clear()
+            draw_telemetry(self.app.telemetry_ax, None, self.app.queue_ax)
+            self.app.canvas.draw()
         self.app.stats_text.delete("1.0", END)
         self.app.path_var.set("No file selected")
         messagebox.showinfo("Reset", "Application state reset.")
@@ -143,73 +181,63 @@ class EventHandlers:
             burst_min, burst_max = map(float, controls.gen_burst_var.get().split(","))
             pr_min, pr_max = map(int, controls.gen_prio_var.get().split(","))
             seed = controls.gen_seed_var.get()
-            if seed:
-                random.seed(int(seed))
-            else:
-                random.seed(time.time())
-            generated = {}
-            for i in range(1, n+1):
-                pid = str(i)
-                arrival = round(random.uniform(arr_min, arr_max), 2)
-                burst = round(random.uniform(burst_min, burst_max), 2)
-                prio = random.randint(pr_min, pr_max)
-                generated[pid] = [arrival, burst, prio]
+            generated = generate_processes(n, (arr_min, arr_max), (burst_min, burst_max), (pr_min, pr_max),
+                                           seed=int(seed) if seed else None)
             self.app.data = generated
             self.refresh_tree()
             messagebox.showinfo("Generated", f"{n} processes generated successfully.")
         except Exception as e:
             messagebox.showerror("Generation error", f"Failed to generate processes:\n{e}")
 
+    def read_run_params(self):
+        """Collect algorithm parameters from the controls, falling back to defaults on bad input"""
+        try:
+            context = float(self.app.context_var.get())
+        except Exception:
+            context = 0.0
+        try:
+            quantum = float(self.app.quantum_var.get())
+        except Exception:
+            quantum = 1.0
+        levels = max(1, int(self.app.mlfq_levels_var.get()) if self.app.mlfq_levels_var.get().isdigit() else 3)
+        raw = self.app.mlfq_quanta_var.get().split(",")
+        quanta = []
+        for r in raw:
+            try:
+                quanta.append(float(r.strip()))
+            except Exception:
+                pass
+        while len(quanta) < levels:
+            quanta.append(quanta[-1] if quanta else 1.0)
+        try:
+            aging = float(self.app.mlfq_aging_var.get())
+        except Exception:
+            aging = 10.0
+        return {"context_switch": context, "quantum": quantum, "levels": levels, "quanta_list": quanta,
+                "aging_threshold": aging}
+
     def run_and_plot(self):
         if not self.app.data:
             messagebox.showerror("No data", "Please load or add processes first.")
             return
         try:
             # Lazy import to break circular dependency
-            from scheduler import Scheduler
+            from scheduler import Scheduler, ALGORITHMS
         except ImportError as e:
             messagebox.showerror("Internal Error", f"Cannot load Scheduler:\n{e}")
             return
 
         algo = self.app.algorithm_var.get()
-        if algo not in ("HPF","FCFS","RR","SRTN","MLFQ","SJF"):
+        if algo not in ALGORITHMS:
             messagebox.showerror("Select algorithm", "Please select an algorithm.")
             return
-        try:
-            context = float(self.app.context_var.get())
-        except Exception:
-            context = 0.0
-        try:
-            quantum = float(self.app.quantum_var.get())
-        except Exception:
-            quantum = 1.0
+        params = self.read_run_params()
+        context, quantum = params["context_switch"], params["quantum"]
 
         sched = Scheduler(self.app.data)
-        timeline = []
-        stats = {}
         try:
-            if algo == "FCFS":
-                timeline, stats = sched.fcfs(context_switch=context)
-            elif algo == "HPF":
-                timeline, stats = sched.hpf(context_switch=context)
-            elif algo == "RR":
-                timeline, stats = sched.rr(quantum=quantum, context_switch=context)
-            elif algo == "SRTN":
-                timeline, stats = sched.srtn(quantum=quantum, context_switch=context)
-            elif algo == "SJF":
-                timeline, stats = sched.sjf(context_switch=context)
-            elif algo == "MLFQ":
-                levels = max(1, int(self.app.mlfq_levels_var.get()) if self.app.mlfq_levels_var.get().isdigit() else 3)
-                raw = self.app.mlfq_quanta_var.get().split(",")
-                quanta = []
-                for r in raw:
-                    try:
-                        quanta.append(float(r.strip()))
-                    except Exception:
-                        pass
-                while len(quanta) < levels:
-                    quanta.append(quanta[-1] if quanta else 1.0)
-                timeline, stats = sched.mlfq(levels=levels, quanta_list=quanta, context_switch=context)
+            timeline, stats = sched.run(algo, telemetry_window=auto_window(self.app.data, context), aging_log=sys.stdout,
+                                        **params)
         except Exception as e:
             messagebox.showerror("Algorithm error", f"Error while running algorithm:\n{e}")
             return
@@ -217,44 +245,119 @@ class EventHandlers:
         self.app.last_timeline = timeline
         self.app.last_stats = stats
 
-        plot_gantt(self.app.ax, self.app.canvas, timeline, stats)
-        show_stats_summary(self.app.stats_text, self.app.last_stats, algo, context, quantum)
+        self.app.ensure_plot()
+        draw_gantt(self.app.ax, timeline, stats)
+        draw_telemetry(self.app.telemetry_ax, timeline.telemetry, self.app.queue_ax)
+        self.app.canvas.draw()
+        show_stats_summary(self.app.stats_text, self.app.last_stats, algo, context, quantum, timeline)
+
+    def compare_all(self):
+        if not self.app.data:
+            messagebox.showerror("No data", "Please load or add processes first.")
+            return
+        algorithms = [name for name, var in self.app.controls_frame.compare_vars.items() if var.get()]
+        if not algorithms:
+            messagebox.showerror("Select algorithms", "Please tick at least one algorithm to compare.")
+            return
+        params = self.read_run_params()
+        data = dict(self.app.data)
+
+        # Runs happen in worker processes; a helper thread waits on them so the UI stays responsive
+        outcome = {}
+
+        def work():
+            started = time.perf_counter()
+            try:
+                outcome["results"] = compare_all(data, algorithms, params)
+            except Exception as e:
+                outcome["error"] = e
+            outcome["wall"] = time.perf_counter() - started
+
+        worker = threading.Thread(target=work, daemon=True)
+        worker.start()
+        self.app.path_var.set(f"Comparing {len(algorithms)} algorithms ...")
+
+        def poll():
+            if worker.is_alive():
+                self.app.master.after(100, poll)
+                return
+            self.app.path_var.set("Comparison finished")
+            if "error" in outcome:
+                messagebox.showerror("Algorithm error", f"Error while comparing algorithms:\n{outcome['error']}")
+                return
+            from ui.compare_window import show_comparison
+            show_comparison(self.app.master, outcome["results"], params, outcome["wall"])
+
+        poll()
+
+    def auto_tune(self):
+        if not self.app.data:
+            messagebox.showerror("No data", "Please load or add processes first.")
+            return
+        algo = self.app.algorithm_var.get()
+        if algo not in TUNABLE_ALGORITHMS:
+            messagebox.showerror("Select algorithm", "Auto-tune works for RR and MLFQ; please select one of them.")
+            return
+        context = self.read_run_params()["context_switch"]
+        data = dict(self.app.data)
+
+        # Same pattern as compare_all: a helper thread waits on the worker processes
+        outcome = {}
+
+        def work():
+            try:
+                outcome["result"] = tune(data, algo, context_switch=context, cache=self.tune_cache)
+            except Exception as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=work, daemon=True)
+        worker.start()
+        self.app.path_var.set(f"Tuning {algo} ...")
+
+        def poll():
+            if worker.is_alive():
+                self.app.master.after(100, poll)
+                return
+            if "error" in outcome:
+                self.app.path_var.set("Auto-tune failed")
+                messagebox.showerror("Auto-tune error", f"Error while tuning:\n{outcome['error']}")
+                return
+            result = outcome["result"]
+            params = result["params"]
+            if algo == "RR":
+                self.app.quantum_var.set(f"{params['quantum']:g}")
+            else:
+                self.app.mlfq_levels_var.set(str(params["levels"]))
+                self.app.mlfq_quanta_var.set(",".join(f"{q:g}" for q in params["quanta_list"]))
+                self.app.mlfq_aging_var.set(f"{params['aging_threshold']:g}")
+            self.app.path_var.set(f"Auto-tune: p95 wait {result['value']:.3f} "
+                                  f"(default {result['default']['metrics']['p95_wait']:.3f}), "
+                                  f"{result['evaluations']} runs in {result['elapsed']:.1f}s")
+            # Show the tuned schedule
+            self.run_and_plot()
+
+        poll()
+
+    def playback(self):
+        if not self.app.last_stats:
+            messagebox.showwarning("No run", "Please run a scheduling simulation first.")
+            return
+        from ui.playback_window import show_playback
+        show_playback(self.app.master, self.app.last_timeline, self.app.last_stats, self.app.algorithm_var.get())
 
     def write_report(self):
         if not self.app.last_stats:
             messagebox.showwarning("No run", "Please run a scheduling simulation first.")
             return
         path = self.app.output_path_var.get() or "Out.txt"
+        header = {
+            "Algorithm": self.app.algorithm_var.get(),
+            "Quantum": self.app.quantum_var.get(),
+            "Context-switch": self.app.context_var.get(),
+            "Segments": "%d (raw %d)" % segment_counts(self.app.last_timeline),
+        }
         try:
-            with open(path, "w") as f:
-                f.write("OS Scheduler Simulation Report\n")
-                f.write("Generated: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n")
-                f.write(f"Algorithm: {self.app.algorithm_var.get()}\n")
-                f.write(f"Quantum: {self.app.quantum_var.get()}  Context-switch: {self.app.context_var.get()}\n")
-                f.write("-"*80 + "\n")
-                f.write(f"{'PID':>4} {'Arrival':>8} {'Burst':>8} {'Pr':>4} {'Completion':>10} {'Waiting':>9} {'Turnaround':>11} {'N-Turn':>8}\n")
-                f.write("-"*80 + "\n")
-                pcount = len(self.app.last_stats)
-                earliest_arrival = min(v['arrival'] for v in self.app.last_stats.values())
-                latest_completion = max(v['completion'] for v in self.app.last_stats.values())
-                total_time = latest_completion - earliest_arrival if pcount > 0 else 0.0
-                cpu_time = sum(v['burst'] for v in self.app.last_stats.values())
-                for pid, v in sorted(self.app.last_stats.items(), key=lambda kv: int(kv[0]) if str(kv[0]).isdigit() else kv[0]):
-                    f.write(f"{str(pid):>4} {v['arrival']:8.2f} {v['burst']:8.2f} {v['priority']:4d} {v['completion']:10.2f} {v['waiting']:9.2f} {v['turnaround']:11.2f} {v['norm_turnaround']:8.2f}\n")
-                f.write("-"*80 + "\n")
-                total_wait = sum(v['waiting'] for v in self.app.last_stats.values())
-                total_turn = sum(v['turnaround'] for v in self.app.last_stats.values())
-                avg_wait = total_wait / pcount if pcount > 0 else 0.0
-                avg_turn = total_turn / pcount if pcount > 0 else 0.0
-                cpu_util = (cpu_time / total_time * 100.0) if total_time > 0 else 0.0
-                throughput = pcount / total_time if total_time > 0 else 0.0
-                f.write(f"Processes: {pcount}\n")
-                f.write(f"Total time (makespan): {total_time:.4f}\n")
-                f.write(f"CPU busy time: {cpu_time:.4f}\n")
-                f.write(f"CPU utilization: {cpu_util:.2f}%\n")
-                f.write(f"Avg waiting time: {avg_wait:.4f}\n")
-                f.write(f"Avg turnaround time: {avg_turn:.4f}\n")
-                f.write(f"Throughput: {throughput:.6f} processes/unit time\n")
-            messagebox.showinfo("Saved", f"Report saved to {path}")
+            written = export_report(path, self.app.last_stats, self.app.last_timeline, header=header)
+            messagebox.showinfo("Saved", "Report saved to " + ", ".join(written))
         except Exception as e:
             messagebox.showerror("Save error", f"Failed to write report:\n{e}")
@@ -1,11 +1,9 @@
+import threading
 from tkinter import *
 from tkinter import ttk
 from ui.controls import ControlsFrame
 from ui.events import EventHandlers
-from utils.gantt_chart import plot_gantt
-from utils.metrics import show_stats_summary
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from utils import startup
 
 class SchedulerApp:
     def __init__(self, master):
@@ -27,13 +25,14 @@ class SchedulerApp:
         right_frame = Frame(master)
         right_frame.pack(side=RIGHT, fill=BOTH, expand=True, padx=8, pady=8)
         
-        # Figure & canvas
-        self.figure = Figure(figsize=(7,5), dpi=100)
-        self.ax = self.figure.add_subplot(111)
-        plot_frame = ttk.LabelFrame(right_frame, text="Gantt Chart / Timeline", padding=6)
-        plot_frame.pack(fill=BOTH, expand=True)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=plot_frame)
-        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        # Figure & canvas: created by ensure_plot() once matplotlib is loaded, so the
+        # window appears without waiting for it (see start_preload)
+        self.figure = self.ax = self.canvas = None
+        self.on_plot_ready = None
+        self.plot_frame = ttk.LabelFrame(right_frame, text="Gantt Chart / Timeline", padding=6)
+        self.plot_frame.pack(fill=BOTH, expand=True)
+        self.plot_placeholder = ttk.Label(self.plot_frame, text="Loading chart engine …", anchor="center")
+        self.plot_placeholder.pack(fill=BOTH, expand=True)
         
         # Stats text
         stats_frame = ttk.LabelFrame(right_frame, text="Last Run Statistics", padding=6)
@@ -50,14 +49,66 @@ class SchedulerApp:
         self.context_var      = self.controls_frame.context_var
         self.mlfq_levels_var  = self.controls_frame.mlfq_levels_var
         self.mlfq_quanta_var  = self.controls_frame.mlfq_quanta_var
+        self.mlfq_aging_var   = self.controls_frame.mlfq_aging_var
         self.path_var         = self.controls_frame.path_var
         self.output_path_var  = self.controls_frame.output_path_var
         self.tree             = self.controls_frame.tree
+
+        startup.mark("window built")
+        # Idle callbacks run after the first paint
+        master.after_idle(lambda: master.after(0, self.start_preload))
+
+    # -------- Deferred initialization --------
+
+    def start_preload(self):
+        """Import matplotlib and the algorithms in the background, then build the chart."""
+        startup.mark("window shown")
+
+        def preload():
+            import matplotlib.figure
+            import matplotlib.backends.backend_tkagg
+            from scheduler import preload_algorithms
+            preload_algorithms()
+
+        worker = threading.Thread(target=preload, daemon=True)
+        worker.start()
+
+        def poll():
+            if worker.is_alive():
+                self.master.after(50, poll)
+                return
+            startup.mark("preload finished")
+            self.ensure_plot()
+
+        poll()
+
+    def ensure_plot(self):
+        """Create the figure and canvas now if the preload has not done it yet."""
+        if self.canvas is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self.figure = Figure(figsize=(7,5), dpi=100)
+        # Gantt chart on top, telemetry strip (utilization, ready queue) below it on the same time axis
+        grid = self.figure.add_gridspec(2, 1, height_ratios=(4, 1), hspace=0.35)
+        self.ax = self.figure.add_subplot(grid[0])
+        self.telemetry_ax = self.figure.add_subplot(grid[1], sharex=self.ax)
+        self.queue_ax = self.telemetry_ax.twinx()
+        self.plot_placeholder.destroy()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.plot_frame)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        self.canvas.draw()
+        startup.mark("chart ready")
+        if self.on_plot_ready:
+            self.on_plot_ready()
     
     # Delegate actions to event handlers
     def load_input_file(self):
         self.event_handlers.load_input_file()
     
+    def load_trace_file(self):
+        self.event_handlers.load_trace_file()
+    
     def export_input(self):
         self.event_handlers.export_input()
     
@@ -82,5 +133,14 @@ class SchedulerApp:
     def run_and_plot(self):
         self.event_handlers.run_and_plot()
     
+    def compare_all(self):
+        self.event_handlers.compare_all()
+
+    def auto_tune(self):
+        self.event_handlers.auto_tune()
+    
+    def playback(self):
+        self.event_handlers.playback()
+    
     def write_report(self):
         self.event_handlers.write_report()
\ No newline at end of file
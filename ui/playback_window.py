@@ -0,0 +1,273 @@
+"""
+Animated timeline playback for the last run
+"""
+import bisect
+import time
+from tkinter import *
+from tkinter import ttk
+
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from utils.gantt_chart import CS_COLOR, CS_LANE, IDLE_COLOR, IDLE_LANE, ROW_HEIGHT, gantt_layout
+from utils.timeline import expand_timeline
+
+# Frame interval in milliseconds (about 30 fps)
+FRAME_MS = 33
+
+# Playback speed multipliers offered in the speed menu
+SPEEDS = ("0.25x", "0.5x", "1x", "2x", "4x", "8x", "16x", "64x")
+
+# Seconds a whole run takes at 1x
+BASE_SECONDS = 20.0
+
+# Processes listed per queue in the side panel
+PANEL_LIMIT = 24
+
+
+class PlaybackWindow:
+    """
+    Plays a timeline back with matplotlib blitting.
+
+    The axes, grid and labels are drawn once and cached as a background.
+    Every frame draws only the segments that finished since the previous
+    frame into that background, re-caches it, then draws the in-progress
+    segment and the playhead on top and blits the axes. Per-frame cost
+    depends on the new segments, not on the total timeline length.
+
+    The side panel replays arrivals, completions and dispatches from the
+    same cursor, showing the running process, the ready queue and, for
+    MLFQ, the ready processes grouped by the level they last ran at.
+    """
+
+    def __init__(self, master, timeline, stats, algorithm=""):
+        self.segments = list(expand_timeline(timeline))
+        self.stats = stats
+        self.win = Toplevel(master)
+        self.win.title(f"Playback — {algorithm}" if algorithm else "Playback")
+        self.win.geometry("1400x800")
+
+        self.pids, self.pid_to_y, self.color_map = gantt_layout(self.segments)
+        self.has_levels = any("level" in seg for seg in self.segments)
+        self.t0 = min((seg["start"] for seg in self.segments), default=0.0)
+        self.t_end = max((seg["start"] + seg["duration"] for seg in self.segments), default=0.0)
+        self.seg_ends = [seg["start"] + seg["duration"] for seg in self.segments]
+        self.arrivals = sorted((v["arrival"], pid) for pid, v in stats.items())
+        self.completions = sorted((v["completion"], pid) for pid, v in stats.items())
+
+        self.playing = False
+        self.speed_var = StringVar(value="1x")
+        self._build_ui()
+        self.reset()
+        self.win.protocol("WM_DELETE_WINDOW", self.close)
+
+    # -------- Layout --------
+
+    def _build_ui(self):
+        bar = Frame(self.win)
+        bar.pack(side=TOP, fill=X, padx=8, pady=(8, 0))
+        self.play_button = ttk.Button(bar, text="▶ Play", command=self.toggle)
+        self.play_button.pack(side=LEFT)
+        ttk.Button(bar, text="⏮ Restart", command=self.restart).pack(side=LEFT, padx=(6, 0))
+        ttk.Label(bar, text="Speed:").pack(side=LEFT, padx=(12, 4))
+        ttk.OptionMenu(bar, self.speed_var, "1x", *SPEEDS).pack(side=LEFT)
+        self.clock_var = StringVar()
+        ttk.Label(bar, textvariable=self.clock_var, font=("Consolas", 10)).pack(side=LEFT, padx=(16, 0))
+        self.fps_var = StringVar()
+        ttk.Label(bar, textvariable=self.fps_var, font=("Consolas", 10)).pack(side=RIGHT)
+
+        body = Frame(self.win)
+        body.pack(fill=BOTH, expand=True, padx=8, pady=8)
+
+        panel = ttk.LabelFrame(body, text="Scheduler State", padding=6)
+        panel.pack(side=RIGHT, fill=Y, padx=(8, 0))
+        self.panel_text = Text(panel, width=34, wrap="word", font=("Consolas", 10))
+        self.panel_text.pack(fill=BOTH, expand=True)
+
+        plot_frame = ttk.LabelFrame(body, text="Timeline", padding=6)
+        plot_frame.pack(side=LEFT, fill=BOTH, expand=True)
+        self.figure = Figure(figsize=(9, 6), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=plot_frame)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+
+        # Static part of the chart: drawn once, everything else is blitted on top
+        ax = self.ax
+        ax.set_xlim(max(0, self.t0 - 0.5), self.t_end + 0.5)
+        ax.set_ylim(-14, max(10 * len(self.pids), 10))
+        ax.set_yticks([self.pid_to_y[pid] + ROW_HEIGHT / 2 for pid in self.pids])
+        ax.set_yticklabels([str(pid) for pid in self.pids])
+        ax.set_xlabel("Time")
+        ax.set_title("Gantt Chart (playback)")
+        ax.grid(axis='x', linestyle='--', alpha=0.4)
+
+        self.partial = PolyCollection([], animated=True, edgecolor="black", linewidth=0.5)
+        self.playhead = ax.axvline(self.t0, color="red", linewidth=1, animated=True)
+        ax.add_collection(self.partial)
+        self.drawn = []
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # -------- Geometry --------
+
+    def _bar(self, seg, end):
+        """Rectangle vertices and color for `seg` cut off at time `end`."""
+        if seg["type"] == "proc":
+            y, h = self.pid_to_y[seg["pid"]], ROW_HEIGHT
+            color = self.color_map.get(seg["pid"], (0.2, 0.6, 0.8))
+        elif seg["type"] == "idle":
+            (y, h), color = IDLE_LANE, IDLE_COLOR
+        else:
+            (y, h), color = CS_LANE, CS_COLOR
+        x0 = seg["start"]
+        return [(x0, y), (x0, y + h), (end, y + h), (end, y)], color
+
+    # -------- Blitting --------
+
+    def _on_draw(self, event):
+        # A full redraw (first show, resize) drops animated artists: put finished segments back
+        for coll in self.drawn:
+            self.ax.draw_artist(coll)
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _render(self, t):
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+
+        # Segments finished since the last frame become part of the background
+        done = bisect.bisect_right(self.seg_ends, t)
+        if done > self.seg_cursor:
+            verts, colors = [], []
+            for seg in self.segments[self.seg_cursor:done]:
+                v, c = self._bar(seg, seg["start"] + seg["duration"])
+                verts.append(v)
+                colors.append(c)
+            coll = PolyCollection(verts, facecolors=colors, edgecolor="black", linewidth=0.5, animated=True)
+            self.ax.add_collection(coll)
+            self.ax.draw_artist(coll)
+            self.drawn.append(coll)
+            self.seg_cursor = done
+            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+        # In-progress segment and playhead are redrawn every frame
+        if self.seg_cursor < len(self.segments) and self.segments[self.seg_cursor]["start"] < t:
+            v, c = self._bar(self.segments[self.seg_cursor], t)
+            self.partial.set_verts([v])
+            self.partial.set_facecolor([c])
+        else:
+            self.partial.set_verts([])
+        self.ax.draw_artist(self.partial)
+        self.playhead.set_xdata([t, t])
+        self.ax.draw_artist(self.playhead)
+        self.canvas.blit(self.ax.bbox)
+
+    # -------- Scheduler state panel --------
+
+    def _update_panel(self, t):
+        while self.arr_cursor < len(self.arrivals) and self.arrivals[self.arr_cursor][0] <= t:
+            self.present.add(self.arrivals[self.arr_cursor][1])
+            self.arr_cursor += 1
+        while self.done_cursor < len(self.completions) and self.completions[self.done_cursor][0] <= t:
+            self.present.discard(self.completions[self.done_cursor][1])
+            self.done_cursor += 1
+        while self.level_cursor < len(self.segments) and self.segments[self.level_cursor]["start"] <= t:
+            seg = self.segments[self.level_cursor]
+            if seg["type"] == "proc" and "level" in seg:
+                self.levels[seg["pid"]] = seg["level"]
+            self.level_cursor += 1
+
+        current = self.segments[self.level_cursor - 1] if self.level_cursor else None
+        running = None
+        if current and current["type"] == "proc" and current["start"] + current["duration"] > t:
+            running = current["pid"]
+        ready = sorted((pid for pid in self.present if pid != running),
+                       key=lambda p: (self.stats[p]["arrival"], int(p) if str(p).isdigit() else 0))
+
+        lines = [f"Running: {running if running is not None else '-'}"
+                 + (f" (level {self.levels.get(running, 0)})" if running is not None and self.has_levels else ""),
+                 f"Ready: {len(ready)}   Finished: {self.done_cursor}/{len(self.completions)}", ""]
+        if self.has_levels:
+            by_level = {}
+            for pid in ready:
+                by_level.setdefault(self.levels.get(pid, 0), []).append(pid)
+            for level in sorted(by_level):
+                lines.append(f"Level {level} ({len(by_level[level])}): {self._pid_list(by_level[level])}")
+        else:
+            lines.append(f"Ready queue: {self._pid_list(ready)}")
+        self.panel_text.delete("1.0", END)
+        self.panel_text.insert(END, "\n".join(lines))
+
+    @staticmethod
+    def _pid_list(pids):
+        shown = " ".join(str(p) for p in pids[:PANEL_LIMIT])
+        return shown + (f" … (+{len(pids) - PANEL_LIMIT})" if len(pids) > PANEL_LIMIT else "")
+
+    # -------- Playback control --------
+
+    def reset(self):
+        for coll in self.drawn:
+            coll.remove()
+        self.drawn = []
+        self.seg_cursor = 0
+        self.level_cursor = 0
+        self.arr_cursor = 0
+        self.done_cursor = 0
+        self.present = set()
+        self.levels = {}
+        self.t = self.t0
+        self.canvas.draw()
+        self._render(self.t)
+        self._update_panel(self.t)
+        self.clock_var.set(f"t = {self.t:.2f} / {self.t_end:.2f}")
+
+    def restart(self):
+        self.reset()
+        if not self.playing:
+            self.toggle()
+
+    def toggle(self):
+        self.playing = not self.playing
+        self.play_button.config(text="⏸ Pause" if self.playing else "▶ Play")
+        if self.playing:
+            if self.t >= self.t_end:
+                self.reset()
+            self.last_tick = time.perf_counter()
+            self.frames, self.fps_since = 0, self.last_tick
+            self.win.after(FRAME_MS, self.tick)
+
+    def tick(self):
+        if not self.playing or not self.win.winfo_exists():
+            return
+        now = time.perf_counter()
+        speed = float(self.speed_var.get().rstrip("x"))
+        rate = max(self.t_end - self.t0, 1e-9) / BASE_SECONDS * speed
+        self.t = min(self.t_end, self.t + (now - self.last_tick) * rate)
+        self.last_tick = now
+
+        self._render(self.t)
+        self._update_panel(self.t)
+        self.clock_var.set(f"t = {self.t:.2f} / {self.t_end:.2f}")
+
+        self.frames += 1
+        if now - self.fps_since >= 1.0:
+            self.fps_var.set(f"{self.frames / (now - self.fps_since):.0f} fps")
+            self.frames, self.fps_since = 0, now
+
+        if self.t >= self.t_end:
+            self.playing = False
+            self.play_button.config(text="▶ Play")
+            return
+        # Schedule the next frame relative to this one so slow frames do not accumulate delay
+        spent = int((time.perf_counter() - now) * 1000)
+        self.win.after(max(1, FRAME_MS - spent), self.tick)
+
+    def close(self):
+        self.playing = False
+        self.win.destroy()
+
+
+def show_playback(master, timeline, stats, algorithm=""):
+    """Open a playback window for a timeline and its stats."""
+    return PlaybackWindow(master, timeline, stats, algorithm)
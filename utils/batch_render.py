@@ -0,0 +1,126 @@
+"""
+Headless batch rendering of Gantt charts to PNG/SVG/PDF.
+
+Charts are drawn with draw_gantt on offscreen Agg figures, so no display or
+Tk is needed. Each job simulates and renders inside a worker process, so
+only the workload goes to the worker and only the written paths come back.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.gantt_chart import draw_gantt, pid_colors, sort_pids
+
+# Image formats accepted by Agg's print_figure, by suffix
+IMAGE_FORMATS = ("png", "svg", "pdf")
+
+
+def _figure(figsize, dpi):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def render_chart(path, timeline, stats, title=None, color_map=None, figsize=(10, 5), dpi=100):
+    """Render one Gantt chart to `path`; the format follows the suffix."""
+    figure = _figure(figsize, dpi)
+    ax = figure.add_subplot(111)
+    draw_gantt(ax, timeline, stats, color_map)
+    if title:
+        ax.set_title(title)
+    figure.tight_layout()
+    figure.savefig(path)
+    return path
+
+
+def render_grid(path, results, title=None, color_map=None, dpi=100):
+    """
+    Render several runs of one workload as a grid of Gantt charts.
+
+    Args:
+        path (str): Output file.
+        results (dict): {label: (timeline, stats)}.
+        title (str, optional): Figure title.
+        color_map (dict, optional): Shared {pid: color}; defaults to pid_colors()
+                                    of every pid in `results`.
+    """
+    n = len(results)
+    cols = min(3, n) or 1
+    rows = math.ceil(n / cols) or 1
+    if color_map is None:
+        color_map = pid_colors(sort_pids({pid for _, stats in results.values() for pid in stats}))
+    figure = _figure((5 * cols, 3 * rows), dpi)
+    for idx, (label, (timeline, stats)) in enumerate(results.items(), 1):
+        ax = figure.add_subplot(rows, cols, idx)
+        draw_gantt(ax, timeline, stats, color_map)
+        ax.set_title(label, fontsize=9)
+        ax.tick_params(labelsize=7)
+        ax.set_xlabel("")
+    if title:
+        figure.suptitle(title)
+    figure.tight_layout()
+    figure.savefig(path)
+    return path
+
+
+def render_job(job):
+    """
+    Worker: run the algorithms of one job and render its image(s).
+
+    Args:
+        job (dict): {"name", "data", "algorithms", "params", "out_dir", "fmt",
+                     "grid", "dpi"}; see batch_render.
+
+    Returns:
+        list[str]: Paths written.
+    """
+    from scheduler import Scheduler
+
+    sched = Scheduler(job["data"])
+    results = {algo: sched.run(algo, **job["params"]) for algo in job["algorithms"]}
+    # Same pid -> same color in every image of this workload
+    color_map = pid_colors(sort_pids(job["data"]))
+    base = os.path.join(job["out_dir"], job["name"])
+    if job["grid"]:
+        return [render_grid(f"{base}.{job['fmt']}", results, job["name"], color_map, job["dpi"])]
+    return [render_chart(f"{base}_{algo}.{job['fmt']}", timeline, stats, f"{job['name']} — {algo}",
+                         color_map, dpi=job["dpi"])
+            for algo, (timeline, stats) in results.items()]
+
+
+def batch_render(workloads, algorithms, out_dir, params=None, fmt="png", grid=False, dpi=100,
+                 max_workers=None, progress=None):
+    """
+    Render Gantt charts for many workloads across a process pool.
+
+    Args:
+        workloads (dict): {name: workload} with workloads as {pid: [arrival, burst, priority]}.
+        algorithms (list[str]): Names accepted by Scheduler.run.
+        out_dir (str): Directory for the images (created if missing).
+        params (dict, optional): Keyword arguments for Scheduler.run.
+        fmt (str): "png", "svg" or "pdf".
+        grid (bool): One image per workload with a chart per algorithm, instead
+                     of one image per (workload, algorithm).
+        dpi (int): Raster resolution.
+        max_workers (int, optional): Worker processes.
+        progress (callable, optional): progress(done, total) after each workload.
+
+    Returns:
+        list[str]: Paths written, in workload order.
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [{"name": name, "data": data, "algorithms": list(algorithms), "params": params or {},
+             "out_dir": out_dir, "fmt": fmt, "grid": grid, "dpi": dpi}
+            for name, data in workloads.items()]
+    written = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for done, paths in enumerate(pool.map(render_job, jobs), 1):
+            written.extend(paths)
+            if progress:
+                progress(done, len(jobs))
+    return written
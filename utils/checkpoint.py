@@ -0,0 +1,93 @@
+"""
+Checkpoint files for long simulations.
+
+A checkpoint is a snapshot of an online algorithm (algorithms.online) taken
+between two steps, together with whatever the caller needs to continue
+(partial stats, collected segments, output file offsets, ...). It is
+pickled, zlib-compressed and written to a temporary file that replaces the
+previous checkpoint with os.replace, so the file on disk is always either
+the old or the new complete snapshot.
+"""
+import os
+import pickle
+import signal
+import threading
+import time
+import zlib
+
+CHECKPOINT_MAGIC = b"OSSCKP\x01\n"
+
+# Seconds between checkpoints by default
+DEFAULT_INTERVAL = 60.0
+
+# Steps run between two looks at the clock
+CHUNK_STEPS = 4096
+
+
+def save_checkpoint(path, payload, level=6):
+    """Atomically write `payload` (any picklable object) to `path`."""
+    data = CHECKPOINT_MAGIC + zlib.compress(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL), level)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    """Read a checkpoint written by save_checkpoint, or None if `path` does not exist."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    if not data.startswith(CHECKPOINT_MAGIC):
+        raise ValueError(f"{path} is not a checkpoint file")
+    return pickle.loads(zlib.decompress(data[len(CHECKPOINT_MAGIC):]))
+
+
+def run_checkpointed(engine, path, payload=None, interval=DEFAULT_INTERVAL, before_save=None, chunk=CHUNK_STEPS):
+    """
+    Run an online algorithm to completion, saving {"engine": engine, **payload}
+    to `path` every `interval` seconds of wall time.
+
+    Ctrl-C (in the main thread) is deferred to the end of the current chunk of
+    steps, a checkpoint is written and KeyboardInterrupt is raised, so an
+    interrupted run always leaves a consistent checkpoint. The checkpoint file
+    is removed once the run completes.
+
+    Args:
+        engine (OnlineAlgorithm): Algorithm to run (fresh, or restored with attach()).
+        path (str): Checkpoint file.
+        payload (dict, optional): Extra state saved alongside the engine.
+        interval (float): Seconds between checkpoints.
+        before_save (callable, optional): Called before each save, e.g. to flush
+                                          output files and record their offsets in payload.
+        chunk (int): Steps between clock checks.
+    """
+    payload = payload if payload is not None else {}
+    interrupted = []
+    previous = None
+    if threading.current_thread() is threading.main_thread():
+        previous = signal.signal(signal.SIGINT, lambda signum, frame: interrupted.append(signum))
+
+    def save():
+        if before_save:
+            before_save()
+        save_checkpoint(path, {"engine": engine, **payload})
+
+    try:
+        last = time.monotonic()
+        while not engine.run(max_steps=chunk):
+            if interrupted:
+                save()
+                raise KeyboardInterrupt
+            if time.monotonic() - last >= interval:
+                save()
+                last = time.monotonic()
+    finally:
+        if previous is not None:
+            signal.signal(signal.SIGINT, previous)
+    if os.path.exists(path):
+        os.remove(path)
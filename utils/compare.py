@@ -0,0 +1,79 @@
+"""
+Compare-all: run several scheduling algorithms on the same workload in
+parallel worker processes and rank them per metric.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.metrics import compute_metrics
+
+# Metrics where a larger value is better; every other compared metric is better when smaller
+HIGHER_IS_BETTER = {"cpu_util", "throughput"}
+
+# Metrics that are identical for every algorithm on one workload and are not ranked
+NOT_RANKED = {"pcount", "cpu_time"}
+
+
+def run_algorithm(algorithm, data, params):
+    """
+    Run one algorithm and compute its metrics (executed in a worker process).
+
+    Returns:
+        dict: {"timeline", "stats", "metrics", "elapsed"} where elapsed is the
+              wall time of the simulation itself in seconds.
+    """
+    from scheduler import Scheduler
+
+    started = time.perf_counter()
+    timeline, stats = Scheduler(data).run(algorithm, **params)
+    elapsed = time.perf_counter() - started
+    return {"timeline": timeline, "stats": stats, "metrics": compute_metrics(stats, timeline), "elapsed": elapsed}
+
+
+def compare_all(data, algorithms, params=None, max_workers=None):
+    """
+    Run every algorithm in `algorithms` on `data` concurrently.
+
+    Each algorithm gets its own worker process, so the total wall time is
+    close to the slowest single run plus process start-up and result
+    transfer, instead of the sum of all runs.
+
+    Args:
+        data (dict): Workload {pid: [arrival, burst, priority]}.
+        algorithms (list[str]): Names accepted by Scheduler.run, e.g. ["FCFS", "RR"].
+        params (dict, optional): Keyword arguments for Scheduler.run (quantum,
+                                 context_switch, levels, quanta_list).
+        max_workers (int, optional): Worker processes; defaults to one per algorithm.
+
+    Returns:
+        dict: {algorithm: result} with results as returned by run_algorithm,
+              in the order of `algorithms`.
+    """
+    params = params or {}
+    if not algorithms:
+        return {}
+    with ProcessPoolExecutor(max_workers=max_workers or len(algorithms)) as pool:
+        futures = {algo: pool.submit(run_algorithm, algo, data, params) for algo in algorithms}
+        return {algo: fut.result() for algo, fut in futures.items()}
+
+
+def best_per_metric(results):
+    """
+    Find the best algorithm(s) for every ranked metric.
+
+    Returns:
+        dict: {metric: set of algorithm names sharing the best value}.
+    """
+    best = {}
+    metric_names = []
+    for res in results.values():
+        for name in res["metrics"]:
+            if name not in metric_names and name not in NOT_RANKED:
+                metric_names.append(name)
+    for name in metric_names:
+        values = {algo: res["metrics"][name] for algo, res in results.items() if name in res["metrics"]}
+        if not values:
+            continue
+        target = max(values.values()) if name in HIGHER_IS_BETTER else min(values.values())
+        best[name] = {algo for algo, v in values.items() if abs(v - target) <= 1e-9 * max(1.0, abs(target))}
+    return best
@@ -0,0 +1,382 @@
+"""
+Differential fuzzing of the scheduling engines.
+
+The original loop algorithms (fcfs, sjf, hpf, rr, srtn, mlfq), frozen in
+utils.reference_algorithms, are the reference semantics, quirks included:
+FCFS starts its clock at 0 and switches after every process, RR and MLFQ
+switch whenever the queue is non-empty, ties go to the numerically smaller
+pid. Every way of running the schedulers in algorithms/ (ENGINES: the
+default Scheduler.run, the NumPy paths, RR round compression, the online
+engines, stats-only, raw-segment, tick time base and telemetry runs) must
+produce the same schedule. The tick engine is compared on the case rounded
+to its resolution, the one it actually simulates; the telemetry engine also
+checks its series against the stats.
+The burst scheduler (algorithms.bursts) is not among them: it only
+switches when another process is ready, by design.
+
+fuzz() generates adversarial workloads (equal arrivals, zero, tiny and huge
+bursts, values just off a quantum boundary, pids whose string and numeric
+order differ), runs each through the reference and the engines, and
+compares the timelines and stats within a tolerance. A failing case is
+shrunk to a minimal workload before it is reported. A new engine is added
+to ENGINES; it, or an optimization of an existing one, is then checked with
+
+    python cli.py fuzz --iterations 2000 --engines online,fast
+"""
+import math
+import random
+
+from utils.timeline import contiguous, expand_timeline
+
+ALGORITHMS = ("FCFS", "SJF", "HPF", "RR", "SRTN", "MLFQ")
+
+# Stats fields every engine must reproduce
+STAT_FIELDS = ("arrival", "burst", "priority", "completion", "turnaround", "waiting", "response")
+
+# Burst times that stress float comparisons against the quanta and epsilons
+EDGE_BURSTS = (0.0, 1e-10, 1e-7, 0.1 + 0.2, 1.0 - 1e-13, 1.0 + 1e-13, 2.0 - 1e-9)
+
+# Huge bursts for the non-preemptive algorithms; the preemptive ones would run
+# them slice by slice, so they get long bursts of a few hundred quanta instead
+HUGE_BURSTS = (1e9, 1e12 + 0.5)
+LONG_BURSTS = (150.0, 150.0 + 1e-9)
+
+# Algorithms that run a process to completion once dispatched
+NON_PREEMPTIVE = ("FCFS", "SJF", "HPF")
+
+
+def reference(algorithm, data, params):
+    """
+    Run the reference algorithm (utils.reference_algorithms); `params` as
+    for Scheduler.run. The frozen copies predate response time, so it is
+    taken from the first segment each process runs in.
+    """
+    from utils.reference_algorithms import fcfs, hpf, mlfq, rr, sjf, srtn
+
+    cs = params.get("context_switch", 0.0)
+    quantum = params.get("quantum", 1.0)
+    if algorithm == "FCFS":
+        timeline, stats = fcfs(data, cs)
+    elif algorithm == "SJF":
+        timeline, stats = sjf(data, cs)
+    elif algorithm == "HPF":
+        timeline, stats = hpf(data, cs)
+    elif algorithm == "RR":
+        timeline, stats = rr(data, quantum, cs)
+    elif algorithm == "SRTN":
+        timeline, stats = srtn(data, quantum, cs)
+    elif algorithm == "MLFQ":
+        timeline, stats = mlfq(data, params.get("levels", 3), list(params.get("quanta_list", (1, 2, 4))), cs,
+                               params.get("aging_threshold", 10.0))
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    for seg in reversed(timeline):
+        if seg["type"] == "proc":
+            stats[seg["pid"]]["response"] = seg["start"] - stats[seg["pid"]]["arrival"]
+    return timeline, stats
+
+
+def _scheduler_engine(resolution=None, **options):
+    def run(algorithm, data, params):
+        from scheduler import Scheduler
+        merged = dict(params)
+        merged.update(options)
+        merged.setdefault("quanta_list", [1, 2, 4])
+        return Scheduler(data, resolution=resolution).run(algorithm, **merged)
+    return run
+
+
+def _tick_case(resolution):
+    """
+    Case transform rounding every time of a case to whole ticks of `resolution`.
+    With a power-of-two resolution the reference's float sums of such times
+    are exact, so it meets the same boundaries as the integer tick clock.
+    """
+    from utils.timebase import TimeBase
+
+    tb = TimeBase(resolution)
+
+    def snap(value):
+        return tb.from_ticks(tb.to_ticks(value))
+
+    def transform(data, params):
+        data = {pid: (snap(arrival), snap(burst), priority) for pid, (arrival, burst, priority) in data.items()}
+        params = dict(params)
+        for key in ("context_switch", "quantum", "aging_threshold"):
+            if key in params:
+                params[key] = snap(params[key])
+        if "quanta_list" in params:
+            params["quanta_list"] = [snap(q) for q in params["quanta_list"]]
+        return data, params
+    return transform
+
+
+def _telemetry_engine(windows=64):
+    """Scheduler run with telemetry; also fails when the series disagree with the stats."""
+    run = _scheduler_engine()
+
+    def run_checked(algorithm, data, params):
+        cs = params.get("context_switch", 0.0)
+        span = max((values[0] for values in data.values()), default=0.0) + \
+            sum(values[1] for values in data.values()) + len(data) * cs
+        timeline, stats = run(algorithm, data, dict(params, telemetry_window=max(span / windows, 1e-6)))
+        telemetry = timeline.telemetry
+        # Every process waits in the ready queue from arrival to completion except while it runs
+        waiting = sum(entry["turnaround"] - entry["burst"] for entry in stats.values())
+        area = math.fsum(telemetry.ready_area)
+        end = max((entry["completion"] for entry in stats.values()), default=0.0)
+        if not _close(area, waiting, 1e-9 * max(1.0, end) * max(1, len(stats))):
+            raise AssertionError(f"ready-queue area {area!r}, total waiting {waiting!r}")
+        if sum(telemetry.completed) != len(stats):
+            raise AssertionError(f"{sum(telemetry.completed):g} completions counted, {len(stats)} processes")
+        return timeline, stats
+    return run_checked
+
+
+def _online_engine(algorithm, data, params):
+    from algorithms.online import create_online, workload_records
+    from utils.timeline import Timeline
+
+    stats, timeline = {}, Timeline(coalesce=False)
+    engine = create_online(algorithm, workload_records(data), on_complete=stats.__setitem__,
+                           on_segment=timeline.append, **params)
+    engine.run()
+    return timeline, stats
+
+
+# Engine name -> (algorithms it implements, runner(algorithm, data, params), compares timelines,
+# case transform (data, params) -> (data, params) applied before both runs, or None)
+ENGINES = {
+    "default": (ALGORITHMS, _scheduler_engine(), True, None),
+    "fast": (("FCFS", "SJF", "HPF", "RR"), _scheduler_engine(fast=True), True, None),
+    "raw": (ALGORITHMS, _scheduler_engine(coalesce=False), True, None),
+    "stats-only": (ALGORITHMS, _scheduler_engine(timeline=False), False, None),
+    "online": (ALGORITHMS, _online_engine, True, None),
+    "ticks": (ALGORITHMS, _scheduler_engine(resolution=0.25), True, _tick_case(0.25)),
+    "telemetry": (ALGORITHMS, _telemetry_engine(), True, None),
+}
+
+
+def random_workload(rng, max_processes=12, huge=True):
+    """
+    Adversarial workload {pid: (arrival, burst, priority)}.
+
+    Arrivals are drawn from a few shared values so that ties are common,
+    bursts mix small integers with EDGE_BURSTS and HUGE_BURSTS (LONG_BURSTS
+    when `huge` is False), and pids are sparse so that string and numeric
+    order disagree ("10" < "9").
+    """
+    big = HUGE_BURSTS if huge else LONG_BURSTS
+    n = rng.randint(0, max_processes)
+    arrivals = [0.0] + [rng.choice((rng.randint(0, 10), round(rng.uniform(0, 10), 3), 0.1 + 0.2, 1e-9))
+                        for _ in range(rng.randint(0, 3))]
+    if rng.random() < 0.1:
+        arrivals.append(1e9)
+    pids = rng.sample(range(1, 4 * max_processes + 2), n)
+    data = {}
+    for pid in pids:
+        burst = rng.choice((rng.randint(1, 6), rng.randint(1, 6), round(rng.uniform(0.1, 5), 3),
+                            rng.choice(EDGE_BURSTS), rng.choice(big) if rng.random() < 0.3 else 1.0))
+        data[str(pid)] = (float(rng.choice(arrivals)), float(burst), rng.choice((1, 1, 2, rng.randint(0, 9))))
+    return data
+
+
+def random_params(rng):
+    """Scheduler.run parameters around the quantum and context-switch edge cases."""
+    levels = rng.randint(1, 5)
+    return {"context_switch": rng.choice((0.0, 0.0, 0.5, 1.0, 1e-9)),
+            "quantum": rng.choice((1.0, 2.0, 0.5, 0.3)),
+            "levels": levels,
+            "quanta_list": [rng.choice((1.0, 2.0, 4.0, 0.5)) for _ in range(levels)],
+            "aging_threshold": rng.choice((10.0, 3.0, 1.0, 0.0, 1e9))}
+
+
+def _close(a, b, tol):
+    if isinstance(a, float) or isinstance(b, float):
+        if a is None or b is None:
+            return a is b
+        return a == b or abs(a - b) <= tol
+    return a == b
+
+
+def normalize(timeline):
+    """
+    Timeline as a list of (start, duration, pid, type, level) with compressed
+    rounds expanded and contiguous segments (see utils.timeline.contiguous)
+    of the same pid, type and level merged, so coalesced and raw timelines
+    compare equal.
+    """
+    merged = []
+    for seg in expand_timeline(timeline):
+        key = (seg["pid"], seg["type"], seg.get("level"))
+        if merged:
+            last = merged[-1]
+            if last[2:] == key and contiguous(last[0] + last[1], seg["start"]):
+                merged[-1] = (last[0], last[1] + seg["duration"]) + key
+                continue
+        merged.append((seg["start"], seg["duration"]) + key)
+    return merged
+
+
+def diff_results(expected, actual, tol=1e-9, timelines=True):
+    """
+    First difference between a reference result and an engine result, or
+    None when they agree. Times are compared with tolerance `tol` relative
+    to the end of the reference run: a time of 1e9 carries rounding errors
+    of about 1e-7 into every difference taken from it, turnaround included.
+
+    Args:
+        expected, actual (tuple): (timeline, stats) pairs.
+        timelines (bool): Compare the segments as well as the stats.
+
+    Returns:
+        str | None: Description of the first mismatch.
+    """
+    exp_timeline, exp_stats = expected
+    act_timeline, act_stats = actual
+    end = max((abs(entry["completion"]) for entry in exp_stats.values()), default=0.0)
+    tol *= max(1.0, end)
+    if set(exp_stats) != set(act_stats):
+        missing = sorted(set(exp_stats) - set(act_stats), key=int)
+        extra = sorted(set(act_stats) - set(exp_stats), key=int)
+        return f"stats pids differ: missing {missing}, extra {extra}"
+    for pid in sorted(exp_stats, key=int):
+        for field in STAT_FIELDS:
+            a, b = exp_stats[pid].get(field), act_stats[pid].get(field)
+            if not _close(a, b, tol):
+                return f"pid {pid} {field}: expected {a!r}, got {b!r}"
+    if not timelines:
+        return None
+    exp, act = normalize(exp_timeline), normalize(act_timeline)
+    for k, (a, b) in enumerate(zip(exp, act)):
+        if a[2:] != b[2:] or not (_close(a[0], b[0], tol) and _close(a[1], b[1], tol)):
+            return f"segment {k}: expected {a}, got {b}"
+    if len(exp) != len(act):
+        return f"timeline length: expected {len(exp)} segments, got {len(act)}"
+    return None
+
+
+def check(algorithm, engine, data, params, tol=1e-9):
+    """Difference between the reference and `engine` on one case (None when they agree)."""
+    _, runner, timelines, transform = ENGINES[engine]
+    if transform is not None:
+        data, params = transform(data, params)
+    expected = reference(algorithm, data, params)
+    try:
+        actual = runner(algorithm, data, params)
+    except Exception as exc:
+        return f"{type(exc).__name__}: {exc}"
+    return diff_results(expected, actual, tol, timelines)
+
+
+def _candidates(data, params):
+    """Simpler variants of a failing case, the most aggressive first."""
+    pids = sorted(data, key=int)
+    n = len(pids)
+    # Drop chunks of processes, halving the chunk size down to single processes
+    size = n // 2
+    while size >= 1:
+        for start in range(0, n, size):
+            kept = pids[:start] + pids[start + size:]
+            yield {pid: data[pid] for pid in kept}, params
+        size //= 2
+    # Renumber the pids 1..n in the same order
+    renamed = {str(k + 1): data[pid] for k, pid in enumerate(pids)}
+    if renamed != data:
+        yield renamed, params
+    # Shift the arrivals so that the first one is at 0
+    first = min((values[0] for values in data.values()), default=0.0)
+    if first:
+        yield {pid: (arrival - first, burst, priority) for pid, (arrival, burst, priority) in data.items()}, params
+    # Simplify the values of each process
+    for pid in pids:
+        arrival, burst, priority = data[pid]
+        for value in (0.0, float(math.floor(arrival))):
+            if value != arrival:
+                yield dict(data, **{pid: (value, burst, priority)}), params
+        for value in (1.0, float(max(1, round(burst)))):
+            if value != burst:
+                yield dict(data, **{pid: (arrival, value, priority)}), params
+        if priority != 1:
+            yield dict(data, **{pid: (arrival, burst, 1)}), params
+    # Simplify the parameters
+    for key, value in (("context_switch", 0.0), ("quantum", 1.0), ("aging_threshold", 10.0),
+                       ("levels", 3), ("quanta_list", [1.0, 2.0, 4.0])):
+        if params.get(key) != value:
+            yield data, dict(params, **{key: value})
+
+
+def shrink(algorithm, engine, data, params, tol=1e-9, max_checks=2000):
+    """
+    Reduce a failing case to a minimal one that still fails: greedily take
+    the first simpler variant that keeps failing until none does.
+
+    Returns:
+        tuple: (data, params, difference) of the smallest failing case found.
+    """
+    failure = check(algorithm, engine, data, params, tol)
+    checks = 0
+    progress = True
+    while progress and checks < max_checks:
+        progress = False
+        for candidate, candidate_params in _candidates(data, params):
+            checks += 1
+            result = check(algorithm, engine, candidate, candidate_params, tol)
+            if result is not None:
+                data, params, failure = candidate, candidate_params, result
+                progress = True
+                break
+            if checks >= max_checks:
+                break
+    return data, params, failure
+
+
+def fuzz(algorithms=ALGORITHMS, engines=None, iterations=500, seed=None, max_processes=12, tol=1e-9,
+         max_failures=10, progress=None):
+    """
+    Differential fuzzing of `engines` (names in ENGINES, default all) against
+    the reference algorithms.
+
+    Args:
+        algorithms (iterable): UI names of the algorithms to check.
+        engines (iterable, optional): Engine names; each checks the algorithms it implements.
+        iterations (int): Random cases per algorithm.
+        seed (int, optional): Seed of the case generator.
+        max_processes (int): Largest generated workload.
+        tol (float): Tolerance for times, relative to the end of the run.
+        max_failures (int): Stop after this many (shrunk) failures.
+        progress (callable, optional): progress(done, total) after each case.
+
+    Returns:
+        dict: {"cases" (checks run), "failures": [{"algorithm", "engine", "data", "params",
+               "difference", "original_size"}]} with every failure shrunk.
+    """
+    engines = list(engines or ENGINES)
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+    algorithms = [a.upper() for a in algorithms]
+    rng = random.Random(seed)
+    failures, cases = [], 0
+    failing = set()
+    total = iterations * len(algorithms)
+    for done in range(total):
+        algorithm = algorithms[done % len(algorithms)]
+        data = random_workload(rng, max_processes, huge=algorithm in NON_PREEMPTIVE)
+        params = random_params(rng)
+        for engine in engines:
+            # One report per algorithm and engine; the rest are usually the same bug
+            if algorithm not in ENGINES[engine][0] or (algorithm, engine) in failing:
+                continue
+            cases += 1
+            if check(algorithm, engine, data, params, tol) is None:
+                continue
+            small, small_params, difference = shrink(algorithm, engine, data, params, tol)
+            failing.add((algorithm, engine))
+            failures.append({"algorithm": algorithm, "engine": engine, "data": small, "params": small_params,
+                             "difference": difference, "original_size": len(data)})
+            if len(failures) >= max_failures:
+                return {"cases": cases, "failures": failures}
+        if progress is not None:
+            progress(done + 1, total)
+    return {"cases": cases, "failures": failures}
@@ -1,14 +1,120 @@
-import json
+import sys
+import time
+
+from utils.report import export_report
 
 def load_input_file(path):
+    """
+    Read "pid arrival burst [priority] [bursts]" lines; '#' comments and a
+    "Process Count" header are skipped. The optional fifth column is a
+    CPU/I-O burst sequence (see parse_burst_sequence); the burst column is
+    then replaced by the sequence's total CPU time.
+    """
     data = {}
     with open(path, "r") as f:
         for line in f:
-            if line.strip() and not line.startswith("#"):
-                pid, arr, burst, pr = line.split()
+            if line.strip() and not line.startswith("#") and not line.lower().startswith("process"):
+                parts = line.split()
+                pid, arr, burst = parts[:3]
+                pr = parts[3] if len(parts) >= 4 else 0
                 data[pid] = [float(arr), float(burst), int(pr)]
+                if len(parts) >= 5:
+                    sequence = parse_burst_sequence(parts[4])
+                    data[pid][1] = sum(item for item in sequence if not isinstance(item, tuple))
+                    data[pid].append(sequence)
     return data
 
-def save_report(path, stats):
-    with open(path, "w") as f:
-        json.dump(stats, f, indent=2)
+
+def load_task_file(path):
+    """
+    Read a periodic task set for algorithms.realtime from "tid phase wcet
+    period [deadline]" lines; '#' comments are skipped.
+
+    Returns:
+        dict: {tid: [phase, wcet, period, deadline]} (deadline None when absent).
+    """
+    tasks = {}
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                parts = line.split()
+                tid, phase, wcet, period = parts[:4]
+                deadline = float(parts[4]) if len(parts) >= 5 else None
+                tasks[tid] = [float(phase), float(wcet), float(period), deadline]
+    return tasks
+
+
+def parse_burst_sequence(text):
+    """
+    Parse a burst sequence column such as "4,disk:2,1.5,net:3,2": plain
+    numbers are CPU bursts, "device:time" items are I/O requests.
+
+    Returns:
+        list: CPU times (float) and (device, time) tuples.
+    """
+    sequence = []
+    for item in text.split(","):
+        if ":" in item:
+            device, duration = item.split(":", 1)
+            sequence.append((device, float(duration)))
+        else:
+            sequence.append(float(item))
+    if not any(not isinstance(item, tuple) for item in sequence):
+        raise ValueError(f"burst sequence {text!r} has no CPU burst")
+    return sequence
+
+
+def format_burst_sequence(sequence):
+    """Inverse of parse_burst_sequence."""
+    return ",".join(f"{item[0]}:{item[1]:g}" if isinstance(item, (tuple, list)) else f"{item:g}"
+                    for item in sequence)
+
+def save_report(path, stats, timeline=None, fmt="json", compress=None):
+    """
+    Stream stats, aggregate metrics and, when given, the timeline to `path`
+    (one JSON document by default); see utils.report.export_report.
+    """
+    return export_report(path, stats, timeline, fmt=fmt, compress=compress)
+
+
+def iter_process_lines(lines):
+    """
+    Parse "pid arrival burst [priority]" lines as they come, in the format of
+    load_input_file, yielding (pid, arrival, burst, priority) records for
+    algorithms.online.
+    """
+    for line in lines:
+        if line.strip() and not line.startswith("#") and not line.lower().startswith("process"):
+            parts = line.split()
+            pid, arr, burst = parts[:3]
+            pr = parts[3] if len(parts) >= 4 else 0
+            yield pid, float(arr), float(burst), int(pr)
+
+
+def follow_lines(path, poll_interval=0.5, idle_timeout=None):
+    """
+    Yield the lines of a file and keep yielding lines appended to it (like
+    tail -f); "-" reads standard input. With `idle_timeout`, stop after that
+    many seconds without new data.
+    """
+    if path == "-":
+        yield from sys.stdin
+        return
+    with open(path, "r") as f:
+        partial = ""
+        waited = 0.0
+        while True:
+            line = f.readline()
+            if line:
+                waited = 0.0
+                partial += line
+                if partial.endswith("\n"):
+                    yield partial
+                    partial = ""
+                continue
+            if idle_timeout is not None and waited >= idle_timeout:
+                if partial:
+                    yield partial
+                return
+            time.sleep(poll_interval)
+            waited += poll_interval
@@ -3,51 +3,147 @@ Gantt chart plotting utilities
 """
 import random
 
+from utils.timeline import expand_timeline
+
+
+# Bar height of a process row; rows are 10 apart
+ROW_HEIGHT = 6
+
+# (y, height) of the idle and context-switch lanes below the process rows
+IDLE_LANE = (-12, 2)
+CS_LANE = (-8, 2)
+IDLE_COLOR = (0.9, 0.9, 0.9)
+
+# Device lanes of runs with I/O: the first starts at IO_LANE_TOP, each next one IO_LANE_STEP lower
+IO_LANE_TOP = -18
+IO_LANE_STEP = 6
+IO_LANE_HEIGHT = 4
+CS_COLOR = (0.7, 0.7, 0.7)
+
+
+def pid_colors(pids, seed=0):
+    """
+    Deterministic color per pid: the i-th pid of `pids` gets the i-th color
+    drawn from a generator seeded with `seed`, so the same pid list always
+    gets the same colors (in any process, without touching global random state).
+    """
+    rng = random.Random(seed)
+    color_map = {}
+    for pid in pids:
+        color_map[pid] = (rng.random()*0.7 + 0.15, rng.random()*0.7 + 0.15, rng.random()*0.7 + 0.15)
+    return color_map
+
+
+def sort_pids(pids):
+    """Pids in display order (numeric ascending)."""
+    return sorted(pids, key=lambda x: int(x) if str(x).isdigit() else x)
+
+
+def gantt_layout(timeline, color_map=None):
+    """
+    Row order, row positions and colors shared by the static chart and playback.
+
+    Args:
+        timeline (list): Expanded timeline segments.
+        color_map (dict, optional): Colors to use instead of pid_colors() of
+                                    the pids in this timeline.
+
+    Returns:
+        tuple: (pids, pid_to_y, color_map)
+    """
+    # Compute unique pid order for vertical placement (stable order: numeric ascending)
+    pids = sort_pids({seg['pid'] for seg in timeline if seg['pid'] is not None and seg['type']=="proc"})
+    pid_to_y = {pid: idx * 10 for idx, pid in enumerate(pids)}  # row height spacing 10
+    return pids, pid_to_y, color_map if color_map is not None else pid_colors(pids)
+
 
 def plot_gantt(ax, canvas, timeline, stats):
-    """Plot Gantt chart on the given matplotlib axis"""
+    """Plot Gantt chart on the given matplotlib axis and redraw its Tk canvas"""
+    draw_gantt(ax, timeline, stats)
+    canvas.draw()
+
+
+def draw_gantt(ax, timeline, stats, color_map=None):
+    """
+    Draw a Gantt chart on a matplotlib axis without rendering it, so any
+    figure works (Tk canvas, or an offscreen Agg figure for batch output).
+    The device segments of runs with I/O (timeline.io_segments) are drawn in
+    one lane per device below the idle lane. For real-time runs, every job's
+    absolute deadline is marked above its task's row (red when missed).
+
+    Args:
+        ax: Matplotlib axes.
+        timeline (list): Timeline as returned by the algorithms.
+        stats (dict): Per-process statistics.
+        color_map (dict, optional): {pid: color}; defaults to pid_colors() of the timeline's pids.
+    """
     ax.clear()
+    io_segments = getattr(timeline, "io_segments", None) or []
+    timeline = list(expand_timeline(timeline))
     if not timeline:
         ax.set_title("No timeline to show")
-        canvas.draw()
         return
 
-    # Compute unique pid order for vertical placement (stable order: numeric ascending)
-    pids = sorted({seg['pid'] for seg in timeline if seg['pid'] is not None and seg['type']=="proc"},
-                  key=lambda x: int(x) if str(x).isdigit() else x)
-    pid_to_y = {pid: idx * 10 for idx, pid in enumerate(pids)}  # row height spacing 10
-    height = 6
+    pids, pid_to_y, color_map = gantt_layout(timeline, color_map)
+    height = ROW_HEIGHT
 
-    # Colors mapping for processes
-    random.seed(0)
-    color_map = {}
-    for pid in pids:
-        # deterministic color per pid
-        color_map[pid] = (random.random()*0.7 + 0.15, random.random()*0.7 + 0.15, random.random()*0.7 + 0.15)
-
-    # Plot each segment using broken_barh
+    # Group segments per row so each row is a single broken_barh collection
+    rows = {pid: [] for pid in pids}
+    idle, cs = [], []
     for seg in timeline:
         start = seg['start']
         dur = seg['duration']
         typ = seg['type']
         pid = seg['pid']
         if typ == "proc":
-            y = pid_to_y[pid]
-            color = color_map.get(pid, (0.2,0.6,0.8))
-            ax.broken_barh([(start, dur)], (y, height), facecolors=color, edgecolor="black")
+            rows[pid].append((start, dur))
             # label the bar with pid if wide enough
             if dur > 0.5:
-                ax.text(start + dur/2, y + height/2, str(pid), ha='center', va='center', fontsize=8, color='black')
+                ax.text(start + dur/2, pid_to_y[pid] + height/2, str(pid), ha='center', va='center', fontsize=8, color='black')
         elif typ == "idle":
-            # represent idle below the rows
-            ax.broken_barh([(start, dur)], (-12, 2), facecolors=(0.9,0.9,0.9), edgecolor="none")
+            idle.append((start, dur))
         elif typ == "cs":
-            # context switch smaller bar between rows
-            ax.broken_barh([(start, dur)], (-8, 2), facecolors=(0.7,0.7,0.7), edgecolor="none")
+            cs.append((start, dur))
+    for pid, xranges in rows.items():
+        ax.broken_barh(xranges, (pid_to_y[pid], height), facecolors=color_map.get(pid, (0.2,0.6,0.8)), edgecolor="black")
+    # represent idle below the rows, context switches in a smaller lane above it
+    if idle:
+        ax.broken_barh(idle, IDLE_LANE, facecolors=IDLE_COLOR, edgecolor="none")
+    if cs:
+        ax.broken_barh(cs, CS_LANE, facecolors=CS_COLOR, edgecolor="none")
+
+    # one lane per I/O device below the idle lane, bars in the color of the process served
+    devices = sorted({seg['device'] for seg in io_segments})
+    device_y = {device: IO_LANE_TOP - k * IO_LANE_STEP for k, device in enumerate(devices)}
+    lanes = {device: ([], []) for device in devices}
+    for seg in io_segments:
+        xranges, colors = lanes[seg['device']]
+        xranges.append((seg['start'], seg['duration']))
+        colors.append(color_map.get(seg['pid'], (0.2,0.6,0.8)))
+        if seg['duration'] > 0.5:
+            ax.text(seg['start'] + seg['duration']/2, device_y[seg['device']] + IO_LANE_HEIGHT/2, str(seg['pid']),
+                    ha='center', va='center', fontsize=7, color='black')
+    for device, (xranges, colors) in lanes.items():
+        ax.broken_barh(xranges, (device_y[device], IO_LANE_HEIGHT), facecolors=colors, edgecolor="black",
+                       hatch="//", linewidth=0.5)
+
+    # deadline markers of real-time jobs, just above the task row
+    met, missed = ([], []), ([], [])
+    for entry in (stats or {}).values():
+        if entry.get('deadline') is not None and entry.get('task') in pid_to_y:
+            xs, ys = missed if entry.get('missed') else met
+            xs.append(entry['deadline'])
+            ys.append(pid_to_y[entry['task']] + height + 1)
+    if met[0]:
+        ax.scatter(*met, marker="v", s=14, color="black", zorder=3, label="deadline")
+    if missed[0]:
+        ax.scatter(*missed, marker="v", s=18, color="red", zorder=3, label="missed deadline")
+    if met[0] or missed[0]:
+        ax.legend(loc="best", fontsize=7)
 
     # Y ticks
-    yticks = [pid_to_y[pid] + height/2 for pid in pids]
-    ylabels = [str(pid) for pid in pids]
+    yticks = [pid_to_y[pid] + height/2 for pid in pids] + [device_y[d] + IO_LANE_HEIGHT/2 for d in devices]
+    ylabels = [str(pid) for pid in pids] + [f"I/O {d}" for d in devices]
     if yticks:
         ax.set_yticks(yticks)
         ax.set_yticklabels(ylabels)
@@ -56,6 +152,48 @@ def plot_gantt(ax, canvas, timeline, stats):
     ax.grid(axis='x', linestyle='--', alpha=0.4)
     # set x-limits to cover timeline fully
     start_min = min(seg['start'] for seg in timeline)
-    end_max = max(seg['start'] + seg['duration'] for seg in timeline)
+    end_max = max([seg['start'] + seg['duration'] for seg in timeline + io_segments] + met[0] + missed[0])
     ax.set_xlim(left=max(0, start_min - 0.5), right=end_max + 0.5)
-    canvas.draw()
\ No newline at end of file
+
+def draw_telemetry(ax, telemetry, queue_ax=None):
+    """
+    Draw a run's telemetry as a strip under the Gantt chart: stacked busy,
+    context-switch and idle fractions per window, with the mean ready-queue
+    length (and per-level lengths for MLFQ) on a second y axis.
+
+    Args:
+        ax: Matplotlib axes for the fractions (its x range is left alone, so
+            it can share the Gantt chart's x axis).
+        telemetry (Telemetry): Collector from a run with telemetry_window set, or None.
+        queue_ax: Axes for the queue lengths; defaults to ax.twinx(). Pass the
+                  same twin on every redraw to avoid stacking new axes.
+    """
+    ax.clear()
+    if queue_ax is None:
+        queue_ax = ax.twinx()
+    queue_ax.clear()
+    # clear() resets a twin axis to the left side
+    queue_ax.yaxis.tick_right()
+    queue_ax.yaxis.set_label_position("right")
+    series = telemetry.series() if telemetry is not None else None
+    if not series or not series["window_start"]:
+        ax.set_yticks([])
+        queue_ax.set_yticks([])
+        return
+
+    edges = list(series["window_start"]) + [series["window_start"][-1] + telemetry.window]
+    bottom = [0.0] * len(series["busy"])
+    for name, color in (("busy", (0.3, 0.6, 0.85)), ("cs", CS_COLOR), ("idle", IDLE_COLOR)):
+        top = [b + v for b, v in zip(bottom, series[name])]
+        ax.stairs(top, edges, baseline=bottom, fill=True, color=color, label=name)
+        bottom = top
+    ax.set_ylim(0, 1)
+    ax.set_ylabel("CPU")
+    ax.set_xlabel("Time")
+
+    queue_ax.stairs(series["ready_mean"], edges, color="black", linewidth=1, label="ready")
+    for level in range(telemetry.levels):
+        queue_ax.stairs(series[f"level{level}_mean"], edges, linewidth=0.8, linestyle="--", label=f"L{level}")
+    queue_ax.set_ylim(bottom=0)
+    queue_ax.set_ylabel("Ready")
+    queue_ax.legend(loc="upper right", fontsize=7, ncol=1 + telemetry.levels)
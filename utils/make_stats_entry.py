@@ -1,10 +1,11 @@
 # utils/make_stats_entry.py
 
-def make_stats_entry(data, pid, arrival, burst, completion):
+def make_stats_entry(data, pid, arrival, burst, completion, first_run=None):
     """
     Create a statistics entry for a single process.
 
-    Computes turnaround time, waiting time, and normalized turnaround time.
+    Computes turnaround time, waiting time, normalized turnaround time and,
+    when the first dispatch time is known, response time.
 
     Args:
         data (dict): Original process data in the format {pid: [arrival, burst, priority]}.
@@ -12,6 +13,7 @@ def make_stats_entry(data, pid, arrival, burst, completion):
         arrival (float): Arrival time of the process.
         burst (float): CPU burst time of the process.
         completion (float): Completion time of the process.
+        first_run (float, optional): Time the process was first dispatched.
 
     Returns:
         dict: A dictionary containing the following keys:
@@ -22,6 +24,7 @@ def make_stats_entry(data, pid, arrival, burst, completion):
             - "turnaround" (float): Turnaround time = completion - arrival.
             - "waiting" (float): Waiting time = turnaround - burst.
             - "norm_turnaround" (float): Normalized turnaround time = turnaround / burst.
+            - "response" (float|None): Response time = first_run - arrival.
     """
     
     turn_around_time = completion - arrival
@@ -34,5 +37,6 @@ def make_stats_entry(data, pid, arrival, burst, completion):
         "completion": completion,
         "turnaround": turn_around_time,
         "waiting": waiting_time,
-        "norm_turnaround": norm_turn_around_time
+        "norm_turnaround": norm_turn_around_time,
+        "response": first_run - arrival if first_run is not None else None
     }
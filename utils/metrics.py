@@ -1,12 +1,48 @@
 """
 Metrics computation and statistics display
 """
+import math
 from tkinter import END
 from datetime import datetime
 
+from utils.sketch import QuantileSketch
+from utils.timeline import index_timeline, segment_counts, timeline_totals
 
-def compute_metrics(stats):
-    """Compute aggregate metrics from process statistics"""
+
+# Latency distributions tracked per run: metric key suffix -> stats field
+LATENCY_FIELDS = {
+    'wait': 'waiting',
+    'turn': 'turnaround',
+    'norm_turn': 'norm_turnaround',
+    'response': 'response',
+}
+
+# Percentiles reported for every latency field
+PERCENTILES = (50, 95, 99)
+
+
+def _nearest_rank(sorted_values, p):
+    """Nearest-rank p-th percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def compute_metrics(stats, timeline=None):
+    """
+    Compute aggregate metrics from process statistics.
+
+    With a timeline (a recorded one or the NullTimeline of a stats-only run)
+    the idle and context-switch totals are added as well, and for runs with
+    I/O the utilization of every device ("io_util_<device>", percent busy).
+    Real-time runs (stats with deadlines) add deadline misses and lateness,
+    and the task set's schedulability when the timeline carries it.
+    Fair-share runs add the number of groups, the largest gap between the
+    CPU share a group received and the share it was entitled to, and Jain's
+    fairness index of received/entitled (1.0 is perfectly fair); see
+    group_metrics for the per-group figures.
+    """
     if not stats:
         return {}
     
@@ -23,7 +59,7 @@ def compute_metrics(stats):
     avg_turn = total_turn / pcount if pcount > 0 else 0.0
     throughput = pcount / total_time if total_time > 0 else 0.0
     
-    return {
+    metrics = {
         'pcount': pcount,
         'total_time': total_time,
         'cpu_time': cpu_time,
@@ -33,8 +69,171 @@ def compute_metrics(stats):
         'throughput': throughput
     }
 
+    # Tail latency: exact nearest-rank percentiles
+    for name, field in LATENCY_FIELDS.items():
+        values = sorted(v[field] for v in stats.values() if v.get(field) is not None)
+        if name in ('norm_turn', 'response'):
+            metrics[f'avg_{name}'] = sum(values) / len(values) if values else 0.0
+        for p in PERCENTILES:
+            metrics[f'p{p}_{name}'] = _nearest_rank(values, p)
+
+    lateness = [v['lateness'] for v in stats.values() if v.get('deadline') is not None]
+    if lateness:
+        misses = sum(1 for v in stats.values() if v.get('missed'))
+        metrics['deadline_misses'] = misses
+        metrics['miss_ratio'] = misses / len(lateness) * 100.0
+        metrics['max_lateness'] = max(lateness)
+        metrics['avg_lateness'] = sum(lateness) / len(lateness)
+
+    if timeline is not None:
+        totals = timeline_totals(timeline)
+        metrics['idle_time'] = totals['idle']
+        metrics['cs_time'] = totals['cs']
+        metrics['cs_overhead'] = (totals['cs'] / total_time * 100.0) if total_time > 0 else 0.0
+        for device, busy in sorted(getattr(timeline, 'io_totals', {}).items()):
+            metrics[f'io_util_{device}'] = (busy / total_time * 100.0) if total_time > 0 else 0.0
+        groups = group_metrics(stats, timeline)
+        if groups:
+            metrics['groups'] = len(groups)
+            metrics['share_error_max'] = max(abs(g['share'] - g['entitled_share']) for g in groups.values())
+            ratios = [g['received'] / g['entitled'] for g in groups.values() if g['entitled'] > 0]
+            metrics['fairness'] = (sum(ratios) ** 2 / (len(ratios) * sum(r * r for r in ratios))
+                                   if ratios and any(ratios) else 1.0)
+        analysis = getattr(timeline, 'schedulability', None)
+        if analysis:
+            metrics['rt_utilization'] = analysis['utilization']
+            metrics['rt_bound'] = analysis['bound']
+            metrics['schedulable'] = analysis['schedulable']
+    return metrics
+
+
+def group_metrics(stats, timeline=None):
+    """
+    Per-group aggregates of a fair-share run (algorithms.fair_share).
+
+    Returns:
+        dict: {group: {"processes", "weight", "received", "entitled" (CPU time),
+               "share", "entitled_share" (percent of all CPU time given to the
+               groups), "avg_wait", "p50_wait", "p95_wait", "p99_wait"}}, in the
+               order of the timeline's group_shares; empty for other runs.
+    """
+    shares = getattr(timeline, 'group_shares', None)
+    if not shares:
+        return {}
+    waits = {g: [] for g in shares}
+    for v in stats.values():
+        if v.get('group') in waits:
+            waits[v['group']].append(v['waiting'])
+    total = sum(share['received'] for share in shares.values())
+    result = {}
+    for g, share in shares.items():
+        values = sorted(waits[g])
+        entry = {
+            'processes': len(values),
+            'weight': share['weight'],
+            'received': share['received'],
+            'entitled': share['entitled'],
+            'share': share['received'] / total * 100.0 if total > 0 else 0.0,
+            'entitled_share': share['entitled'] / total * 100.0 if total > 0 else 0.0,
+            'avg_wait': sum(values) / len(values) if values else 0.0,
+        }
+        for p in PERCENTILES:
+            entry[f'p{p}_wait'] = _nearest_rank(values, p)
+        result[g] = entry
+    return result
+
+
+def latency_histograms(stats, bins=20):
+    """
+    Equal-width histograms of every latency field.
+
+    Returns:
+        dict: {name: (edges, counts)} for each key of LATENCY_FIELDS.
+    """
+    result = {}
+    for name, field in LATENCY_FIELDS.items():
+        values = [v[field] for v in stats.values() if v.get(field) is not None]
+        if not values:
+            result[name] = ([], [])
+            continue
+        lo, hi = min(values), max(values)
+        width = (hi - lo) / bins if hi > lo else 1.0
+        counts = [0] * bins
+        for x in values:
+            counts[min(bins - 1, int((x - lo) / width))] += 1
+        result[name] = ([lo + width * k for k in range(bins + 1)], counts)
+    return result
+
+
+class StreamingMetrics:
+    """
+    Bounded-memory equivalent of compute_metrics for streamed stats entries.
+
+    Sums, extremes and one QuantileSketch per latency field are kept instead
+    of the entries themselves. Instances built in separate workers can be
+    combined with merge() and report the same keys as compute_metrics, with
+    percentiles accurate to the sketch's relative error.
+    """
+
+    def __init__(self, alpha=0.01):
+        self.pcount = 0
+        self.earliest_arrival = math.inf
+        self.latest_completion = -math.inf
+        self.cpu_time = 0.0
+        self.sketches = {name: QuantileSketch(alpha) for name in LATENCY_FIELDS}
+
+    def add(self, entry):
+        """Account one stats entry (as produced by make_stats_entry)."""
+        self.pcount += 1
+        if entry['arrival'] < self.earliest_arrival:
+            self.earliest_arrival = entry['arrival']
+        if entry['completion'] > self.latest_completion:
+            self.latest_completion = entry['completion']
+        self.cpu_time += entry['burst']
+        for name, field in LATENCY_FIELDS.items():
+            value = entry.get(field)
+            if value is not None:
+                self.sketches[name].add(value)
+
+    def update(self, stats):
+        for entry in stats.values():
+            self.add(entry)
+        return self
+
+    def merge(self, other):
+        self.pcount += other.pcount
+        self.earliest_arrival = min(self.earliest_arrival, other.earliest_arrival)
+        self.latest_completion = max(self.latest_completion, other.latest_completion)
+        self.cpu_time += other.cpu_time
+        for name, sketch in self.sketches.items():
+            sketch.merge(other.sketches[name])
+        return self
+
+    def result(self):
+        if not self.pcount:
+            return {}
+        total_time = self.latest_completion - self.earliest_arrival
+        metrics = {
+            'pcount': self.pcount,
+            'total_time': total_time,
+            'cpu_time': self.cpu_time,
+            'cpu_util': (self.cpu_time / total_time * 100.0) if total_time > 0 else 0.0,
+            'avg_wait': self.sketches['wait'].mean(),
+            'avg_turn': self.sketches['turn'].mean(),
+            'throughput': self.pcount / total_time if total_time > 0 else 0.0,
+        }
+        for name, sketch in self.sketches.items():
+            if name in ('norm_turn', 'response'):
+                metrics[f'avg_{name}'] = sketch.mean()
+            for p in PERCENTILES:
+                metrics[f'p{p}_{name}'] = sketch.quantile(p / 100.0)
+        return metrics
+
+    def histograms(self, bins=20):
+        return {name: sketch.histogram(bins) for name, sketch in self.sketches.items()}
+
 
-def show_stats_summary(stats_text, last_stats, algo, context, quantum):
+def show_stats_summary(stats_text, last_stats, algo, context, quantum, timeline=None):
     """Display statistics summary in the text widget"""
     stats_text.delete("1.0", END)
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -47,7 +246,7 @@ def show_stats_summary(stats_text, last_stats, algo, context, quantum):
         return
 
     # compute aggregates
-    metrics = compute_metrics(last_stats)
+    metrics = compute_metrics(last_stats, timeline)
 
     # brief table header
     hdr = f"{'PID':>4} {'Arr':>7} {'Burst':>7} {'Pr':>4} {'Compl':>8} {'Wait':>7} {'Turn':>7} {'N-Turn':>8}\n"
@@ -59,4 +258,33 @@ def show_stats_summary(stats_text, last_stats, algo, context, quantum):
     
     stats_text.insert(END, "-"*72 + "\n")
     stats_text.insert(END, f"Processes: {metrics['pcount']}  Total time: {metrics['total_time']:.3f}  CPU time: {metrics['cpu_time']:.3f}\n")
-    stats_text.insert(END, f"Avg waiting: {metrics['avg_wait']:.3f}  Avg turnaround: {metrics['avg_turn']:.3f}  CPU util: {metrics['cpu_util']:.1f}%  Throughput: {metrics['throughput']:.3f} per unit time\n")
\ No newline at end of file
+    stats_text.insert(END, f"Avg waiting: {metrics['avg_wait']:.3f}  Avg turnaround: {metrics['avg_turn']:.3f}  CPU util: {metrics['cpu_util']:.1f}%  Throughput: {metrics['throughput']:.3f} per unit time\n")
+    stats_text.insert(END, f"Waiting p50/p95/p99: {metrics['p50_wait']:.3f}/{metrics['p95_wait']:.3f}/{metrics['p99_wait']:.3f}  "
+                           f"Response p50/p95/p99: {metrics['p50_response']:.3f}/{metrics['p95_response']:.3f}/{metrics['p99_response']:.3f}\n")
+    if 'deadline_misses' in metrics:
+        stats_text.insert(END, f"Deadline misses: {metrics['deadline_misses']} ({metrics['miss_ratio']:.1f}%)  "
+                               f"Max lateness: {metrics['max_lateness']:.3f}  Avg lateness: {metrics['avg_lateness']:.3f}\n")
+    if 'schedulable' in metrics:
+        stats_text.insert(END, f"Task utilization: {metrics['rt_utilization']:.3f} (bound {metrics['rt_bound']:.3f})  "
+                               f"Schedulable: {'yes' if metrics['schedulable'] else 'no'}\n")
+    if 'groups' in metrics:
+        stats_text.insert(END, f"Groups: {metrics['groups']}  Largest share gap: {metrics['share_error_max']:.2f} pts  "
+                               f"Fairness index: {metrics['fairness']:.4f}\n")
+        for g, entry in list(group_metrics(last_stats, timeline).items())[:20]:
+            stats_text.insert(END, f"  group {g} (w={entry['weight']:g}): share {entry['share']:.1f}% "
+                                   f"(entitled {entry['entitled_share']:.1f}%)  wait p50/p95: "
+                                   f"{entry['p50_wait']:.3f}/{entry['p95_wait']:.3f}\n")
+    devices = [(key[len('io_util_'):], value) for key, value in metrics.items() if key.startswith('io_util_')]
+    if devices:
+        stats_text.insert(END, "Device utilization: " + "  ".join(f"{name}: {util:.1f}%" for name, util in devices) + "\n")
+    if timeline is not None:
+        stored, raw = segment_counts(timeline)
+        stats_text.insert(END, f"Timeline segments: {stored} ({raw} before coalescing)\n")
+        index = index_timeline(timeline)
+        if len(index):
+            t0, t1 = index.start, index.end
+            bounds = [t0 + (t1 - t0) * q / 4 for q in range(5)]
+            quarters = "  ".join(f"{index.utilization(a, b):.1f}%" for a, b in zip(bounds, bounds[1:]))
+            cs = index.cs_overhead(t0, t1)
+            stats_text.insert(END, f"CPU util by quarter: {quarters}  "
+                                   f"Context-switch overhead: {cs:.3f} ({cs / (t1 - t0) * 100 if t1 > t0 else 0:.1f}%)\n")
@@ -0,0 +1,636 @@
+"""
+Frozen copy of the original loop algorithms, the reference of utils.differential.
+
+fcfs, sjf, hpf, rr, srtn and mlfq exactly as they were before any engine
+was optimized; the fuzzer compares everything in algorithms/, the loop
+algorithms included, against them. Do not change these functions: a
+behaviour change of the schedulers has to show up as a fuzz failure. Their
+only edits are the stats helper (the original make_stats_entry, without
+response time) and MLFQ no longer printing its aging promotions.
+"""
+from collections import deque
+
+
+def _stats_entry(data, pid, arrival, burst, completion):
+    """Original utils.make_stats_entry: turnaround, waiting and normalized turnaround."""
+    turn_around_time = completion - arrival
+    waiting_time = turn_around_time - burst
+    norm_turn_around_time = turn_around_time / burst if burst > 0 else 0
+    return {
+        "arrival": arrival,
+        "burst": burst,
+        "priority": data[pid][2] if pid in data else 0,
+        "completion": completion,
+        "turnaround": turn_around_time,
+        "waiting": waiting_time,
+        "norm_turnaround": norm_turn_around_time
+    }
+
+
+def fcfs(data, context_switch=0.0):
+    """
+    First-Come, First-Served (FCFS) scheduling algorithm.
+
+    Processes are executed in the order of arrival times. If multiple
+    processes have the same arrival time, the tie is broken by PID
+    (ascending numerical order). Supports optional context switch time.
+
+    Args:
+        data (dict): Mapping of process ID -> [arrival(float), burst(float), priority(int)]
+        context_switch (float, optional): Time taken for context switching between processes. Defaults to 0.0.
+
+    Returns:
+        tuple:
+            timeline (list of dict): Execution segments with keys:
+                - 'start': segment start time
+                - 'duration': segment duration
+                - 'pid': process ID (None for idle or context switch)
+                - 'type': 'proc', 'idle', or 'cs'
+            stats (dict): Process statistics mapping PID -> {
+                'arrival', 'burst', 'priority', 'completion', 'turnaround', 'waiting', 'norm_turnaround'
+            }
+    """
+
+    # Sort processes by arrival time, breaking ties by PID
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+
+    timeline = []
+    stats = {}
+    current_time = 0.0
+
+    # if empty, return early
+    if not sorted_data:
+        return timeline, stats
+
+    for pid, (arrival, burst, _) in sorted_data:
+        # Convert arrival and burst to float
+        arrival = float(arrival)
+        burst = float(burst)
+
+        # If the CPU is idle until this process arrives
+        if arrival > current_time:
+            timeline.append({
+                "start": current_time,
+                "duration": arrival - current_time,
+                "pid": None,
+                "type": "idle"
+            })
+            current_time = arrival
+
+        # Run the process
+        timeline.append({
+            "start": current_time,
+            "duration": burst,
+            "pid": pid,
+            "type": "proc"
+        })
+        current_time += burst
+        completion = current_time
+
+        # Record process statistics
+        stats[pid] = _stats_entry(data, pid, arrival, burst, completion)
+
+        # Context switch after process if specified
+        if context_switch:
+            timeline.append({
+                "start": current_time,
+                "duration": context_switch,
+                "pid": None,
+                "type": "cs"
+            })
+            current_time += context_switch
+
+    return timeline, stats
+
+
+def sjf(data, context_switch=0.0):
+    """
+    Implements the Shortest Job First (SJF) scheduling algorithm (non-preemptive).
+
+    - Among the ready processes, the one with the smallest burst time is selected.
+    - Once a process starts execution, it runs to completion (no preemption).
+    - Ties are broken by PID for determinism.
+
+    Args:
+        data (dict): Process dictionary in the format:
+                     {pid: (arrival_time, burst_time, priority)}
+        context_switch (float, optional): Context switch overhead in time units. Defaults to 0.0.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (list): List of execution/idle/context switch periods
+            - stats (dict): Per-process statistics (waiting, turnaround, etc.)
+    """
+
+    # Sort by arrival time first, then PID
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+
+    timeline = []
+    stats = {}
+    n = len(sorted_data)
+    if n == 0:
+        return timeline, stats
+
+    ready = []
+    current_time = sorted_data[0][1][0]
+    i = 0
+
+    while i < n or ready:
+        # Add all processes that have arrived by current time
+        while i < n and sorted_data[i][1][0] <= current_time:
+            ready.append(sorted_data[i])
+            i += 1
+
+        # If no ready process, CPU idles until next arrival
+        if not ready:
+            if i < n:
+                next_arr = sorted_data[i][1][0]
+                timeline.append({
+                    "start": current_time,
+                    "duration": next_arr - current_time,
+                    "pid": None,
+                    "type": "idle"
+                })
+                current_time = next_arr
+                continue
+            break
+
+        # Pick the process with the shortest burst time
+        ready.sort(key=lambda kv: (kv[1][1], int(kv[0])))
+        pid, (arrival, burst, pr) = ready.pop(0)
+        arrival = float(arrival)
+        burst = float(burst)
+
+        # Execute it
+        if arrival > current_time:
+            timeline.append({
+                "start": current_time,
+                "duration": arrival - current_time,
+                "pid": None,
+                "type": "idle"
+            })
+            current_time = arrival
+
+        timeline.append({
+            "start": current_time,
+            "duration": burst,
+            "pid": pid,
+            "type": "proc"
+        })
+        current_time += burst
+
+        # Record stats
+        stats[pid] = _stats_entry(data, pid, arrival, burst, current_time)
+
+        # Optional context switch
+        if context_switch and (ready or i < n):
+            timeline.append({
+                "start": current_time,
+                "duration": context_switch,
+                "pid": None,
+                "type": "cs"
+            })
+            current_time += context_switch
+
+    return timeline, stats
+
+
+def hpf(data, context_switch=0.0):
+    """
+    Non-preemptive Highest Priority First (HPF) scheduling algorithm.
+    
+    Higher numeric priority is chosen first. If priorities tie, earlier arrival wins, 
+    then lower PID breaks tie. 
+
+    Args:
+        data (dict): Dictionary of processes with structure {pid: (arrival, burst, priority)}
+        context_switch (float, optional): Context switch duration between processes. Defaults to 0.0.
+
+    Returns:
+        tuple:
+            timeline (list): List of dictionaries with CPU activity/idle/context switch events.
+                Each dict contains:
+                    - "start": float, start time of the block
+                    - "duration": float, duration of the block
+                    - "pid": str or None, process id or None for idle/context switch
+                    - "type": "proc" | "idle" | "cs"
+            stats (dict): Dictionary of per-process statistics with structure {pid: {...}}
+                Each entry includes arrival, burst, completion, waiting, turnaround, norm_turnaround, priority.
+    """
+    
+    # Sort processes by arrival time, then PID
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+    
+    timeline = []
+    stats = {}
+    current_time = sorted_data[0][1][0] if sorted_data else 0.0
+    ready = []
+    
+    # if empty, return early
+    if not sorted_data:
+        return timeline, stats
+    
+    i = 0
+    n = len(sorted_data)
+    
+    while i < n or ready:
+        # Enqueue all processes that have arrived
+        while i < n and sorted_data[i][1][0] <= current_time:
+            ready.append(sorted_data[i])
+            i += 1
+
+        if not ready:
+            # CPU idle until next arrival
+            next_arrival = sorted_data[i][1][0]
+            timeline.append({
+                "start": current_time,
+                "duration": next_arrival - current_time,
+                "pid": None,
+                "type": "idle"
+            })
+            current_time = next_arrival
+            continue
+
+        # Pick process with highest priority (larger numeric value)
+        ready.sort(key=lambda kv: (-kv[1][2], kv[1][0], int(kv[0])))
+        pid, (arrival, burst, _) = ready.pop(0)
+        arrival, burst = float(arrival), float(burst)
+
+        # Add idle time if process arrived after current time
+        if arrival > current_time:
+            timeline.append({
+                "start": current_time,
+                "duration": arrival - current_time,
+                "pid": None,
+                "type": "idle"
+            })
+            current_time = arrival
+
+        # Schedule the process
+        timeline.append({
+            "start": current_time,
+            "duration": burst,
+            "pid": pid,
+            "type": "proc"
+        })
+        current_time += burst
+
+        # Record stats
+        stats[pid] = _stats_entry(data, pid, arrival, burst, current_time)
+
+        # Context switch block
+        if context_switch:
+            timeline.append({
+                "start": current_time,
+                "duration": context_switch,
+                "pid": None,
+                "type": "cs"
+            })
+            current_time += context_switch
+
+    return timeline, stats
+
+
+def rr(data, quantum=1.0, context_switch=0.0):
+    """
+    Round Robin (RR) CPU scheduling algorithm (preemptive).
+
+    Args:
+        data (dict): Dictionary of processes with structure {pid: (arrival, burst, priority)}.
+        quantum (float): Maximum CPU time a process can run per turn.
+        context_switch (float): Time taken for context switching between processes.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (list of dicts): Each dict contains {"start", "duration", "pid", "type"}.
+              'type' is "proc" for running process, "idle" for CPU idle, "cs" for context switch.
+            - stats (dict): Per-process statistics {pid: {"arrival", "burst", "priority", "completion",
+              "turnaround", "waiting", "norm_turnaround"}}.
+    """
+    
+    # Sort processes by arrival time (tie-break by PID)
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+    
+    timeline = []
+    stats = {}
+    
+    # if empty, return early
+    if not sorted_data:
+        return timeline, stats
+
+    # Remaining burst times and arrival mapping
+    remaining = {pid: float(burst) for pid, (_, burst, _) in sorted_data}
+    arrival_map = {pid: float(arr) for pid, (arr, _, _) in sorted_data}
+
+    current_time = sorted_data[0][1][0]
+    
+    q = deque()
+    i = 0
+    n = len(sorted_data)
+
+    # Seed initial arrivals
+    while i < n and sorted_data[i][1][0] <= current_time:
+        q.append(sorted_data[i][0])
+        i += 1
+
+    # If nothing arrived yet, jump to the first arrival
+    if not q and i < n:
+        current_time = sorted_data[i][1][0]
+        q.append(sorted_data[i][0])
+        i += 1
+
+    # Main RR loop
+    while q:
+        pid = q.popleft()
+        run_time = min(quantum, remaining[pid])
+
+        # Handle CPU idle if process arrived in future
+        if arrival_map[pid] > current_time:
+            timeline.append({"start": current_time,
+                             "duration": arrival_map[pid] - current_time,
+                             "pid": None,
+                             "type": "idle"})
+            current_time = arrival_map[pid]
+
+        # Run the process
+        timeline.append({"start": current_time,
+                         "duration": run_time,
+                         "pid": pid,
+                         "type": "proc"})
+        
+        current_time += run_time
+        remaining[pid] -= run_time
+
+        # Enqueue any new arrivals during this time slice
+        while i < n and sorted_data[i][1][0] <= current_time:
+            q.append(sorted_data[i][0])
+            i += 1
+
+        # If process not finished, requeue
+        if remaining[pid] > 1e-12:
+            q.append(pid)
+        else:
+            # Process finished: record stats
+            stats[pid] = _stats_entry(data, pid, arrival_map[pid], float(data[pid][1]), current_time)
+
+        # Add context switch if needed and queue not empty
+        if context_switch and q:
+            timeline.append({"start": current_time, "duration": context_switch, "pid": None, "type": "cs"})
+            current_time += context_switch
+
+        # If queue empty but there are future arrivals, jump to next arrival
+        if not q and i < n:
+            current_time = sorted_data[i][1][0]
+            q.append(sorted_data[i][0])
+            i += 1
+
+    return timeline, stats
+
+
+def srtn(data, quantum=0.5, context_switch=0.0):
+    """
+    Implements the Shortest Remaining Time Next (SRTN) scheduling algorithm (preemptive).
+
+    The CPU always executes the process with the smallest remaining burst time.
+    If a new process arrives with a shorter remaining time, the current one is preempted.
+
+    Args:
+        data (dict): Process dictionary in the format:
+                     {pid: (arrival_time, burst_time, priority)}
+        quantum (float, optional): Simulation granularity (smaller = more accurate). Defaults to 0.5.
+        context_switch (float, optional): Context switch overhead (in time units). Defaults to 0.0.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (list): Sequence of executed blocks (proc, idle, cs)
+            - stats (dict): Per-process statistics
+    """
+
+    # Sort processes by arrival time and PID
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+    timeline = []
+    stats = {}
+
+    if not sorted_data:
+        return timeline, stats
+
+    # Remaining burst time per process
+    remaining = {pid: float(burst) for pid, (_, burst, _) in sorted_data}
+    arrival_map = {pid: float(arr) for pid, (arr, _, _) in sorted_data}
+
+    current_time = sorted_data[0][1][0]
+    i = 0
+    n = len(sorted_data)
+    active = {}
+
+    while i < n or active:
+        # Add all processes that have arrived by the current time
+        while i < n and sorted_data[i][1][0] <= current_time:
+            pid = sorted_data[i][0]
+            active[pid] = remaining[pid]
+            i += 1
+
+        # If no active process, CPU stays idle until next process arrives
+        if not active:
+            if i < n:
+                next_arr = sorted_data[i][1][0]
+                timeline.append({
+                    "start": current_time,
+                    "duration": next_arr - current_time,
+                    "pid": None,
+                    "type": "idle"
+                })
+                current_time = next_arr
+                continue
+            break
+
+        # Select process with the shortest remaining time
+        pid = min(active.items(), key=lambda kv: (kv[1], int(kv[0])))[0]
+        step = min(active[pid], quantum)
+
+        # Execute the selected process
+        timeline.append({
+            "start": current_time,
+            "duration": step,
+            "pid": pid,
+            "type": "proc"
+        })
+        
+        current_time += step
+        active[pid] -= step
+
+        # Add newly arrived processes during this quantum
+        while i < n and sorted_data[i][1][0] <= current_time:
+            newpid = sorted_data[i][0]
+            active[newpid] = remaining[newpid]
+            i += 1
+
+        # If the process finishes, record stats
+        if active[pid] <= 1e-12:
+            completion = current_time
+            stats[pid] = _stats_entry(data, pid, arrival_map[pid],
+                                          float(data[pid][1]), completion)
+            del active[pid]
+
+        # Apply context switch delay if applicable
+        if context_switch and active:
+            timeline.append({
+                "start": current_time,
+                "duration": context_switch,
+                "pid": None,
+                "type": "cs"
+            })
+            current_time += context_switch
+
+    return timeline, stats
+
+
+def mlfq(data, levels=3, quanta_list=None, context_switch=0.0, aging_threshold=10.0):
+    """
+    Simulates a realistic Multi-Level Feedback Queue (MLFQ) CPU scheduling algorithm.
+
+    This implementation models a real-world scheduler by assigning **different scheduling algorithms**
+    to different priority queues and by supporting **process aging** to prevent starvation.
+
+    Overview:
+        - Each process starts in the highest-priority queue (level 0).
+        - Each lower queue has a larger time quantum and a less preemptive policy.
+        - When a process exhausts its quantum without finishing, it is demoted to a lower level.
+        - Processes waiting too long in lower queues are promoted (aging).
+        - New arrivals always enter the top-level queue.
+        - Context switch overhead is simulated between executions.
+
+    Queue Behavior:
+        - Level 0 → Round Robin (small quantum, preemptive) - favors interactive tasks.
+        - Level 1 → Shortest Remaining Time Next (SRTN) - favors medium-length CPU-bound tasks.
+        - Level 2 or above → First Come First Serve (FCFS) - for long background or batch jobs.
+
+    Args:
+        data (dict): Dictionary of processes in the form:
+                     {
+                        pid: (arrival_time, burst_time, priority)
+                     }
+        levels (int, optional): Number of feedback queues. Default is 3.
+        quanta_list (list[float], optional): Time quantum for each level.
+                                             If None, defaults to [1, 3, 6].
+        context_switch (float, optional): Context switch time between processes. Default is 0.0.
+        aging_threshold (float, optional): Time threshold after which waiting processes
+                                           are promoted one level up. Default is 10.0.
+
+    Returns:
+        tuple: (timeline, stats)
+            - timeline (list[dict]): Sequence of timeline events such as:
+                {
+                    "start": <float>,       # start time
+                    "duration": <float>,    # duration of this event
+                    "pid": <str|None>,      # process ID or None for idle/CS
+                    "type": "proc"|"idle"|"cs",
+                    "level": <int>          # queue level (for processes only)
+                }
+            - stats (dict): Per-process statistics with turnaround and waiting times.
+    """
+
+
+    if quanta_list is None:
+        quanta_list = [1 * (2 ** i) for i in range(levels)]
+
+    # Ensure quanta list matches levels
+    while len(quanta_list) < levels:
+        quanta_list.append(quanta_list[-1] * 2)
+
+    # Sort input data: (arrival_time, burst_time, priority)
+    sorted_data = sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+    timeline, stats = [], {}
+    if not sorted_data:
+        return timeline, stats
+
+    remaining = {pid: float(burst) for pid, (_, burst, _) in sorted_data}
+    arrival = {pid: float(arr) for pid, (arr, _, _) in sorted_data}
+    last_active = {pid: arrival[pid] for pid in remaining}
+
+    queues = [deque() for _ in range(levels)]
+    current_time = sorted_data[0][1][0]
+    i, n = 0, len(sorted_data)
+
+    # Enqueue initial arrivals
+    while i < n and sorted_data[i][1][0] <= current_time:
+        queues[0].append(sorted_data[i][0])
+        i += 1
+
+    while any(queues) or i < n:
+        # Add new arrivals
+        while i < n and sorted_data[i][1][0] <= current_time:
+            queues[0].append(sorted_data[i][0])
+            last_active[sorted_data[i][0]] = current_time
+            i += 1
+
+        # Apply aging: promote if waiting too long
+        for lvl in range(1, levels):
+            promoted = []
+            for pid in list(queues[lvl]):
+                if current_time - last_active[pid] >= aging_threshold:
+                    queues[lvl].remove(pid)
+                    queues[lvl - 1].append(pid)
+                    promoted.append(pid)
+                    last_active[pid] = current_time
+
+        # Find first non-empty queue
+        cur_level = next((L for L in range(levels) if queues[L]), None)
+        if cur_level is None:
+            if i < n:
+                next_arr = sorted_data[i][1][0]
+                timeline.append({"start": current_time, 
+                                 "duration": next_arr - current_time, 
+                                 "pid": None, 
+                                 "type": "idle"})
+                current_time = next_arr
+                continue
+            break
+
+        # Choose process based on queue algorithm
+        if cur_level == 0:
+            # Round Robin
+            pid = queues[cur_level].popleft()
+        elif cur_level == 1:
+            # Shortest Remaining Time Next (SRTN)
+            pid = min(queues[cur_level], key=lambda p: remaining[p])
+            queues[cur_level].remove(pid)
+        else:
+            # FCFS
+            pid = queues[cur_level].popleft()
+
+        quantum = quanta_list[cur_level]
+        exec_time = min(remaining[pid], quantum)
+        timeline.append({"start": current_time, 
+                         "duration": exec_time, 
+                         "pid": pid, 
+                         "type": "proc", 
+                         "level": cur_level})
+        current_time += exec_time
+        remaining[pid] -= exec_time
+
+        # Track last activity for aging
+        last_active[pid] = current_time
+
+        # New arrivals during execution
+        while i < n and sorted_data[i][1][0] <= current_time:
+            queues[0].append(sorted_data[i][0])
+            last_active[sorted_data[i][0]] = current_time
+            i += 1
+
+        # Process completion or demotion
+        if remaining[pid] <= 1e-9:
+            stats[pid] = _stats_entry(data, pid, arrival[pid], float(data[pid][1]), current_time)
+        else:
+            new_level = min(levels - 1, cur_level + 1)
+            queues[new_level].append(pid)
+
+        # Context switch
+        if context_switch and any(queues):
+            timeline.append({"start": current_time, 
+                             "duration": context_switch, 
+                             "pid": None, 
+                             "type": "cs"})
+            current_time += context_switch
+
+    return timeline, stats
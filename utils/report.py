@@ -0,0 +1,613 @@
+"""
+Report export: streams stats, timeline segments and telemetry series to
+text, CSV, JSON Lines, JSON and a compact columnar binary format, with
+optional compression.
+"""
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import math
+import os
+import struct
+from array import array
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+
+from utils.metrics import PERCENTILES, compute_metrics, group_metrics
+from utils.timeline import expand_timeline
+
+# Per-process columns written for every stats entry, in order; the keys only some runs
+# add (deadline and lateness, group, io and io_wait, ...) follow them (see stats_fields)
+STATS_FIELDS = ["arrival", "burst", "priority", "completion", "turnaround", "waiting", "norm_turnaround", "response"]
+
+# Per-group columns of fair-share runs (see utils.metrics.group_metrics)
+GROUP_FIELDS = ["processes", "weight", "received", "entitled", "share", "entitled_share",
+                "avg_wait", "p50_wait", "p95_wait", "p99_wait"]
+
+# Timeline columns; "level" is only present for MLFQ segments
+TIMELINE_FIELDS = ["start", "duration", "pid", "type", "level"]
+
+# Rows formatted and written per bulk write
+CHUNK_ROWS = 65536
+
+# Write buffer handed to open()
+BUFFER_SIZE = 1 << 20
+
+COLUMNAR_MAGIC = b"OSSCOL\x01\n"
+
+_get_start = itemgetter("start")
+_get_duration = itemgetter("duration")
+_get_pid = itemgetter("pid")
+_get_type = itemgetter("type")
+_float_repr = float.__repr__
+_int_repr = int.__repr__
+
+_COMPRESSORS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+
+_FORMATS = {
+    ".txt": "text",
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".json": "json",
+    ".col": "columnar",
+}
+
+
+def detect_format(path):
+    """
+    Infer report format and compression from a file name.
+
+    Args:
+        path (str): Output path, e.g. "run.csv", "run.jsonl.gz" or "run.col.xz".
+
+    Returns:
+        tuple: (fmt, compress) where fmt is one of "text", "csv", "jsonl",
+               "json", "columnar" and compress is "gzip", "bz2", "xz" or None.
+    """
+    root, ext = os.path.splitext(path.lower())
+    compress = _COMPRESSORS.get(ext)
+    if compress:
+        root, ext = os.path.splitext(root)
+    return _FORMATS.get(ext, "text"), compress
+
+
+def open_output(path, compress=None, binary=False, level=1):
+    """
+    Open a buffered output stream, optionally compressed.
+
+    A low compression level is used by default because the reports are
+    dominated by repetitive numeric text and the fast levels already get
+    most of the size reduction.
+    """
+    mode = "wb" if binary else "wt"
+    kwargs = {} if binary else {"encoding": "utf-8", "newline": ""}
+    if compress == "gzip":
+        return gzip.open(path, mode, compresslevel=level, **kwargs)
+    if compress == "bz2":
+        return bz2.open(path, mode, compresslevel=max(1, level), **kwargs)
+    if compress == "xz":
+        return lzma.open(path, mode, preset=level, **kwargs)
+    if compress:
+        raise ValueError(f"Unknown compression: {compress}")
+    if binary:
+        return open(path, "wb", buffering=BUFFER_SIZE)
+    return open(path, "w", buffering=BUFFER_SIZE, **kwargs)
+
+
+def _chunks(iterable, size=CHUNK_ROWS):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stats_fields(stats):
+    """STATS_FIELDS followed by the other keys of the entries, in the order they are first seen."""
+    fields = dict.fromkeys(STATS_FIELDS)
+    shapes = set()
+    for v in stats.values():
+        shape = tuple(v)
+        if shape not in shapes:
+            shapes.add(shape)
+            fields.update(dict.fromkeys(shape))
+    return list(fields)
+
+
+def _stats_rows(stats, fields):
+    """Yield chunks of [pid, *fields] rows."""
+    for chunk in _chunks(stats.items()):
+        yield [[pid] + [v.get(k) for k in fields] for pid, v in chunk]
+
+
+def _timeline_rows(timeline):
+    """
+    Yield chunks of (start, duration, pid, type, level) rows; device segments
+    of runs with I/O follow the CPU segments with type "io:<device>".
+    """
+    for chunk in _chunks(expand_timeline(timeline)):
+        yield [(s["start"], s["duration"], s["pid"], s["type"], s.get("level")) for s in chunk]
+    for chunk in _chunks(getattr(timeline, "io_segments", ())):
+        yield [(s["start"], s["duration"], s["pid"], f"io:{s['device']}", None) for s in chunk]
+
+
+def sibling_path(path, suffix):
+    """
+    Derive a companion file name, e.g. ("out.csv.gz", "timeline") -> "out_timeline.csv.gz".
+    """
+    root, comp = os.path.splitext(path)
+    if comp.lower() not in _COMPRESSORS:
+        root, comp = path, ""
+    root, ext = os.path.splitext(root)
+    return f"{root}_{suffix}{ext}{comp}"
+
+
+# -------- Text --------
+
+def write_text_report(f, stats, metrics, header, telemetry=None, groups=None):
+    """
+    Write the fixed-width human readable report.
+
+    Args:
+        f: Writable text stream.
+        stats (dict): Per-process statistics.
+        metrics (dict): Output of compute_metrics(stats).
+        header (dict): Run description lines, e.g. {"Algorithm": "RR", ...}.
+        telemetry (Telemetry, optional): Adds a congestion summary of the windowed series.
+        groups (dict, optional): Output of group_metrics; adds a per-group table.
+    """
+    f.write("OS Scheduler Simulation Report\n")
+    f.write("Generated: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n")
+    for key, value in header.items():
+        f.write(f"{key}: {value}\n")
+    f.write("-"*80 + "\n")
+    f.write(f"{'PID':>4} {'Arrival':>8} {'Burst':>8} {'Pr':>4} {'Completion':>10} {'Waiting':>9} {'Turnaround':>11} {'N-Turn':>8}\n")
+    f.write("-"*80 + "\n")
+    rows = sorted(stats.items(), key=lambda kv: int(kv[0]) if str(kv[0]).isdigit() else kv[0])
+    fmt = "%4s %8.2f %8.2f %4d %10.2f %9.2f %11.2f %8.2f\n"
+    for chunk in _chunks(rows):
+        f.write("".join([fmt % (pid, v['arrival'], v['burst'], v['priority'], v['completion'],
+                                v['waiting'], v['turnaround'], v['norm_turnaround'])
+                         for pid, v in chunk]))
+    f.write("-"*80 + "\n")
+    if metrics:
+        f.write(f"Processes: {metrics['pcount']}\n")
+        f.write(f"Total time (makespan): {metrics['total_time']:.4f}\n")
+        f.write(f"CPU busy time: {metrics['cpu_time']:.4f}\n")
+        f.write(f"CPU utilization: {metrics['cpu_util']:.2f}%\n")
+        f.write(f"Avg waiting time: {metrics['avg_wait']:.4f}\n")
+        f.write(f"Avg turnaround time: {metrics['avg_turn']:.4f}\n")
+        f.write(f"Throughput: {metrics['throughput']:.6f} processes/unit time\n")
+        f.write(f"Avg response time: {metrics['avg_response']:.4f}\n")
+        for name, label in (("wait", "Waiting"), ("turn", "Turnaround"),
+                            ("norm_turn", "Normalized turnaround"), ("response", "Response")):
+            f.write(f"{label} p50/p95/p99: " +
+                    "/".join(f"{metrics[f'p{p}_{name}']:.4f}" for p in PERCENTILES) + "\n")
+        if "deadline_misses" in metrics:
+            f.write(f"Deadline misses: {metrics['deadline_misses']} ({metrics['miss_ratio']:.2f}%)\n")
+            f.write(f"Lateness max/avg: {metrics['max_lateness']:.4f}/{metrics['avg_lateness']:.4f}\n")
+        if "schedulable" in metrics:
+            f.write(f"Task utilization: {metrics['rt_utilization']:.4f} (bound {metrics['rt_bound']:.4f}), "
+                    f"schedulable: {'yes' if metrics['schedulable'] else 'no'}\n")
+        for key, value in metrics.items():
+            if key.startswith("io_util_"):
+                f.write(f"Device {key[len('io_util_'):]} utilization: {value:.2f}%\n")
+        if "groups" in metrics:
+            f.write(f"Groups: {metrics['groups']}, largest share gap {metrics['share_error_max']:.2f} points, "
+                    f"fairness index {metrics['fairness']:.4f}\n")
+    if groups:
+        f.write("-"*80 + "\n")
+        f.write(f"{'Group':>8} {'Procs':>6} {'Weight':>7} {'Share%':>7} {'Entitled%':>9} {'Wait p50':>9} {'p95':>9} {'p99':>9}\n")
+        for g, v in groups.items():
+            f.write("%8s %6d %7g %7.2f %9.2f %9.2f %9.2f %9.2f\n" % (g, v['processes'], v['weight'], v['share'],
+                                                                  v['entitled_share'], v['p50_wait'],
+                                                                  v['p95_wait'], v['p99_wait']))
+    if telemetry is not None and telemetry.congestion() is not None:
+        series = telemetry.series()
+        start, mean = telemetry.congestion()
+        f.write(f"Telemetry: {len(series['window_start'])} windows of {telemetry.window:.4f}\n")
+        f.write(f"Peak ready queue: mean {mean:.2f} in window starting at {start:.4f}, "
+                f"max {max(series['ready_max']):.0f}\n")
+        f.write(f"Lowest window utilization: {min(series['busy']) * 100:.2f}%\n")
+
+
+# -------- CSV --------
+
+def _csv_cell(v):
+    if v is None:
+        return ""
+    if isinstance(v, str):
+        if "," in v or '"' in v or "\n" in v or "\r" in v:
+            return '"' + v.replace('"', '""') + '"'
+        return v
+    return str(v)
+
+
+def _csv_column(values):
+    """CSV cells of one column, as csv.writer formats them (repr for floats, "" for None)."""
+    kinds = set(map(type, values))
+    # Single-type columns, the bulk of a report, are formatted in one C-level pass
+    if kinds == {float}:
+        return list(map(_float_repr, values))
+    if kinds == {int}:
+        return list(map(_int_repr, values))
+    if kinds <= {str, type(None)}:
+        cells = [v or "" for v in values] if type(None) in kinds else values
+        joined = "".join(cells)
+        if not ("," in joined or '"' in joined or "\n" in joined or "\r" in joined):
+            return cells
+    return [_csv_cell(v) for v in values]
+
+
+def _write_csv_columns(f, columns):
+    """
+    Write equally long columns as CSV rows. Formatting a column at a time
+    and joining the cells is about 1.4 times as fast as csv.writer on rows;
+    most of what remains is repr() of the floats.
+    """
+    cells = [_csv_column(values) for values in columns]
+    if cells and cells[0]:
+        f.write("\r\n".join(map(",".join, zip(*cells))) + "\r\n")
+
+
+def write_stats_csv(f, stats):
+    """Stream per-process statistics as CSV rows (completion order); columns as stats_fields()."""
+    fields = stats_fields(stats)
+    csv.writer(f).writerow(["pid"] + fields)
+    for chunk in _chunks(stats.items()):
+        entries = [v for _, v in chunk]
+        _write_csv_columns(f, [[pid for pid, _ in chunk]] + [[v.get(k) for v in entries] for k in fields])
+
+
+def write_timeline_csv(f, timeline):
+    """
+    Stream timeline segments as CSV rows; device segments of runs with I/O
+    follow the CPU segments with type "io:<device>".
+    """
+    csv.writer(f).writerow(TIMELINE_FIELDS)
+    for chunk in _chunks(expand_timeline(timeline)):
+        _write_csv_columns(f, [list(map(_get_start, chunk)), list(map(_get_duration, chunk)),
+                               list(map(_get_pid, chunk)), list(map(_get_type, chunk)),
+                               [s.get("level") for s in chunk]])
+    for chunk in _chunks(getattr(timeline, "io_segments", ())):
+        _write_csv_columns(f, [list(map(_get_start, chunk)), list(map(_get_duration, chunk)),
+                               list(map(_get_pid, chunk)), [f"io:{s['device']}" for s in chunk],
+                               [None] * len(chunk)])
+
+
+def write_groups_csv(f, groups):
+    """One row per fair-share group; columns as GROUP_FIELDS."""
+    writer = csv.writer(f)
+    writer.writerow(["group"] + GROUP_FIELDS)
+    writer.writerows([g] + [v[k] for k in GROUP_FIELDS] for g, v in groups.items())
+
+
+def write_metrics_csv(f, metrics):
+    writer = csv.writer(f)
+    writer.writerow(["metric", "value"])
+    writer.writerows(metrics.items())
+
+
+def write_telemetry_csv(f, telemetry):
+    """One row per telemetry window; columns as Telemetry.series()."""
+    series = telemetry.series()
+    writer = csv.writer(f)
+    writer.writerow(list(series))
+    writer.writerows(zip(*series.values()))
+
+
+# -------- JSON Lines / JSON --------
+
+def _json_value(v):
+    # json.dumps is the slow part of JSONL export; numbers are formatted directly.
+    # JSON has no inf/nan, so non-finite numbers are written as null
+    if v is None:
+        return "null"
+    if isinstance(v, float):
+        return repr(float(v)) if math.isfinite(v) else "null"
+    if isinstance(v, str):
+        return json.dumps(v)
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, int):
+        return repr(int(v))
+    if hasattr(v, "item"):
+        # NumPy scalar
+        return _json_value(v.item())
+    return json.dumps(_jsonable(v))
+
+
+def _jsonable(value):
+    """`value` with non-finite floats replaced by None and NumPy scalars by Python ones, for json.dumps."""
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, array)):
+        return [_jsonable(v) for v in value]
+    if hasattr(value, "item") and not isinstance(value, (int, float, str)):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def write_jsonl(f, stats, timeline=None, metrics=None, header=None, telemetry=None, groups=None):
+    """
+    Stream a run as JSON Lines.
+
+    Every line is an object with a "record" field: one "run" header line,
+    one "stats" line per process, one "segment" line per timeline segment,
+    one "telemetry" line per telemetry window, one "group" line per
+    fair-share group and a final "metrics" line.
+    """
+    f.write(json.dumps(_jsonable({"record": "run", **(header or {})})) + "\n")
+    fields = stats_fields(stats)
+    keys = ["pid"] + fields
+    prefix = '{"record":"stats"'
+    for chunk in _stats_rows(stats, fields):
+        f.write("".join([prefix + "".join([',"%s":%s' % (k, _json_value(v)) for k, v in zip(keys, row)]) + "}\n"
+                         for row in chunk]))
+    if timeline is not None:
+        prefix = '{"record":"segment"'
+        for chunk in _timeline_rows(timeline):
+            f.write("".join([prefix + ',"start":%s,"duration":%s,"pid":%s,"type":"%s"%s}\n'
+                             % (_json_value(start), _json_value(dur), _json_value(pid), typ, "" if level is None else ',"level":%d' % level)
+                             for start, dur, pid, typ, level in chunk]))
+    if telemetry is not None:
+        series = telemetry.series()
+        keys = list(series)
+        prefix = '{"record":"telemetry"'
+        for chunk in _chunks(zip(*series.values())):
+            f.write("".join([prefix + "".join([',"%s":%s' % (k, _json_value(v)) for k, v in zip(keys, row)]) + "}\n"
+                             for row in chunk]))
+    for g, v in (groups or {}).items():
+        f.write(json.dumps(_jsonable({"record": "group", "group": g, **v})) + "\n")
+    if metrics is not None:
+        f.write(json.dumps(_jsonable({"record": "metrics", **metrics})) + "\n")
+
+
+def write_stats_json(f, stats):
+    """Stream the stats mapping as one compact JSON object {pid: {...}}."""
+    f.write("{")
+    first = True
+    for chunk in _chunks(stats.items()):
+        body = ",".join([json.dumps(str(pid)) + ":{" + ",".join(['"%s":%s' % (k, _json_value(x))
+                                                                 for k, x in v.items()]) + "}"
+                         for pid, v in chunk])
+        f.write(body if first else "," + body)
+        first = False
+    f.write("}")
+
+
+def write_json(f, stats, timeline=None, metrics=None, header=None, telemetry=None, groups=None):
+    """
+    Stream a run as one JSON document {"run", "stats", "timeline",
+    "telemetry", "groups", "metrics"}. "stats" maps pid to its entry,
+    "timeline" is a list of segments ({"start", "duration", "pid", "type"},
+    "level" for MLFQ, type "io:<device>" for device segments) and
+    "telemetry" maps each series name to its per-window list. Keys without
+    data (no timeline, telemetry or groups) are left out.
+    """
+    f.write('{"run":' + json.dumps(_jsonable(header or {})) + ',"stats":')
+    write_stats_json(f, stats)
+    if timeline is not None:
+        f.write(',"timeline":[')
+        first = True
+        for chunk in _timeline_rows(timeline):
+            body = ",".join(['{"start":%s,"duration":%s,"pid":%s,"type":"%s"%s}'
+                             % (_json_value(start), _json_value(dur), _json_value(pid), typ, "" if level is None else ',"level":%d' % level)
+                             for start, dur, pid, typ, level in chunk])
+            f.write(body if first else "," + body)
+            first = False
+        f.write("]")
+    if telemetry is not None:
+        f.write(',"telemetry":' + json.dumps(_jsonable(telemetry.series())))
+    if groups:
+        f.write(',"groups":' + json.dumps(_jsonable(groups)))
+    if metrics is not None:
+        f.write(',"metrics":' + json.dumps(_jsonable(metrics)))
+    f.write("}\n")
+
+
+# -------- Columnar binary --------
+#
+# Layout: COLUMNAR_MAGIC, then a sequence of blocks. Each block is
+#   <u32 header length> <JSON header> and, per column, <u64 byte length> <bytes>.
+# The header is {"table": name, "rows": n, "columns": [[name, code], ...]}.
+# Numeric columns use array typecodes ("d" float64, "q" int64), string columns
+# use code "s" and are stored newline-joined UTF-8 (None is stored as "").
+# Stats columns beyond STATS_FIELDS are float64 when numeric, int64 (0/1) when
+# boolean and strings otherwise.
+# Large tables are split into several blocks so writing stays streaming.
+
+_NAN = float("nan")
+
+
+def _write_block(f, table, columns):
+    rows = len(columns[0][2]) if columns else 0
+    header = json.dumps({"table": table, "rows": rows,
+                         "columns": [[name, code] for name, code, _ in columns]}).encode()
+    parts = [struct.pack("<I", len(header)), header]
+    for _, code, values in columns:
+        if code == "s":
+            raw = "\n".join(["" if v is None else str(v) for v in values]).encode()
+        else:
+            raw = array(code, values).tobytes()
+        parts.append(struct.pack("<Q", len(raw)))
+        parts.append(raw)
+    f.write(b"".join(parts))
+
+
+def _extra_column(name, values):
+    """(name, code, values) of a stats column outside STATS_FIELDS: float64 when numeric, int64 flags, else strings."""
+    if values and all(isinstance(v, bool) for v in values):
+        return name, "q", [int(v) for v in values]
+    if all(v is None or (isinstance(v, (int, float)) and not isinstance(v, bool)) for v in values):
+        return name, "d", [_NAN if v is None else v for v in values]
+    return name, "s", values
+
+
+def write_columnar(f, stats, timeline=None, metrics=None, header=None, telemetry=None, groups=None):
+    """Write a run in the columnar binary format to a binary stream."""
+    f.write(COLUMNAR_MAGIC)
+    _write_block(f, "run", [("json", "s", [json.dumps(_jsonable(header or {}))])])
+    fields = stats_fields(stats)
+    for chunk in _chunks(stats.items()):
+        pids = [pid for pid, _ in chunk]
+        entries = [v for _, v in chunk]
+        columns = [("pid", "s", pids)]
+        for name in fields:
+            if name == "priority":
+                columns.append((name, "q", [v.get(name, 0) for v in entries]))
+            elif name in STATS_FIELDS:
+                columns.append((name, "d", [v.get(name, _NAN) for v in entries]))
+            else:
+                columns.append(_extra_column(name, [v.get(name) for v in entries]))
+        _write_block(f, "stats", columns)
+    if timeline is not None:
+        for chunk in _chunks(expand_timeline(timeline)):
+            _write_block(f, "timeline", [
+                ("start", "d", list(map(_get_start, chunk))),
+                ("duration", "d", list(map(_get_duration, chunk))),
+                ("pid", "s", list(map(_get_pid, chunk))),
+                ("type", "s", list(map(_get_type, chunk))),
+                ("level", "q", [s.get("level", -1) for s in chunk]),
+            ])
+        for chunk in _chunks(getattr(timeline, "io_segments", ())):
+            _write_block(f, "io", [
+                ("start", "d", list(map(_get_start, chunk))),
+                ("duration", "d", list(map(_get_duration, chunk))),
+                ("pid", "s", list(map(_get_pid, chunk))),
+                ("device", "s", [s["device"] for s in chunk]),
+            ])
+    if telemetry is not None:
+        series = telemetry.series()
+        _write_block(f, "telemetry", [(name, "d", list(values)) for name, values in series.items()])
+    if groups:
+        _write_block(f, "groups", [("group", "s", [str(g) for g in groups])] +
+                     [(name, "q" if name == "processes" else "d", [v[name] for v in groups.values()])
+                      for name in GROUP_FIELDS])
+    if metrics is not None:
+        _write_block(f, "metrics", [("json", "s", [json.dumps(_jsonable(metrics))])])
+
+
+def read_columnar(path):
+    """
+    Read a columnar report back into {table: {column: list}}.
+
+    Compression is detected from the file name like on export.
+    """
+    _, compress = detect_format(path)
+    tables = {}
+    with _open_input(path, compress) as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar report")
+        while True:
+            raw = f.read(4)
+            if not raw:
+                break
+            (hlen,) = struct.unpack("<I", raw)
+            header = json.loads(f.read(hlen))
+            table = tables.setdefault(header["table"], {})
+            for name, code in header["columns"]:
+                (blen,) = struct.unpack("<Q", f.read(8))
+                data = f.read(blen)
+                if code == "s":
+                    values = [v if v else None for v in data.decode().split("\n")] if header["rows"] else []
+                else:
+                    values = array(code, data).tolist()
+                table.setdefault(name, []).extend(values)
+    return tables
+
+
+def _open_input(path, compress):
+    if compress == "gzip":
+        return gzip.open(path, "rb")
+    if compress == "bz2":
+        return bz2.open(path, "rb")
+    if compress == "xz":
+        return lzma.open(path, "rb")
+    return open(path, "rb", buffering=BUFFER_SIZE)
+
+
+# -------- Entry point --------
+
+def export_report(path, stats, timeline=None, fmt=None, compress=None, header=None, metrics=None, telemetry=None):
+    """
+    Export a simulation run.
+
+    Format and compression default to what the file name says
+    (see detect_format). CSV output is split into sibling files:
+    `path` holds the stats, `<name>_timeline.csv` the segments,
+    `<name>_telemetry.csv` the windowed series, `<name>_groups.csv` the
+    per-group figures of fair-share runs and `<name>_metrics.csv` the
+    aggregate metrics. The other formats hold everything in one file.
+
+    Args:
+        path (str): Output path.
+        stats (dict): Per-process statistics.
+        timeline (list, optional): Timeline segments; omitted from the report if None.
+        fmt (str, optional): "text", "csv", "jsonl", "json" or "columnar".
+        compress (str, optional): "gzip", "bz2" or "xz".
+        header (dict, optional): Run description (algorithm, parameters, ...).
+        metrics (dict, optional): Precomputed aggregate metrics; computed from stats if None.
+        telemetry (Telemetry, optional): Windowed series; defaults to the timeline's
+                                         `telemetry` attribute when it has one.
+
+    Returns:
+        list[str]: Paths written.
+    """
+    detected_fmt, detected_compress = detect_format(path)
+    fmt = fmt or detected_fmt
+    compress = compress or detected_compress
+    header = header or {}
+    if metrics is None:
+        metrics = compute_metrics(stats, timeline)
+    if telemetry is None:
+        telemetry = getattr(timeline, "telemetry", None)
+    groups = group_metrics(stats, timeline)
+
+    if fmt == "text":
+        with open_output(path, compress) as f:
+            write_text_report(f, stats, metrics, header, telemetry, groups)
+        return [path]
+    if fmt == "csv":
+        written = [path]
+        with open_output(path, compress) as f:
+            write_stats_csv(f, stats)
+        if timeline is not None:
+            written.append(sibling_path(path, "timeline"))
+            with open_output(written[-1], compress) as f:
+                write_timeline_csv(f, timeline)
+        if telemetry is not None:
+            written.append(sibling_path(path, "telemetry"))
+            with open_output(written[-1], compress) as f:
+                write_telemetry_csv(f, telemetry)
+        if groups:
+            written.append(sibling_path(path, "groups"))
+            with open_output(written[-1], compress) as f:
+                write_groups_csv(f, groups)
+        written.append(sibling_path(path, "metrics"))
+        with open_output(written[-1], compress) as f:
+            write_metrics_csv(f, metrics)
+        return written
+    if fmt == "jsonl":
+        with open_output(path, compress) as f:
+            write_jsonl(f, stats, timeline, metrics, header, telemetry, groups)
+        return [path]
+    if fmt == "json":
+        with open_output(path, compress) as f:
+            write_json(f, stats, timeline, metrics, header, telemetry, groups)
+        return [path]
+    if fmt == "columnar":
+        with open_output(path, compress, binary=True) as f:
+            write_columnar(f, stats, timeline, metrics, header, telemetry, groups)
+        return [path]
+    raise ValueError(f"Unknown report format: {fmt}")
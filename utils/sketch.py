@@ -0,0 +1,130 @@
+"""
+Mergeable quantile sketch for streaming latency percentiles
+"""
+import math
+
+
+class QuantileSketch:
+    """
+    Log-bucketed histogram with bounded relative error (DDSketch / HDR style).
+
+    Every positive value x is counted in bucket ceil(log(x) / log(gamma)),
+    where gamma = (1 + alpha) / (1 - alpha), so any quantile is returned
+    within a relative error of `alpha`. Values at or below `min_value`
+    (zero waiting times, float noise) share a single zero bucket.
+
+    Sketches built with the same `alpha` merge by adding bucket counts, so
+    per-worker sketches can be combined into exact-as-serial results. Memory
+    is bounded by `max_buckets`: when exceeded, the lowest buckets are
+    collapsed together, which only degrades accuracy of the smallest values.
+    """
+
+    def __init__(self, alpha=0.01, max_buckets=2048, min_value=1e-9):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value, count=1):
+        """Record `value` `count` times."""
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= self.min_value:
+            self.zero_count += count
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets + 1
+        low = keys[excess]
+        for key in keys[:excess]:
+            self.buckets[low] += self.buckets.pop(key)
+
+    def merge(self, other):
+        """Add the counts of another sketch (same alpha) into this one."""
+        if other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, cnt in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + cnt
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+        return self
+
+    def _value(self, key):
+        # Midpoint (in relative terms) of bucket (gamma^(key-1), gamma^key]
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        """
+        Nearest-rank q-quantile (0 <= q <= 1), or 0.0 for an empty sketch.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        if rank <= self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                return min(max(self._value(key), self.min), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def histogram(self, bins=20):
+        """
+        Re-bin the sketch into `bins` equal-width bins over [min, max].
+
+        Returns:
+            tuple: (edges, counts) with len(edges) == bins + 1.
+        """
+        if self.count == 0:
+            return [], []
+        lo, hi = min(self.min, 0.0), self.max
+        width = (hi - lo) / bins if hi > lo else 1.0
+        edges = [lo + width * k for k in range(bins + 1)]
+        counts = [0] * bins
+        counts[min(bins - 1, int((0.0 - lo) / width))] += self.zero_count
+        for key, cnt in self.buckets.items():
+            counts[min(bins - 1, max(0, int((self._value(key) - lo) / width)))] += cnt
+        return edges, counts
+
+    def to_dict(self):
+        """Plain-data form, e.g. for JSON transport between sweep workers."""
+        return {"alpha": self.alpha, "max_buckets": self.max_buckets, "min_value": self.min_value,
+                "buckets": {str(k): v for k, v in self.buckets.items()}, "zero_count": self.zero_count,
+                "count": self.count, "total": self.total,
+                "min": self.min if self.count else None, "max": self.max if self.count else None}
+
+    @classmethod
+    def from_dict(cls, d):
+        sketch = cls(d["alpha"], d["max_buckets"], d["min_value"])
+        sketch.buckets = {int(k): v for k, v in d["buckets"].items()}
+        sketch.zero_count = d["zero_count"]
+        sketch.count = d["count"]
+        sketch.total = d["total"]
+        if d["count"]:
+            sketch.min, sketch.max = d["min"], d["max"]
+        return sketch
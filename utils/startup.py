@@ -0,0 +1,30 @@
+"""
+Startup timing marks for the GUI.
+
+Import this module first; times are measured from that import.
+
+    python scheduler.py --startup-report          # print the report once the figure is ready
+    python scheduler.py --startup-report --exit   # ... and quit (for regression tracking)
+"""
+import time
+
+_T0 = time.perf_counter()
+_marks = []
+
+
+def mark(name):
+    """Record that startup phase `name` finished now."""
+    _marks.append((name, time.perf_counter() - _T0))
+
+
+def marks():
+    """[(name, seconds since start)] in the order recorded."""
+    return list(_marks)
+
+
+def report():
+    """Startup timings as printable text."""
+    lines = ["Startup timings (ms since launch):"]
+    for name, seconds in _marks:
+        lines.append(f"  {name:<24} {seconds * 1000:9.1f}")
+    return "\n".join(lines)
@@ -0,0 +1,439 @@
+"""
+Parameter sweeps: many configurations (an algorithm plus Scheduler.run
+parameters) on one workload, each reduced to its compute_metrics.
+
+run_sweep() runs a sweep in a local process pool. For sweeps larger than
+one host, a Coordinator serves the configurations over TCP and workers
+(run_worker, e.g. `python cli.py worker --connect host:port`) on any host
+pull them in batches:
+
+    worker      -> {"type": "hello", "worker", "workloads": [cached digests]}
+    worker      -> {"type": "request"}
+    coordinator -> {"type": "workload", "digest", "data"}   only if not cached
+    coordinator -> {"type": "batch", "batch", "digest", "configs": [[index, config], ...]}
+                   or {"type": "wait"} or {"type": "done"}
+    worker      -> {"type": "result", "batch", "index", "metrics" | "error"}  per configuration
+    worker      -> {"type": "ping"}                                         every heartbeat
+
+Messages are JSON lines; the workload travels zlib-compressed once per
+worker and is cached by its content hash (on disk with a cache directory,
+so a restarted worker does not fetch it again). Results stream back as
+each configuration finishes.
+
+Slow and dead workers: when no configurations are left to hand out, an
+idle worker steals the back half of the oldest batch that has been
+running for `steal_after` seconds; whichever copy finishes first counts.
+A worker that disconnects or stays silent for `timeout` seconds loses its
+batches to the queue, and a configuration that raises is retried on
+another request, both up to `max_attempts` times.
+"""
+import base64
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+from utils.metrics import compute_metrics
+from utils.tuning import workload_digest
+
+# Workload of a local pool worker; set once by _init_worker
+_WORKLOAD = None
+
+
+def expand_grid(grid):
+    """
+    Configurations of a parameter grid: the cartesian product of every
+    list in `grid`, e.g. {"algorithm": ["RR", "MLFQ"], "quantum": [1, 2]}
+    gives four configurations. Values that are not lists are fixed.
+    """
+    keys = list(grid)
+    values = [v if isinstance(v, (list, tuple)) else [v] for v in grid.values()]
+    return [dict(zip(keys, combination)) for combination in product(*values)]
+
+
+def evaluate(data, config):
+    """Metrics of one configuration {"algorithm", **Scheduler.run parameters} on `data` (stats-only)."""
+    from scheduler import Scheduler
+
+    params = dict(config)
+    algorithm = params.pop("algorithm")
+    timeline, stats = Scheduler(data).run(algorithm, timeline=False, **params)
+    return compute_metrics(stats, timeline)
+
+
+def _init_worker(data):
+    global _WORKLOAD
+    _WORKLOAD = data
+
+
+def _evaluate_shared(config):
+    return evaluate(_WORKLOAD, config)
+
+
+def run_sweep(data, configs, max_workers=None, on_result=None):
+    """
+    Run a sweep in a local process pool (the workload goes to each worker once).
+
+    Args:
+        data (dict): Workload {pid: (arrival, burst, priority)}.
+        configs (list[dict]): Configurations {"algorithm", **Scheduler.run parameters}.
+        max_workers (int, optional): Worker processes.
+        on_result (callable, optional): on_result(index, result) as each configuration finishes.
+
+    Returns:
+        list[dict]: Per configuration, in order: {"config", "metrics"} or {"config", "error"}.
+    """
+    results = [None] * len(configs)
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(data,)) as executor:
+        futures = {executor.submit(_evaluate_shared, config): k for k, config in enumerate(configs)}
+        for future in as_completed(futures):
+            k = futures[future]
+            try:
+                results[k] = {"config": configs[k], "metrics": future.result()}
+            except Exception as exc:
+                results[k] = {"config": configs[k], "error": f"{type(exc).__name__}: {exc}"}
+            if on_result is not None:
+                on_result(k, results[k])
+    return results
+
+
+class _Connection:
+    """JSON-lines messages over a socket; send() may be called from several threads."""
+
+    def __init__(self, sock, timeout=None):
+        sock.settimeout(timeout)
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+        self.lock = threading.Lock()
+
+    def send(self, message):
+        line = json.dumps(message).encode() + b"\n"
+        with self.lock:
+            self.sock.sendall(line)
+
+    def recv(self):
+        """Next message, or None when the peer has closed the connection."""
+        line = self.reader.readline()
+        return json.loads(line) if line else None
+
+    def close(self):
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def _pack_workload(data):
+    return base64.b64encode(zlib.compress(json.dumps(data).encode())).decode("ascii")
+
+
+def _unpack_workload(text):
+    return json.loads(zlib.decompress(base64.b64decode(text)))
+
+
+class Coordinator:
+    """
+    TCP coordinator of a distributed sweep.
+
+    Args:
+        data (dict): Workload every configuration runs on.
+        configs (list[dict]): Configurations {"algorithm", **Scheduler.run parameters}.
+        host (str): Interface to listen on ("0.0.0.0" for every host).
+        port (int): Port; 0 picks a free one (see `address`).
+        batch_size (int): Configurations per batch.
+        steal_after (float): Seconds after which an idle worker may steal from a batch.
+        max_attempts (int): Tries per configuration (errors and lost workers).
+        timeout (float): Seconds of silence after which a worker counts as dead.
+        on_result (callable, optional): on_result(index, result) for each finished configuration.
+
+    Attributes:
+        results (list): Per configuration {"config", "metrics", "worker"} or {"config", "error"};
+                        None until finished.
+        workers (dict): {worker name: configurations it finished first}.
+    """
+
+    def __init__(self, data, configs, host="127.0.0.1", port=0, batch_size=16, steal_after=30.0, max_attempts=3,
+                 timeout=60.0, on_result=None):
+        self.configs = list(configs)
+        self.digest = workload_digest(data)
+        self.packed = _pack_workload(data)
+        self.batch_size = batch_size
+        self.steal_after = steal_after
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.on_result = on_result
+        self.results = [None] * len(self.configs)
+        self.workers = {}
+        self.pending = deque(range(len(self.configs)))
+        self.attempts = [0] * len(self.configs)
+        self.remaining = len(self.configs)
+        # batch id -> {"worker", "started", "indices": set of unfinished indices}
+        self.inflight = {}
+        self.next_batch = 0
+        self.lock = threading.Condition()
+
+        coordinator = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                coordinator._serve_worker(self.request)
+
+        self.server = _Server((host, port), Handler)
+        self.thread = None
+
+    @property
+    def address(self):
+        """(host, port) the coordinator listens on."""
+        return self.server.server_address
+
+    @property
+    def finished(self):
+        return self.remaining == 0
+
+    def start(self):
+        """Accept workers in a background thread."""
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.1},
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        """Block until every configuration has finished; returns the results (None entries on timeout)."""
+        with self.lock:
+            self.lock.wait_for(lambda: self.remaining == 0, timeout)
+        return self.results
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run(self, timeout=None):
+        """start(), wait() and close(): serve the whole sweep and return its results."""
+        self.start()
+        try:
+            return self.wait(timeout)
+        finally:
+            self.close()
+
+    # -------- scheduling (all under self.lock) --------
+
+    def _take_batch(self, worker):
+        """Indices for `worker`: pending ones, else a steal from a slow batch; [] to wait, None when done."""
+        if self.remaining == 0:
+            return None
+        indices = []
+        while self.pending and len(indices) < self.batch_size:
+            k = self.pending.popleft()
+            if self.results[k] is None:
+                indices.append(k)
+        if not indices:
+            now = time.monotonic()
+            candidates = [entry for entry in self.inflight.values()
+                          if entry["worker"] != worker and entry["indices"]
+                          and now - entry["started"] >= self.steal_after]
+            if candidates:
+                victim = min(candidates, key=lambda entry: entry["started"])
+                unfinished = sorted(k for k in victim["indices"] if self.results[k] is None)
+                # The victim works from the front, so take the back half. It may still finish
+                # them too (the first result counts), but they are no longer its to requeue.
+                indices = unfinished[len(unfinished) // 2:]
+                victim["indices"].difference_update(indices)
+        return indices
+
+    def _record(self, worker, batch, k, metrics=None, error=None):
+        entry = self.inflight.get(batch)
+        if entry is not None:
+            entry["indices"].discard(k)
+            if not entry["indices"]:
+                del self.inflight[batch]
+        if self.results[k] is not None:
+            return                      # a stolen duplicate finished second
+        if error is not None:
+            self.attempts[k] += 1
+            if self.attempts[k] < self.max_attempts:
+                self.pending.append(k)
+                return
+            result = {"config": self.configs[k], "error": error, "worker": worker}
+        else:
+            result = {"config": self.configs[k], "metrics": metrics, "worker": worker}
+            self.workers[worker] = self.workers.get(worker, 0) + 1
+        self.results[k] = result
+        self.remaining -= 1
+        if self.on_result is not None:
+            self.on_result(k, result)
+        if self.remaining == 0:
+            self.lock.notify_all()
+
+    def _lose(self, worker, batches):
+        """Requeue the unfinished configurations of a worker that went away."""
+        for batch in batches:
+            entry = self.inflight.pop(batch, None)
+            if entry is None:
+                continue
+            for k in sorted(entry["indices"], reverse=True):
+                if self.results[k] is not None:
+                    continue
+                self.attempts[k] += 1
+                if self.attempts[k] < self.max_attempts:
+                    self.pending.appendleft(k)
+                else:
+                    self._record(worker, None, k, error=f"worker {worker} lost")
+
+    # -------- one connection per worker --------
+
+    def _serve_worker(self, sock):
+        conn = _Connection(sock, self.timeout)
+        worker, batches = None, set()
+        try:
+            hello = conn.recv()
+            if not hello or hello.get("type") != "hello":
+                return
+            worker = hello.get("worker") or "%s:%d" % sock.getpeername()[:2]
+            has_workload = self.digest in hello.get("workloads", ())
+            while True:
+                message = conn.recv()
+                if message is None:
+                    return
+                kind = message.get("type")
+                if kind == "result":
+                    with self.lock:
+                        self._record(worker, message["batch"], message["index"], message.get("metrics"),
+                                     message.get("error"))
+                elif kind == "request":
+                    with self.lock:
+                        indices = self._take_batch(worker)
+                        if indices:
+                            batch = self.next_batch
+                            self.next_batch += 1
+                            self.inflight[batch] = {"worker": worker, "started": time.monotonic(),
+                                                    "indices": set(indices)}
+                            batches.add(batch)
+                    if indices is None:
+                        conn.send({"type": "done"})
+                        return
+                    if not indices:
+                        conn.send({"type": "wait"})
+                        continue
+                    if not has_workload:
+                        conn.send({"type": "workload", "digest": self.digest, "data": self.packed})
+                        has_workload = True
+                    conn.send({"type": "batch", "batch": batch, "digest": self.digest,
+                               "configs": [[k, self.configs[k]] for k in indices]})
+        except (OSError, ValueError):
+            pass                        # timeout, reset or garbage: the worker is lost
+        finally:
+            with self.lock:
+                self._lose(worker, batches)
+            conn.close()
+
+
+def _connect(address, connect_timeout):
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            return socket.create_connection(address, timeout=10.0)
+        except OSError:
+            # The coordinator may not be up yet
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.5)
+
+
+def run_worker(address, name=None, processes=1, cache_dir=None, heartbeat=10.0, connect_timeout=30.0):
+    """
+    Work for a Coordinator at `address` (host, port) until the sweep is done.
+
+    Args:
+        address (tuple): (host, port) of the coordinator.
+        name (str, optional): Worker name in the results; defaults to host:pid.
+        processes (int): Configurations run in parallel on this host.
+        cache_dir (str, optional): Directory of workloads by digest, kept across runs.
+        heartbeat (float): Seconds between pings, so long runs do not look like a dead worker.
+        connect_timeout (float): Seconds to keep retrying while the coordinator is not up.
+
+    Returns:
+        int: Configurations run.
+    """
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    workloads = {}
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        cached = [f[:-len(".json.z")] for f in os.listdir(cache_dir) if f.endswith(".json.z")]
+    else:
+        cached = []
+
+    def workload(digest):
+        if digest not in workloads:
+            with open(os.path.join(cache_dir, digest + ".json.z"), "rb") as f:
+                workloads[digest] = json.loads(zlib.decompress(f.read()))
+        return workloads[digest]
+
+    conn = _Connection(_connect(address, connect_timeout))
+    stop = threading.Event()
+
+    def ping():
+        while not stop.wait(heartbeat):
+            try:
+                conn.send({"type": "ping"})
+            except OSError:
+                return
+
+    threading.Thread(target=ping, daemon=True).start()
+    executor, pool_digest, done = None, None, 0
+    try:
+        conn.send({"type": "hello", "worker": name, "workloads": cached})
+        while True:
+            conn.send({"type": "request"})
+            message = conn.recv()
+            if message is None or message["type"] == "done":
+                break
+            if message["type"] == "wait":
+                time.sleep(0.2)
+                continue
+            if message["type"] == "workload":
+                workloads[message["digest"]] = _unpack_workload(message["data"])
+                if cache_dir:
+                    path = os.path.join(cache_dir, message["digest"] + ".json.z")
+                    with open(path + ".tmp", "wb") as f:
+                        f.write(zlib.compress(json.dumps(workloads[message["digest"]]).encode()))
+                    os.replace(path + ".tmp", path)
+                message = conn.recv()
+            batch, digest = message["batch"], message["digest"]
+            if processes > 1:
+                if pool_digest != digest:
+                    if executor is not None:
+                        executor.shutdown()
+                    executor = ProcessPoolExecutor(processes, initializer=_init_worker,
+                                                   initargs=(workload(digest),))
+                    pool_digest = digest
+                futures = {executor.submit(_evaluate_shared, config): k for k, config in message["configs"]}
+                outcomes = ((futures[future], future) for future in as_completed(futures))
+            else:
+                data = workload(digest)
+                outcomes = ((k, config) for k, config in message["configs"])
+            for k, job in outcomes:
+                reply = {"type": "result", "batch": batch, "index": k}
+                try:
+                    reply["metrics"] = job.result() if processes > 1 else evaluate(data, job)
+                except Exception as exc:
+                    reply["error"] = f"{type(exc).__name__}: {exc}"
+                conn.send(reply)
+                done += 1
+    finally:
+        stop.set()
+        if executor is not None:
+            executor.shutdown()
+        conn.close()
+    return done
@@ -0,0 +1,246 @@
+"""
+Time-series telemetry collected while an algorithm runs.
+
+Time is cut into fixed windows of `window` time units starting at 0. For
+each window the collector keeps the time the CPU spent busy, idle and
+context switching, the processes completed, and the time-weighted mean and
+maximum ready-queue length (overall and per MLFQ level). Everything is
+accumulated as events happen: segments arrive through Timeline.emit,
+arrivals and completions through the algorithms' calls. A process is in the
+ready queue from its arrival until it completes, except while it holds the
+CPU or waits for I/O, so the queue length follows from those events alone;
+arrivals count from their arrival time even when the algorithm only picks
+them up at its next scheduling decision.
+"""
+import copy
+import heapq
+import math
+from array import array
+
+# Segment types tracked per window
+TYPES = ("proc", "idle", "cs")
+
+
+class Telemetry:
+    """
+    Per-window collector.
+
+    Arrivals reach it through expect() (all arrival times up front), track()
+    (an online arrival stream, read ahead as far as the run has got) or
+    arrive() (one time, possibly in the future, e.g. the end of an I/O
+    request); they are applied when the run reaches them. Per-level queue
+    lengths come from queue_levels().
+
+    Args:
+        window (float): Window length in time units.
+        levels (int): Number of MLFQ levels tracked (0 for other algorithms).
+    """
+
+    def __init__(self, window=1.0, levels=0):
+        if window <= 0:
+            raise ValueError("telemetry window must be positive")
+        self.window = float(window)
+        self.levels = levels
+        self.time = {typ: array("d") for typ in TYPES}
+        self.ready_area = array("d")
+        self.ready_max = array("d")
+        self.completed = array("d")
+        self.level_area = [array("d") for _ in range(levels)]
+        self.level_sizes = [0] * levels
+        self.waiting = 0        # processes arrived, not completed and not blocked on I/O
+        self.running = 0.0      # share of the time one of them holds the CPU
+        self.expected = ()
+        self.next_expected = 0
+        self.pending = []       # heap of (time, +1 arrive / -1 leave, level or -1) not reached yet
+        self.source = None
+        self.last = None
+        self.end = 0.0
+
+    def __len__(self):
+        return len(self.ready_area)
+
+    def __getstate__(self):
+        # An online arrival stream is not part of a checkpoint; OnlineAlgorithm.attach() tracks it again
+        state = self.__dict__.copy()
+        state["source"] = None
+        return state
+
+    def _grow(self, w):
+        missing = w + 1 - len(self.ready_area)
+        if missing > 0:
+            zeros = array("d", [0.0]) * missing
+            for series in (*self.time.values(), self.ready_area, self.ready_max, self.completed, *self.level_area):
+                series.extend(zeros)
+
+    def _spans(self, a, b):
+        """Yield (window, overlap) for the windows covering [a, b)."""
+        a = max(a, 0.0)
+        if b <= a:
+            return
+        W = self.window
+        w = int(a // W)
+        self._grow(int(b // W))
+        while a < b:
+            w_end = (w + 1) * W
+            if w_end <= a:
+                w += 1
+                continue
+            step = min(b, w_end) - a
+            # a // W and b // W round down, so the last window can be one past int(b // W)
+            self._grow(w)
+            yield w, step
+            a += step
+            w += 1
+
+    def _credit(self, t):
+        """Credit the queue lengths since the last event up to t."""
+        if self.last is not None and t > self.last:
+            # A compressed RR span runs one process a share of the time; its peak is between slices
+            ready = self.waiting - self.running
+            peak = self.waiting - int(self.running)
+            for w, overlap in self._spans(self.last, t):
+                self.ready_area[w] += ready * overlap
+                if peak > self.ready_max[w]:
+                    self.ready_max[w] = peak
+                for level, size in enumerate(self.level_sizes):
+                    self.level_area[level][w] += size * overlap
+        if self.last is None or t > self.last:
+            self.last = t
+            self.end = max(self.end, t)
+
+    def _change(self, t, delta, level):
+        self._credit(t)
+        self.waiting += delta
+        if level >= 0 and self.level_sizes:
+            self.level_sizes[level] += delta
+
+    def _advance(self, t):
+        """Apply the arrivals and departures up to t in time order and credit up to t."""
+        changes = []
+        if self.source is not None:
+            changes.extend((arrival, 1, 0) for arrival in self.source.announce(t))
+        expected = self.expected
+        while self.next_expected < len(expected) and expected[self.next_expected] <= t:
+            changes.append((expected[self.next_expected], 1, 0))
+            self.next_expected += 1
+        while self.pending and self.pending[0][0] <= t:
+            changes.append(heapq.heappop(self.pending))
+        # The sources are each in time order but interleave (I/O wake-ups between arrivals)
+        changes.sort()
+        for when, delta, level in changes:
+            self._change(when, delta, level)
+        self._credit(t)
+
+    def expect(self, arrivals):
+        """Register the arrival times of the run, in ascending order."""
+        self.expected = arrivals
+        self.next_expected = 0
+
+    def track(self, source):
+        """Take arrivals from an online stream: source.announce(t) yields the arrival times up to t not announced yet."""
+        self.source = source
+
+    def arrive(self, t, level=None):
+        """A process joins the ready queue (at MLFQ `level`) at time t, which may lie ahead."""
+        level = -1 if level is None else level
+        if self.last is not None and t <= self.last:
+            self._change(t, 1, level)
+        else:
+            heapq.heappush(self.pending, (t, 1, level))
+
+    def leave(self, t):
+        """A process that is not running stops waiting at time t (blocks on I/O), which may lie ahead."""
+        if self.last is not None and t > self.last:
+            heapq.heappush(self.pending, (t, -1, -1))
+        else:
+            self._advance(t)
+            self.waiting -= 1
+
+    def complete(self, t):
+        """A process completes at time t."""
+        self.leave(t)
+        # Counted in the window the process's last segment ends in, (start, start + window]
+        w = max(math.ceil(t / self.window) - 1, 0)
+        self._grow(w)
+        self.completed[w] += 1
+
+    def queue_levels(self, t, level_sizes):
+        """From time t the MLFQ levels hold `level_sizes` processes (the running one not included)."""
+        self._advance(t)
+        self.level_sizes = list(level_sizes)
+
+    def segment(self, start, duration, typ, share=1.0):
+        """Account `share` of [start, start + duration) to segment type `typ`."""
+        series = self.time[typ]
+        for w, overlap in self._spans(start, start + duration):
+            series[w] += overlap * share
+        if typ == "proc":
+            self._advance(start)
+            self.running = share
+            self._advance(start + duration)
+            self.running = 0.0
+        self.end = max(self.end, start + duration)
+
+    def finish(self, t):
+        """Close the run at time t."""
+        self._advance(t)
+
+    def scaled(self, factor):
+        """Copy with every time multiplied by `factor` (converts tick runs back to time units)."""
+        out = copy.deepcopy(self)
+        out.window *= factor
+        out.end *= factor
+        # Busy/idle/cs times and queue areas are integrals over time; counts and maxima are not
+        out.expected, out.pending, out.source = (), [], None
+        for series in (*out.time.values(), out.ready_area, *out.level_area):
+            for w in range(len(series)):
+                series[w] *= factor
+        if out.last is not None:
+            out.last *= factor
+        return out
+
+    def series(self):
+        """
+        Per-window series.
+
+        Returns:
+            dict: {"window_start", "busy", "idle", "cs" (fractions of the
+                   window), "ready_mean", "ready_max" (longest queue held for
+                   a positive time), "completed" (processes), "level<i>_mean"},
+                   each an array("d") with one value per window. The last
+                   window is normalized by the part of it the run covered.
+        """
+        n = len(self)
+        W = self.window
+        # A run ending exactly on a window boundary opens an empty window there
+        while n > 1 and (n - 1) * W >= self.end:
+            n -= 1
+        lengths = array("d", [W]) * n
+        if n:
+            lengths[-1] = max(min(self.end - (n - 1) * W, W), 1e-12)
+        out = {"window_start": array("d", (w * W for w in range(n)))}
+        for typ, name in (("proc", "busy"), ("idle", "idle"), ("cs", "cs")):
+            out[name] = array("d", (v / length for v, length in zip(self.time[typ], lengths)))
+        out["ready_mean"] = array("d", (v / length for v, length in zip(self.ready_area, lengths)))
+        out["ready_max"] = self.ready_max[:n]
+        out["completed"] = self.completed[:n]
+        for level, area in enumerate(self.level_area):
+            out[f"level{level}_mean"] = array("d", (v / length for v, length in zip(area, lengths)))
+        return out
+
+    def congestion(self):
+        """(window_start, ready_mean) of the window with the longest mean ready queue, or None."""
+        series = self.series()
+        if not series["window_start"]:
+            return None
+        w = max(range(len(series["window_start"])), key=series["ready_mean"].__getitem__)
+        return series["window_start"][w], series["ready_mean"][w]
+
+
+def auto_window(data, context_switch=0.0, windows=200):
+    """Window length giving about `windows` windows for this workload (upper-bound makespan estimate)."""
+    if not data:
+        return 1.0
+    arrivals = [float(v[0]) for v in data.values()]
+    span = max(arrivals) - min(arrivals) + sum(float(v[1]) for v in data.values()) + len(data) * context_switch
+    return max(span / windows, 1e-6)
@@ -0,0 +1,150 @@
+"""
+Fixed-point integer time base.
+
+Times are scaled to whole ticks of `resolution` time units (e.g. 1e-6 for
+microseconds) before an algorithm runs and scaled back afterwards. Inside
+the algorithm every time is an integer number of ticks, so clock stepping,
+remaining-time checks and tie comparisons are exact (up to 2**53 ticks);
+the float epsilons in the algorithms never come into play.
+"""
+
+# Stats fields that hold times; the others are counts, priorities or ratios
+TIME_FIELDS = ("arrival", "burst", "completion", "turnaround", "waiting", "response", "io", "io_wait",
+               "deadline", "lateness")
+
+
+class TimeBase:
+    """
+    Conversion between time units and integer ticks.
+
+    Args:
+        resolution (float): Length of one tick in time units; must divide one
+                            time unit evenly (1, 0.5, 1e-3, 1e-6, ...).
+    """
+
+    def __init__(self, resolution=1e-6):
+        if resolution <= 0 or resolution > 1:
+            raise ValueError("resolution must be in (0, 1]")
+        self.ticks_per_unit = round(1.0 / resolution)
+        if abs(self.ticks_per_unit * resolution - 1.0) > 1e-9:
+            raise ValueError(f"resolution {resolution} does not divide one time unit")
+        self.resolution = resolution
+
+    def to_ticks(self, value):
+        """Round a time to the nearest tick."""
+        return round(value * self.ticks_per_unit)
+
+    def from_ticks(self, ticks):
+        """Time of a tick count (division by the integer tick rate is correctly rounded)."""
+        return ticks / self.ticks_per_unit
+
+    def positive_ticks(self, value, name):
+        """to_ticks for parameters that must stay non-zero, such as quanta."""
+        ticks = self.to_ticks(value)
+        if ticks <= 0:
+            raise ValueError(f"{name} {value} is below the time resolution {self.resolution}")
+        return ticks
+
+    def duration_ticks(self, value, name):
+        """to_ticks for durations such as bursts: zero is kept, negative or sub-tick non-zero values are rejected."""
+        if value < 0:
+            raise ValueError(f"{name} {value} is negative")
+        ticks = self.to_ticks(value)
+        if ticks == 0 and value != 0:
+            raise ValueError(f"{name} {value} is below the time resolution {self.resolution}")
+        return ticks
+
+    def workload_to_ticks(self, data):
+        """{pid: [arrival, burst, priority(, sequence)]} with arrival, burst and burst sequence times in ticks."""
+        ticked = {}
+        for pid, values in data.items():
+            ticked[pid] = [self.to_ticks(values[0]), self.duration_ticks(values[1], f"burst of process {pid}"),
+                           values[2] if len(values) > 2 else 0]
+            if len(values) > 3 and isinstance(values[3], (list, tuple)) and values[3]:
+                ticked[pid].append([(item[0], self.duration_ticks(item[1], f"I/O of process {pid}"))
+                                    if isinstance(item, (tuple, list))
+                                    else self.duration_ticks(item, f"burst of process {pid}")
+                                    for item in values[3]])
+        return ticked
+
+    def tasks_to_ticks(self, tasks):
+        """{tid: [phase, wcet, period, deadline]} periodic task set in ticks."""
+        from algorithms.realtime import task_params
+
+        ticked = {}
+        for tid, values in tasks.items():
+            phase, wcet, period, deadline = task_params(values)
+            ticked[tid] = [self.to_ticks(phase), self.positive_ticks(wcet, f"wcet of task {tid}"),
+                           self.positive_ticks(period, f"period of task {tid}"),
+                           self.positive_ticks(deadline, f"deadline of task {tid}")]
+        return ticked
+
+    def stats_from_ticks(self, stats):
+        converted = {}
+        for pid, entry in stats.items():
+            entry = dict(entry)
+            for field in TIME_FIELDS:
+                if entry.get(field) is not None:
+                    entry[field] = self.from_ticks(entry[field])
+            converted[pid] = entry
+        return converted
+
+    def segment_from_ticks(self, seg):
+        seg = dict(seg, start=self.from_ticks(seg["start"]), duration=self.from_ticks(seg["duration"]))
+        if seg["type"] == "rounds":
+            seg["quantum"] = self.from_ticks(seg["quantum"])
+            seg["context_switch"] = self.from_ticks(seg["context_switch"])
+        return seg
+
+    def timeline_from_ticks(self, timeline):
+        """
+        Convert a tick timeline back to time units. The result keeps the
+        container type (Timeline, NullTimeline or list) and its counters.
+        """
+        converted = [self.segment_from_ticks(seg) for seg in timeline]
+        if not hasattr(timeline, "totals"):
+            return converted
+        out = type(timeline).__new__(type(timeline))
+        out.__dict__.update(timeline.__dict__)
+        out.__dict__.pop("_index", None)
+        out.extend(converted)
+        out.totals = {typ: self.from_ticks(total) for typ, total in timeline.totals.items()}
+        if getattr(timeline, "io_segments", None):
+            out.io_segments = [dict(seg, start=self.from_ticks(seg["start"]), duration=self.from_ticks(seg["duration"]))
+                               for seg in timeline.io_segments]
+        if getattr(timeline, "io_totals", None):
+            out.io_totals = {device: self.from_ticks(total) for device, total in timeline.io_totals.items()}
+        if getattr(timeline, "schedulability", None) and "response_times" in timeline.schedulability:
+            out.schedulability = dict(timeline.schedulability, response_times={
+                tid: self.from_ticks(r) for tid, r in timeline.schedulability["response_times"].items()})
+        if getattr(timeline, "group_shares", None):
+            out.group_shares = {g: dict(share, received=self.from_ticks(share["received"]),
+                                        entitled=self.from_ticks(share["entitled"]))
+                                for g, share in timeline.group_shares.items()}
+        if getattr(timeline, "telemetry", None) is not None:
+            out.telemetry = timeline.telemetry.scaled(1.0 / self.ticks_per_unit)
+        return out
+
+    def timeline_arrays(self, timeline):
+        """
+        Store a tick timeline as int64 columns.
+
+        Returns:
+            dict: {"start", "duration": int64 ticks, "pid": object array (None
+                   for idle/cs), "type": int8 codes of TYPE_NAMES, "level": int8
+                   (-1 where absent)}. Compressed RR rounds are expanded.
+        """
+        import numpy as np
+
+        from algorithms.vectorized import TYPE_NAMES
+        from utils.timeline import expand_timeline
+
+        segments = list(expand_timeline(timeline))
+        codes = {name: code for code, name in enumerate(TYPE_NAMES)}
+        return {
+            "start": np.fromiter((seg["start"] for seg in segments), dtype=np.int64, count=len(segments)),
+            "duration": np.fromiter((seg["duration"] for seg in segments), dtype=np.int64, count=len(segments)),
+            "pid": np.array([seg["pid"] for seg in segments], dtype=object),
+            "type": np.fromiter((codes[seg["type"]] for seg in segments), dtype=np.int8, count=len(segments)),
+            "level": np.fromiter((seg.get("level", -1) for seg in segments), dtype=np.int8, count=len(segments)),
+        }
@@ -0,0 +1,372 @@
+"""
+Timeline helpers shared by the algorithms, plotting and reports
+"""
+from array import array
+from bisect import bisect_right
+
+# Gaps below this, relative to the time they occur at (absolute below 1), are
+# treated as contiguous when coalescing
+CONTIGUOUS_EPS = 1e-9
+
+
+def contiguous(end, start):
+    """True when a segment starting at `start` follows one ending at `end`, up to float rounding."""
+    return abs(end - start) <= CONTIGUOUS_EPS * max(1.0, abs(start))
+
+
+class Timeline(list):
+    """
+    Timeline list built through emit(), which merges a segment into the
+    previous one when both have the same pid, type and level and the new one
+    starts where the previous one ends.
+
+    Args:
+        coalesce (bool): Merge adjacent segments. With False every emitted
+                         segment is kept (raw quantum slices).
+
+    Attributes:
+        raw_count (int): Segments emitted, i.e. the length the timeline
+                         would have without coalescing (compressed RR rounds
+                         count as the slices they stand for).
+        totals (dict): Running time per segment type {"proc", "idle", "cs"}.
+        telemetry (Telemetry): Optional utils.telemetry collector that every
+                               emitted segment is forwarded to.
+        io_segments (list): Device segments {"start", "duration", "pid",
+                            "device"} of runs with I/O (algorithms.bursts).
+        io_totals (dict): Busy time per device.
+        schedulability (dict): Analysis of the task set of a real-time run
+                               (algorithms.realtime), else None.
+        group_shares (dict): CPU time received and entitled per group of a
+                             fair-share run (algorithms.fair_share), else None.
+        version (int): Mutation counter bumped by emit(), append(), extend()
+                       and pop(); keys the cached time_index().
+    """
+
+    version = 0
+
+    def __init__(self, coalesce=True):
+        super().__init__()
+        self.coalesce = coalesce
+        self.raw_count = 0
+        self.totals = {"proc": 0.0, "idle": 0.0, "cs": 0.0}
+        self.telemetry = None
+        self.io_segments = []
+        self.io_totals = {}
+        self.schedulability = None
+        self.group_shares = None
+
+    def emit(self, start, duration, pid, typ, level=None):
+        """Append a segment, extending the last one instead when possible."""
+        self.version += 1
+        self.raw_count += 1
+        self.totals[typ] += duration
+        if self.telemetry is not None:
+            self.telemetry.segment(start, duration, typ)
+        if self.coalesce and self:
+            last = self[-1]
+            if (last["pid"] == pid and last["type"] == typ and last.get("level") == level
+                    and contiguous(last["start"] + last["duration"], start)):
+                last["duration"] += duration
+                return
+        seg = {"start": start, "duration": duration, "pid": pid, "type": typ}
+        if level is not None:
+            seg["level"] = level
+        list.append(self, seg)
+
+    def append(self, seg):
+        self.version += 1
+        super().append(seg)
+
+    def extend(self, segs):
+        self.version += 1
+        super().extend(segs)
+
+    def pop(self, k=-1):
+        self.version += 1
+        return super().pop(k)
+
+    def emit_io(self, start, duration, pid, device):
+        """Record that `device` serves an I/O request of `pid`; I/O runs beside the CPU segments."""
+        self.io_totals[device] = self.io_totals.get(device, 0.0) + duration
+        self.io_segments.append({"start": start, "duration": duration, "pid": pid, "device": device})
+
+    def time_index(self):
+        """TimelineIndex of this timeline, built on first use and rebuilt after any change."""
+        cached = getattr(self, "_index", None)
+        if cached is None or cached[0] != self.version:
+            self._index = (self.version, TimelineIndex(self))
+        return self._index[1]
+
+    def emit_rounds(self, start, pids, rounds, quantum, context_switch):
+        """Append a compressed RR "rounds" record (see expand_rounds); never merged."""
+        self.raw_count += rounds * len(pids) * (2 if context_switch else 1)
+        self.totals["proc"] += rounds * len(pids) * quantum
+        self.totals["cs"] += rounds * len(pids) * context_switch
+        if self.telemetry is not None:
+            rounds_telemetry(self.telemetry, start, pids, rounds, quantum, context_switch)
+        self.append({"start": start,
+                     "duration": rounds * len(pids) * (quantum + context_switch),
+                     "pid": None,
+                     "type": "rounds",
+                     "pids": list(pids),
+                     "rounds": rounds,
+                     "quantum": quantum,
+                     "context_switch": context_switch})
+
+
+class NullTimeline(Timeline):
+    """
+    Stats-only sink: emit() updates raw_count and totals but stores nothing,
+    so the timeline stays empty and memory does not grow with run length.
+    """
+
+    def __init__(self):
+        super().__init__(coalesce=False)
+
+    def emit(self, start, duration, pid, typ, level=None):
+        self.raw_count += 1
+        self.totals[typ] += duration
+        if self.telemetry is not None:
+            self.telemetry.segment(start, duration, typ)
+
+    def emit_rounds(self, start, pids, rounds, quantum, context_switch):
+        slices = rounds * len(pids)
+        self.raw_count += slices * (2 if context_switch else 1)
+        self.totals["proc"] += slices * quantum
+        self.totals["cs"] += slices * context_switch
+        if self.telemetry is not None:
+            rounds_telemetry(self.telemetry, start, pids, rounds, quantum, context_switch)
+
+    def emit_io(self, start, duration, pid, device):
+        self.io_totals[device] = self.io_totals.get(device, 0.0) + duration
+
+
+class StreamTimeline(Timeline):
+    """
+    Timeline that hands segments to `on_segment(seg)` as soon as they are
+    final instead of keeping them. Only the last segment, which coalescing
+    may still extend, is held back until the next one arrives or flush().
+    """
+
+    def __init__(self, on_segment, coalesce=True):
+        super().__init__(coalesce)
+        self.on_segment = on_segment
+
+    def emit(self, start, duration, pid, typ, level=None):
+        super().emit(start, duration, pid, typ, level)
+        if len(self) > 1:
+            self.on_segment(self.pop(0))
+
+    def emit_rounds(self, start, pids, rounds, quantum, context_switch):
+        super().emit_rounds(start, pids, rounds, quantum, context_switch)
+        if len(self) > 1:
+            self.on_segment(self.pop(0))
+
+    def __getstate__(self):
+        # The callback is not part of a checkpoint; OnlineAlgorithm.attach() sets it again
+        state = self.__dict__.copy()
+        state["on_segment"] = None
+        return state
+
+    def flush(self):
+        """Hand over the held-back segment."""
+        while self:
+            self.on_segment(self.pop(0))
+
+
+def rounds_telemetry(telemetry, start, pids, rounds, quantum, context_switch):
+    """
+    Forward a compressed RR rounds record to a telemetry collector without
+    expanding it: busy and context-switch time are spread over the record's
+    span in proportion quantum : context_switch, exact at window granularity
+    whenever the window is long compared to one slot.
+    """
+    slot = quantum + context_switch
+    span = rounds * len(pids) * slot
+    telemetry.segment(start, span, "proc", share=quantum / slot)
+    if context_switch:
+        telemetry.segment(start, span, "cs", share=context_switch / slot)
+
+
+def as_timeline(timeline):
+    """Wrap a plain segment list (e.g. from the vectorized paths) in a Timeline."""
+    if isinstance(timeline, Timeline):
+        return timeline
+    wrapped = Timeline(coalesce=False)
+    wrapped.extend(timeline)
+    wrapped.raw_count = len(timeline)
+    wrapped.totals = timeline_totals(timeline)
+    return wrapped
+
+
+def new_timeline(record=True, coalesce=True, telemetry=None):
+    """
+    Timeline for an algorithm run: a Timeline, or a NullTimeline when `record`
+    is False, forwarding its segments to `telemetry` when one is given.
+    """
+    timeline = Timeline(coalesce) if record else NullTimeline()
+    timeline.telemetry = telemetry
+    return timeline
+
+
+def timeline_totals(timeline):
+    """
+    Total proc, idle and context-switch time of a timeline.
+
+    Uses the running totals of Timeline/NullTimeline and sums plain lists.
+    """
+    totals = getattr(timeline, "totals", None)
+    if totals is not None:
+        return dict(totals)
+    totals = {"proc": 0.0, "idle": 0.0, "cs": 0.0}
+    for seg in expand_timeline(timeline):
+        totals[seg["type"]] += seg["duration"]
+    return totals
+
+
+def segment_counts(timeline):
+    """(stored, raw) segment counts; plain lists report their length for both."""
+    return len(timeline), getattr(timeline, "raw_count", len(timeline))
+
+
+def expand_rounds(seg):
+    """
+    Yield the individual segments a compressed RR "rounds" record stands for.
+
+    Each of the `rounds` rounds runs every pid in `pids` for `quantum`, each
+    slice followed by a context switch when `context_switch` is non-zero.
+    """
+    quantum = seg["quantum"]
+    cs = seg["context_switch"]
+    slot = quantum + cs
+    t = seg["start"]
+    for _ in range(seg["rounds"]):
+        for pid in seg["pids"]:
+            yield {"start": t, "duration": quantum, "pid": pid, "type": "proc"}
+            if cs:
+                yield {"start": t + quantum, "duration": cs, "pid": None, "type": "cs"}
+            t += slot
+
+
+def expand_timeline(timeline):
+    """Iterate over a timeline with every compressed record expanded into plain segments."""
+    for seg in timeline:
+        if seg["type"] == "rounds":
+            yield from expand_rounds(seg)
+        else:
+            yield seg
+
+
+def _rounds_time(seg, typ, t):
+    """Time of type `typ` in a compressed "rounds" record before time t (clamped to the record)."""
+    quantum, cs = seg["quantum"], seg["context_switch"]
+    slot = quantum + cs
+    slots = seg["rounds"] * len(seg["pids"])
+    offset = min(max(t - seg["start"], 0.0), slots * slot)
+    full = min(int(offset // slot), slots)
+    rest = offset - full * slot
+    if typ == "proc":
+        return full * quantum + min(max(rest, 0.0), quantum)
+    if typ == "cs":
+        return full * cs + min(max(rest - quantum, 0.0), cs)
+    return 0.0
+
+
+def _segment_time(seg, typ, t=None):
+    """Time of type `typ` in `seg`, or only before time t."""
+    if seg["type"] == "rounds":
+        return _rounds_time(seg, typ, seg["start"] + seg["duration"] if t is None else t)
+    if seg["type"] != typ:
+        return 0.0
+    return seg["duration"] if t is None else min(max(t - seg["start"], 0.0), seg["duration"])
+
+
+class TimelineIndex:
+    """
+    Point and window queries over a timeline in O(log n).
+
+    Built once from the stored segments: sorted start and end arrays plus
+    prefix sums of proc (busy), idle and context-switch time, so a window
+    total is two binary searches and two partial-segment corrections. A
+    compressed RR "rounds" record stays one entry; queries inside it are
+    answered arithmetically from its slots of quantum + context_switch.
+    Time not covered by any segment counts as none of the three.
+    """
+
+    TYPES = ("proc", "idle", "cs")
+
+    def __init__(self, timeline):
+        self.segments = list(timeline)
+        self.starts = array("d", (seg["start"] for seg in self.segments))
+        self.ends = array("d", (seg["start"] + seg["duration"] for seg in self.segments))
+        # prefix[typ][k] = time of type typ in segments[:k]
+        self.prefix = {}
+        for typ in self.TYPES:
+            acc = array("d", [0.0])
+            total = 0.0
+            for seg in self.segments:
+                total += _segment_time(seg, typ)
+                acc.append(total)
+            self.prefix[typ] = acc
+
+        self.start = self.starts[0] if self.segments else 0.0
+        self.end = max(self.ends) if self.segments else 0.0
+
+    def __len__(self):
+        return len(self.segments)
+
+    def segment_at(self, t):
+        """Segment covering time t (start <= t < end), or None; inside a rounds record, the slice at t."""
+        k = bisect_right(self.starts, t) - 1
+        if k < 0 or t >= self.ends[k]:
+            return None
+        seg = self.segments[k]
+        if seg["type"] != "rounds":
+            return seg
+        quantum, cs = seg["quantum"], seg["context_switch"]
+        slot = quantum + cs
+        pids = seg["pids"]
+        j = min(int((t - seg["start"]) // slot), seg["rounds"] * len(pids) - 1)
+        slot_start = seg["start"] + j * slot
+        if t < slot_start + quantum or not cs:
+            return {"start": slot_start, "duration": quantum, "pid": pids[j % len(pids)], "type": "proc"}
+        return {"start": slot_start + quantum, "duration": cs, "pid": None, "type": "cs"}
+
+    def running_at(self, t):
+        """Pid holding the CPU at time t, or None when idle or switching."""
+        seg = self.segment_at(t)
+        return seg["pid"] if seg is not None and seg["type"] == "proc" else None
+
+    def _cumulative(self, typ, t):
+        """Time of type `typ` in [-inf, t)."""
+        k = bisect_right(self.starts, t)
+        total = self.prefix[typ][k]
+        # The last segment starting at or before t may extend past t
+        if k and self.ends[k - 1] > t:
+            seg = self.segments[k - 1]
+            total -= _segment_time(seg, typ) - _segment_time(seg, typ, t)
+        return total
+
+    def time_in(self, t1, t2):
+        """{"proc", "idle", "cs"}: time of each type within [t1, t2)."""
+        return {typ: self._cumulative(typ, t2) - self._cumulative(typ, t1) for typ in self.TYPES}
+
+    def busy_time(self, t1, t2):
+        return self._cumulative("proc", t2) - self._cumulative("proc", t1)
+
+    def cs_overhead(self, t1, t2):
+        """Context-switch time within [t1, t2)."""
+        return self._cumulative("cs", t2) - self._cumulative("cs", t1)
+
+    def utilization(self, t1, t2):
+        """CPU utilization (percent busy) over [t1, t2)."""
+        if t2 <= t1:
+            return 0.0
+        return self.busy_time(t1, t2) / (t2 - t1) * 100.0
+
+
+def index_timeline(timeline):
+    """TimelineIndex for any timeline (uses the cached index of a Timeline)."""
+    if isinstance(timeline, Timeline):
+        return timeline.time_index()
+    return TimelineIndex(timeline)
@@ -0,0 +1,310 @@
+"""
+Trace replay importers: stream real scheduler traces into the workload
+format used by Scheduler ({pid: [arrival, burst, priority]}).
+"""
+import bz2
+import csv
+import gzip
+import heapq
+import lzma
+import os
+import random
+import re
+
+# Lines between two progress callbacks
+PROGRESS_EVERY = 65536
+
+_TIMESTAMP = re.compile(r"\[(\d+)\]\s+(?:\S+\s+)?(\d+\.\d+):\s+(sched_switch|sched_wakeup_new|sched_wakeup):\s(.*)$")
+_SWITCH = re.compile(r"prev_pid=(\d+)\s+prev_prio=(\d+)\s+prev_state=(\S+)\s+==>\s+next_comm=(.*?)\s+next_pid=(\d+)\s+next_prio=(\d+)")
+_WAKEUP = re.compile(r"comm=(.*?)\s+pid=(\d+)\s+prio=(\d+)")
+
+# Column names tried, in order, when a cluster CSV column is not given explicitly
+SUBMIT_COLUMNS = ("submit_time", "submit", "time", "start_time", "arrival")
+DURATION_COLUMNS = ("cpu_duration", "duration", "cpu_time", "runtime", "burst")
+PRIORITY_COLUMNS = ("priority", "prio")
+
+
+def _open_trace(path):
+    """
+    Open a (possibly compressed) trace for binary line iteration.
+
+    Returns:
+        tuple: (stream, raw) where raw is the underlying file, used to report
+               progress in compressed bytes. The decompressors do not close a
+               file object they are given, so the caller closes both.
+    """
+    raw = open(path, "rb")
+    lower = path.lower()
+    try:
+        if lower.endswith(".gz"):
+            return gzip.GzipFile(fileobj=raw), raw
+        if lower.endswith(".bz2"):
+            return bz2.BZ2File(raw), raw
+        if lower.endswith(".xz"):
+            return lzma.LZMAFile(raw), raw
+    except BaseException:
+        raw.close()
+        raise
+    return raw, raw
+
+
+def _lines(path, progress):
+    """Yield decoded lines, calling progress(fraction) every PROGRESS_EVERY lines."""
+    stream, raw = _open_trace(path)
+    try:
+        size = os.fstat(raw.fileno()).st_size or 1
+        for count, line in enumerate(stream, 1):
+            if progress and count % PROGRESS_EVERY == 0:
+                progress(min(1.0, raw.tell() / size))
+            yield line.decode("utf-8", "replace")
+    finally:
+        # Also runs when the consumer stops early (a window or limit) and the generator is closed
+        stream.close()
+        raw.close()
+    if progress:
+        progress(1.0)
+
+
+def _pipeline(records, rebase, time_scale, window, min_burst, sample, seed, predicate, limit, ordered,
+              origin=None):
+    """
+    Apply scaling, rebasing, filtering and sampling to (arrival, burst, priority) records.
+
+    Rebasing subtracts `origin` (a scaled arrival), by default the first
+    record's arrival, which is the earliest one when the records are in
+    arrival order, so the workload starts at 0. The window and burst filters
+    apply to scaled, rebased values. When the records are known to be in
+    arrival order, reading stops at the end of the window.
+    """
+    rng = random.Random(seed)
+    kept = 0
+    for arrival, burst, priority in records:
+        arrival *= time_scale
+        burst *= time_scale
+        if rebase:
+            if origin is None:
+                origin = arrival
+            arrival -= origin
+        if window is not None and not (window[0] <= arrival < window[1]):
+            if ordered and arrival >= window[1]:
+                return
+            continue
+        if burst < min_burst:
+            continue
+        if predicate is not None and not predicate(arrival, burst, priority):
+            continue
+        if sample < 1.0 and rng.random() >= sample:
+            continue
+        yield arrival, burst, priority
+        kept += 1
+        if limit is not None and kept >= limit:
+            return
+
+
+def _ftrace_jobs(lines, comm):
+    """
+    Turn sched_switch/sched_wakeup events into CPU jobs.
+
+    A job opens when a task is woken (or first seen on a CPU) and closes when
+    the task is switched out in a sleeping state; its burst is the CPU time
+    accumulated in between, so preemptions (prev_state R) extend the same job.
+    Jobs are released in arrival order: a closed job is held in a heap until
+    no still-open job arrived before it. Memory is bounded by the number of
+    live tasks plus that reorder heap, not by the trace length.
+    """
+    open_jobs = {}      # tid -> [arrival, burst, prio, on_cpu_since or None, comm], times in µs
+    open_heap = []      # (arrival, tid) of open jobs, stale entries skipped lazily
+    done = []           # heap of (arrival, seq, burst, priority)
+    seq = 0
+    comm_re = re.compile(comm) if comm else None
+
+    def oldest_open():
+        while open_heap:
+            arrival, tid = open_heap[0]
+            job = open_jobs.get(tid)
+            if job is not None and job[0] == arrival:
+                return arrival
+            heapq.heappop(open_heap)
+        return None
+
+    for line in lines:
+        if "sched_" not in line:
+            continue
+        m = _TIMESTAMP.search(line)
+        if not m:
+            continue
+        sec, _, frac = m.group(2).partition(".")
+        ts = int(sec) * 1000000 + int(frac[:6].ljust(6, "0"))    # integer microseconds
+        event, args = m.group(3), m.group(4)
+
+        if event == "sched_switch":
+            sm = _SWITCH.search(args)
+            if not sm:
+                continue
+            prev_pid, prev_state = int(sm.group(1)), sm.group(3)
+            next_comm, next_pid, next_prio = sm.group(4), int(sm.group(5)), int(sm.group(6))
+            job = open_jobs.get(prev_pid)
+            if prev_pid and job is not None and job[3] is not None:
+                job[1] += ts - job[3]
+                job[3] = None
+                if not prev_state.startswith("R"):
+                    del open_jobs[prev_pid]
+                    if comm_re is None or comm_re.search(job[4]):
+                        heapq.heappush(done, (job[0], seq, job[1], 140 - job[2]))
+                        seq += 1
+            if next_pid:
+                job = open_jobs.get(next_pid)
+                if job is None:
+                    open_jobs[next_pid] = [ts, 0, next_prio, ts, next_comm]
+                    heapq.heappush(open_heap, (ts, next_pid))
+                else:
+                    job[3] = ts
+        else:
+            wm = _WAKEUP.search(args)
+            if not wm:
+                continue
+            pid = int(wm.group(2))
+            if pid and pid not in open_jobs:
+                open_jobs[pid] = [ts, 0, int(wm.group(3)), None, wm.group(1)]
+                heapq.heappush(open_heap, (ts, pid))
+
+        # Release finished jobs that can no longer be preceded by an open one
+        if done:
+            watermark = oldest_open()
+            while done and (watermark is None or done[0][0] <= watermark):
+                arrival, _, burst, priority = heapq.heappop(done)
+                yield arrival, burst, priority
+
+    # Trace ended: jobs still open are cut at their accumulated CPU time
+    for job in open_jobs.values():
+        if job[1] > 0 and (comm_re is None or comm_re.search(job[4])):
+            heapq.heappush(done, (job[0], seq, job[1], 140 - job[2]))
+            seq += 1
+    while done:
+        arrival, _, burst, priority = heapq.heappop(done)
+        yield arrival, burst, priority
+
+
+def iter_ftrace(path, time_scale=1000.0, rebase=True, window=None, min_burst=0.0,
+                sample=1.0, seed=0, comm=None, predicate=None, limit=None, progress=None):
+    """
+    Stream jobs from Linux ftrace text output (trace / trace_pipe format).
+
+    Only sched_switch, sched_wakeup and sched_wakeup_new events are used. The
+    idle task (pid 0) is ignored. Kernel priorities (lower is more urgent)
+    are mapped to 140 - prio so that HPF's "larger is higher" still holds.
+
+    Args:
+        path (str): Trace file; .gz/.bz2/.xz are decompressed on the fly.
+        time_scale (float): Multiplier from trace seconds to workload units.
+                            Defaults to 1000 (milliseconds).
+        rebase (bool): Shift times so the first job arrives at 0.
+        window (tuple, optional): Keep jobs with start <= arrival < end (after rebasing).
+        min_burst (float): Drop jobs shorter than this.
+        sample (float): Fraction of jobs kept, chosen with a seeded RNG.
+        seed (int): Sampling seed.
+        comm (str, optional): Regex a task's command name must match.
+        predicate (callable, optional): predicate(arrival, burst, priority) -> bool.
+        limit (int, optional): Stop after this many jobs.
+        progress (callable, optional): Called with the fraction of the file read.
+
+    Yields:
+        tuple: (arrival, burst, priority) in arrival order.
+    """
+    jobs = ((arrival / 1e6, burst / 1e6, priority) for arrival, burst, priority in
+            _ftrace_jobs(_lines(path, progress), comm))
+    return _pipeline(jobs, rebase, time_scale, window, min_burst, sample, seed, predicate, limit, True)
+
+
+def _pick_column(fieldnames, explicit, candidates, required=True):
+    if explicit:
+        if explicit not in fieldnames:
+            raise ValueError(f"Column {explicit!r} not found in trace header")
+        return explicit
+    lowered = {name.strip().lower(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    if required:
+        raise ValueError(f"None of the columns {candidates} found in trace header")
+    return None
+
+
+def iter_cluster_csv(path, submit_column=None, duration_column=None, priority_column=None,
+                     time_scale=1.0, rebase=True, window=None, min_burst=0.0,
+                     sample=1.0, seed=0, predicate=None, limit=None, progress=None):
+    """
+    Stream jobs from a cluster-trace style CSV with a header row.
+
+    Each row is one job: its submit time becomes the arrival and its CPU
+    duration the burst. Columns are matched by name (see SUBMIT_COLUMNS,
+    DURATION_COLUMNS, PRIORITY_COLUMNS) unless given explicitly. Rows with
+    missing or non-numeric values are skipped. Jobs are yielded in file
+    order, which need not be arrival order, so rebasing is relative to the
+    earliest submit time in the file; it takes an extra pass over the file
+    (progress reports each pass as half of the total).
+
+    Args:
+        path (str): CSV file; .gz/.bz2/.xz are decompressed on the fly.
+        submit_column, duration_column, priority_column (str, optional): Column names.
+        time_scale (float): Multiplier from trace time units to workload units.
+
+        The remaining arguments behave as in iter_ftrace.
+
+    Yields:
+        tuple: (arrival, burst, priority)
+    """
+    origin = None
+    if rebase:
+        first_pass = None if progress is None else (lambda fraction: progress(fraction / 2))
+        arrivals = (arrival for arrival, _, _ in
+                    _cluster_rows(path, submit_column, duration_column, priority_column, first_pass))
+        origin = min(arrivals, default=0.0) * time_scale
+        if progress is not None:
+            report = progress
+            progress = lambda fraction: report(0.5 + fraction / 2)
+    rows = _cluster_rows(path, submit_column, duration_column, priority_column, progress)
+    return _pipeline(rows, rebase, time_scale, window, min_burst, sample, seed, predicate, limit, False, origin)
+
+
+def _cluster_rows(path, submit_column, duration_column, priority_column, progress):
+    """(arrival, burst, priority) of every valid row of a cluster CSV, unscaled."""
+    reader = csv.reader(_lines(path, progress))
+    try:
+        header = next(reader)
+    except StopIteration:
+        return
+    submit = header.index(_pick_column(header, submit_column, SUBMIT_COLUMNS))
+    duration = header.index(_pick_column(header, duration_column, DURATION_COLUMNS))
+    prio_name = _pick_column(header, priority_column, PRIORITY_COLUMNS, required=False)
+    prio = header.index(prio_name) if prio_name else None
+    for row in reader:
+        try:
+            arrival = float(row[submit])
+            burst = float(row[duration])
+            priority = int(float(row[prio])) if prio is not None and row[prio] else 0
+        except (ValueError, IndexError):
+            continue
+        yield arrival, burst, priority
+
+
+def detect_trace_kind(path):
+    """Return "csv" for cluster CSV traces and "ftrace" otherwise, judging by file name."""
+    name = path.lower()
+    for ext in (".gz", ".bz2", ".xz"):
+        if name.endswith(ext):
+            name = name[:-len(ext)]
+    return "csv" if name.endswith(".csv") else "ftrace"
+
+
+def load_trace(path, kind=None, **kwargs):
+    """
+    Load a trace into a workload dict {pid: [arrival, burst, priority]}.
+
+    PIDs are assigned "1", "2", ... in the order jobs are read. Keyword
+    arguments are passed to iter_ftrace or iter_cluster_csv.
+    """
+    kind = kind or detect_trace_kind(path)
+    records = iter_cluster_csv(path, **kwargs) if kind == "csv" else iter_ftrace(path, **kwargs)
+    return {str(i): [arrival, burst, priority]
+            for i, (arrival, burst, priority) in enumerate(records, 1)}
@@ -0,0 +1,224 @@
+"""
+Automatic tuning of the RR quantum and the MLFQ levels, quanta and aging
+threshold by successive halving.
+
+Candidates are drawn around the workload's own time scale (its median
+burst). Every candidate is first run on a prefix of the workload (the
+earliest arrivals, so the load is unchanged); the best 1/eta of them move
+on to a prefix eta times longer, until the survivors run on the whole
+workload. Each rung's runs go to worker processes, which receive the
+workload once when they start. Results are cached by workload digest,
+prefix size and parameters, so repeated tuning of the same workload only
+runs what is new.
+"""
+import hashlib
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.metrics import compute_metrics
+
+TUNABLE_ALGORITHMS = ("RR", "MLFQ")
+
+# Parameters of the built-in defaults; always among the candidates
+DEFAULT_PARAMS = {
+    "RR": {"quantum": 1.0},
+    "MLFQ": {"levels": 3, "quanta_list": [1.0, 2.0, 4.0], "aging_threshold": 10.0},
+}
+
+# Quanta are at least the workload span over this, so a candidate run takes at most about this many slices
+MAX_SLICES = 10 ** 6
+
+# Workload of a worker process, in (arrival, pid) order; set once by _init_worker
+_WORKLOAD = None
+
+
+def _ordered(data):
+    return sorted(data.items(), key=lambda kv: (kv[1][0], int(kv[0])))
+
+
+def _init_worker(items):
+    global _WORKLOAD
+    _WORKLOAD = items
+
+
+def _evaluate(size, algorithm, params, items=None):
+    """Run `algorithm` on the first `size` arrivals and return its metrics (also in worker processes)."""
+    from scheduler import Scheduler
+
+    items = _WORKLOAD if items is None else items
+    timeline, stats = Scheduler(dict(items[:size])).run(algorithm, timeline=False, **params)
+    return compute_metrics(stats, timeline)
+
+
+def workload_digest(data):
+    """Content hash of a workload (independent of dict order)."""
+    return hashlib.sha256(repr(sorted((str(pid), tuple(values)) for pid, values in data.items()))
+                          .encode()).hexdigest()
+
+
+def _round(x):
+    return float(f"{x:.4g}")
+
+
+def candidate_params(data, algorithm, count=27, seed=None):
+    """
+    `count` distinct parameter sets for `algorithm`, the default first.
+
+    RR: quantum log-uniform in [median burst / 16, max burst].
+    MLFQ: 2-8 levels, base quantum log-uniform in [median burst / 16, median
+    burst], quanta growing by 1-4x per level, aging threshold a multiple of
+    the median burst (or the workload span, i.e. practically never).
+    The median is taken over the positive bursts, and no quantum is below
+    span / MAX_SLICES, so workloads of mostly zero bursts still finish.
+    """
+    algorithm = algorithm.upper()
+    if algorithm not in TUNABLE_ALGORITHMS:
+        raise ValueError(f"Only {', '.join(TUNABLE_ALGORITHMS)} can be tuned, not {algorithm}")
+    bursts = sorted(float(values[1]) for values in data.values() if float(values[1]) > 0) or [1.0]
+    median = bursts[len(bursts) // 2]
+    longest = bursts[-1]
+    span = max(float(values[0]) for values in data.values()) + sum(bursts) if data else 1.0
+    min_quantum = span / MAX_SLICES
+    rng = random.Random(seed)
+
+    def log_uniform(lo, hi):
+        return _round(math.exp(rng.uniform(math.log(lo), math.log(hi))))
+
+    def quantum(lo, hi):
+        return log_uniform(max(lo, min_quantum), max(hi, min_quantum))
+
+    candidates = [dict(DEFAULT_PARAMS[algorithm])]
+    seen = {json.dumps(candidates[0], sort_keys=True)}
+    for _ in range(count * 20):
+        if len(candidates) >= count:
+            break
+        if algorithm == "RR":
+            params = {"quantum": quantum(median / 16, longest)}
+        else:
+            levels = rng.choice((2, 3, 4, 5, 6, 8))
+            base = quantum(median / 16, median)
+            growth = rng.choice((1.0, 1.5, 2.0, 3.0, 4.0))
+            params = {"levels": levels,
+                      "quanta_list": [_round(base * growth ** i) for i in range(levels)],
+                      "aging_threshold": _round(rng.choice((2, 5, 10, 25, 100)) * median)
+                      if rng.random() < 0.85 else _round(span)}
+        key = json.dumps(params, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            candidates.append(params)
+    return candidates
+
+
+def rung_sizes(n, count, eta=3, min_size=50):
+    """
+    Prefix sizes of the successive-halving rungs, ending with the whole
+    workload: each rung is eta times longer than the one before, the first
+    at least `min_size`, and there are no more rungs than halvings needed
+    to get from `count` candidates down to at most eta, which are compared
+    on the whole workload.
+    """
+    sizes = [n]
+    halvings = 0
+    while count > eta:
+        count = math.ceil(count / eta)
+        halvings += 1
+    while len(sizes) <= halvings and math.ceil(sizes[0] / eta) >= min_size:
+        sizes.insert(0, math.ceil(sizes[0] / eta))
+    return sizes
+
+
+def tune(data, algorithm="RR", objective="p95_wait", context_switch=0.0, candidates=27, eta=3, min_size=50,
+         seed=None, max_workers=None, cache=None, progress=None):
+    """
+    Find the parameters of `algorithm` ("RR" or "MLFQ") that minimize
+    `objective` (a compute_metrics key, p95 waiting time by default) on `data`.
+
+    Args:
+        data (dict): Workload {pid: (arrival, burst, priority)}.
+        algorithm (str): "RR" (quantum) or "MLFQ" (levels, quanta_list, aging_threshold).
+        objective (str): Metric to minimize.
+        context_switch (float): Context switch time of every run (not tuned).
+        candidates (int): Parameter sets drawn by candidate_params().
+        eta (int): Halving rate: 1/eta of the candidates survive each rung.
+        min_size (int): Processes in the shortest prefix.
+        seed (int, optional): Seed of the candidate draw.
+        max_workers (int, optional): Worker processes; 1 runs everything in this process.
+        cache (dict, optional): Results of earlier tune() calls, updated in place; keys
+                                hold the workload digest, so one cache serves any workload.
+        progress (callable, optional): progress(rung, rungs, size, configs) before each rung.
+
+    Returns:
+        dict: {"algorithm", "objective", "params" (best, with context_switch; the
+               default when no candidate beats it on the whole workload), "value",
+               "metrics" (full compute_metrics of the best on the whole workload),
+               "default" ({"params", "metrics"} of the built-in default on the whole
+               workload), "rungs" ([{"size", "configs", "best"}]), "evaluations"
+               (simulations run), "cache_hits", "elapsed" (seconds)}.
+    """
+    started = time.perf_counter()
+    algorithm = algorithm.upper()
+    if not data:
+        raise ValueError("cannot tune on an empty workload")
+    configs = [dict(params, context_switch=context_switch)
+               for params in candidate_params(data, algorithm, candidates, seed)]
+    default = configs[0]
+    items = _ordered(data)
+    digest = workload_digest(data)
+    cache = {} if cache is None else cache
+    sizes = rung_sizes(len(items), len(configs), eta, min_size)
+    evaluations = hits = 0
+
+    def key(size, params):
+        return f"{digest}:{size}:{algorithm}:{json.dumps(params, sort_keys=True)}"
+
+    def evaluate_all(size, batch):
+        nonlocal evaluations, hits
+        todo = [params for params in batch if key(size, params) not in cache]
+        hits += len(batch) - len(todo)
+        evaluations += len(todo)
+        if executor is None:
+            results = [_evaluate(size, algorithm, params, items) for params in todo]
+        else:
+            results = executor.map(_evaluate, [size] * len(todo), [algorithm] * len(todo), todo,
+                                   chunksize=max(1, len(todo) // (4 * (max_workers or 4))))
+        for params, metrics in zip(todo, results):
+            cache[key(size, params)] = metrics
+        return [cache[key(size, params)] for params in batch]
+
+    def score(metrics):
+        value = metrics.get(objective)
+        if value is None:
+            raise ValueError(f"Unknown objective: {objective}")
+        return value, metrics.get("avg_wait", 0.0)
+
+    executor = None
+    if max_workers != 1:
+        executor = ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(items,))
+    rungs = []
+    try:
+        survivors = configs
+        for r, size in enumerate(sizes):
+            if progress is not None:
+                progress(r + 1, len(sizes), size, len(survivors))
+            results = evaluate_all(size, survivors)
+            ranked = sorted(range(len(survivors)), key=lambda k: (score(results[k]), k))
+            rungs.append({"size": size, "configs": len(survivors), "best": score(results[ranked[0]])[0]})
+            if r < len(sizes) - 1:
+                survivors = [survivors[k] for k in ranked[:max(1, math.ceil(len(survivors) / eta))]]
+            else:
+                best, best_metrics = survivors[ranked[0]], results[ranked[0]]
+        default_metrics = evaluate_all(len(items), [default])[0]
+        # The default may have been dropped on a prefix; never return worse than it on the whole workload
+        if score(default_metrics) <= score(best_metrics):
+            best, best_metrics = default, default_metrics
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return {"algorithm": algorithm, "objective": objective, "params": best, "value": best_metrics[objective],
+            "metrics": best_metrics, "default": {"params": default, "metrics": default_metrics},
+            "rungs": rungs, "evaluations": evaluations, "cache_hits": hits,
+            "elapsed": time.perf_counter() - started}
@@ -0,0 +1,131 @@
+"""
+Random workload generation
+"""
+import random
+import time
+
+
+def generate_processes(n, arrival_range=(0.0, 10.0), burst_range=(1.0, 10.0), priority_range=(1, 5), seed=None):
+    """
+    Generate `n` processes with uniformly distributed parameters.
+
+    Arrival and burst times are rounded to two decimals. The same seed always
+    yields the same workload; without a seed the current time is used.
+
+    Args:
+        n (int): Number of processes.
+        arrival_range (tuple): (min, max) arrival time.
+        burst_range (tuple): (min, max) burst time.
+        priority_range (tuple): (min, max) integer priority, inclusive.
+        seed (int, optional): Random seed.
+
+    Returns:
+        dict: {pid: [arrival, burst, priority]} with pids "1".."n".
+    """
+    rng = random.Random(time.time() if seed is None else seed)
+    arr_min, arr_max = arrival_range
+    burst_min, burst_max = burst_range
+    pr_min, pr_max = priority_range
+    generated = {}
+    for i in range(1, n+1):
+        pid = str(i)
+        arrival = round(rng.uniform(arr_min, arr_max), 2)
+        burst = round(rng.uniform(burst_min, burst_max), 2)
+        prio = rng.randint(pr_min, pr_max)
+        generated[pid] = [arrival, burst, prio]
+    return generated
+
+
+def stream_processes(rate=1.0, burst_range=(1.0, 10.0), priority_range=(1, 5), seed=None, limit=None):
+    """
+    Endless arrival stream: Poisson arrivals with `rate` processes per time
+    unit and uniform bursts and priorities, rounded like generate_processes.
+
+    Args:
+        rate (float): Mean arrivals per time unit.
+        burst_range (tuple): (min, max) burst time.
+        priority_range (tuple): (min, max) integer priority, inclusive.
+        seed (int, optional): Random seed.
+        limit (int, optional): Stop after this many processes.
+
+    Yields:
+        tuple: (arrival, burst, priority) in arrival order.
+    """
+    rng = random.Random(time.time() if seed is None else seed)
+    burst_min, burst_max = burst_range
+    pr_min, pr_max = priority_range
+    t = 0.0
+    count = 0
+    while limit is None or count < limit:
+        t += rng.expovariate(rate)
+        yield round(t, 2), round(rng.uniform(burst_min, burst_max), 2), rng.randint(pr_min, pr_max)
+        count += 1
+
+
+def add_io_bursts(data, devices=("disk",), cycles=(1, 3), io_range=(1.0, 5.0), seed=None):
+    """
+    Give every process of a workload a CPU/I-O burst sequence (see
+    algorithms.bursts): its burst is split into 1 + k CPU bursts, with k
+    drawn from `cycles`, separated by I/O requests to random devices. The
+    total CPU time of each process is unchanged.
+
+    Args:
+        data (dict): {pid: [arrival, burst, priority]}.
+        devices (tuple): Device names to pick from.
+        cycles (tuple): (min, max) number of I/O requests per process, inclusive.
+        io_range (tuple): (min, max) I/O time.
+        seed (int, optional): Random seed.
+
+    Returns:
+        dict: {pid: [arrival, burst, priority, sequence]}; the input is not modified.
+    """
+    rng = random.Random(time.time() if seed is None else seed)
+    io_min, io_max = io_range
+    result = {}
+    for pid, values in data.items():
+        arrival, burst, prio = values[:3]
+        k = rng.randint(*cycles)
+        # k cut points in the burst; pieces shorter than a hundredth are not worth a request
+        cuts = sorted(round(rng.uniform(0, burst), 2) for _ in range(k))
+        bounds = [0.0] + [c for c in cuts if 0.01 <= c <= burst - 0.01] + [burst]
+        sequence = []
+        for a, b in zip(bounds, bounds[1:]):
+            if b - a < 0.01:
+                continue
+            if sequence:
+                sequence.append((rng.choice(devices), round(rng.uniform(io_min, io_max), 2)))
+            sequence.append(round(b - a, 2))
+        result[pid] = [arrival, sum(item for item in sequence if not isinstance(item, tuple)), prio, sequence]
+    return result
+
+
+def generate_tasks(n, utilization=0.7, periods=(10, 20, 25, 40, 50, 100), seed=None):
+    """
+    Generate a periodic task set (see algorithms.realtime) with total
+    utilization about `utilization`, split over the tasks with UUniFast.
+
+    Periods are drawn from `periods`; the default choices keep the
+    hyperperiod at 200. Deadlines are implicit (equal to the period) and
+    every task starts at 0.
+
+    Args:
+        n (int): Number of tasks.
+        utilization (float): Target total utilization.
+        periods (tuple): Periods to pick from.
+        seed (int, optional): Random seed.
+
+    Returns:
+        dict: {tid: [phase, wcet, period, deadline]} with tids "1".."n".
+    """
+    rng = random.Random(time.time() if seed is None else seed)
+    tasks = {}
+    left = utilization
+    for i in range(1, n+1):
+        if i < n:
+            share = left * (1 - rng.random() ** (1.0 / (n - i)))
+        else:
+            share = left
+        left -= share
+        period = rng.choice(periods)
+        tasks[str(i)] = [0.0, max(round(share * period, 2), 0.01), float(period), None]
+    return tasks